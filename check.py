@@ -72,7 +72,19 @@ import textwrap
 import pandas as pd
 from collections import Counter
 from zipfile import ZipFile
-from functools import wraps
+from functools import wraps, lru_cache
+
+COL_BATCH = 256  # check_file_content单次读取的列数
+
+
+@lru_cache(maxsize=1)
+def _v2():
+    """v2模块（读取实现，v1函数仅作适配），首次调用时导入，导入check时不加载check2及其日志配置"""
+    try:
+        from . import check2
+    except ImportError:
+        import check2
+    return check2
 
 
 # import json
@@ -237,6 +249,62 @@ def _wrap(err_msg: str, max_len: int = 40, head: str = " ", self_cut: bool = Tru
         return f"{head}\n{err_msg}" if len(err_msg) > max_len else err_msg
 
 
+def _iter_row_line(in_file, row_list):
+    """
+    单次读取文件，按row_list顺序生成(行号, 整行字符串)，结果同逐行调用get_row_line（行不存在时为None）
+    :param in_file: 字符串，读取对象
+    :param row_list: 正整数列表，行号
+    :return: 生成器
+    """
+    row_list = list(row_list)
+    if all(isinstance(i, int) for i in row_list) and row_list == sorted(row_list):  # 行号递增时流式读取
+        lines = _v2()._read_line(in_file)
+        cur = next(lines, None)
+        for row in row_list:
+            while cur is not None and cur[1] < row:
+                cur = next(lines, None)
+            yield row, cur[0] if cur is not None and cur[1] == row else None
+    else:
+        wanted = set(row_list)
+        picked = {line_no: line for line, line_no in _v2()._read_line(in_file) if line_no in wanted}
+        for row in row_list:
+            yield row, picked.get(row)
+
+
+def _iter_row2list(in_file, row_list, sep="\t", rm_blank=True, fill_null=False, null_list: list = None):
+    """
+    单次读取文件，按row_list顺序生成(行号, 元素列表)，结果同逐行调用get_row2list（行不存在时为None）
+    :return: 生成器
+    """
+    if isinstance(null_list, str):
+        null_list = [null_list, ]
+    if null_list is None:
+        null_list = ["", "NA", "N/A", "NULL"]
+    for row, line in _iter_row_line(in_file, row_list):
+        yield row, None if line is None else _v2()._split_row(line, sep, rm_blank, fill_null, null_list)
+
+
+def _iter_col2list(in_file, col_list, sep="\t", rm_blank=True, fill_null=True, null_list: list = None):
+    """
+    单次读取文件多列（每次COL_BATCH列），按col_list顺序生成(列号, 元素列表)，结果同逐列调用get_col2list
+    :return: 生成器
+    """
+    col_list = list(col_list)
+    for start in range(0, len(col_list), COL_BATCH):
+        batch = col_list[start:start + COL_BATCH]
+        col_lists = None
+        if all(isinstance(i, int) and i >= 1 for i in batch):
+            try:
+                col_lists = _v2()._cols2lists(in_file, sep, batch, rm_blank, fill_null, null_list)
+            except IndexError:
+                col_lists = None  # 存在缺少目标列的行等情况，逐列读取给出与原实现一致的结果
+        if col_lists is None:
+            col_lists = [get_col2list(in_file=in_file, col_no=col, sep=sep, rm_blank=rm_blank, fill_null=fill_null,
+                                      null_list=null_list, no_log=True) for col in batch]
+        for col, in_list in zip(batch, col_lists):
+            yield col, in_list
+
+
 @call_log
 def str_length(in_str: str, length: int = None, min_len: int = 1, max_len: int = 20, other_str="", add_info="",
                no_log=False):
@@ -863,13 +931,13 @@ def file_line_dup(in_file, add_info='', no_log=False):
     :return: 无重复返回0，有重复返回字符串报错信息
     """
     try:
-        res_list = []
-        err = []
-        for line, line_no in _read_line(in_file):
-            if line in res_list:
-                err.append(line_no)
-            else:
-                res_list.append(line)
+        if not os.path.isfile(in_file):
+            return 0  # 同原实现，无法读取时无重复行
+        ob_file = _v2().File(in_file, no_log=True)
+        msg = ob_file.line_dup()
+        err = ob_file.err_agg.positions("line_dup")
+        if msg and not err:
+            raise ValueError(msg)
         if err:
             in_file_name = os.path.basename(in_file)
             return f'{add_info}{in_file_name}发现重复行，行号：{_wrap(_join_str(err), self_len=160)}'
@@ -956,18 +1024,7 @@ def get_row2list(in_file, row_no=1, sep="\t",
             null_list = [null_list, ]
         if null_list is None:
             null_list = ["", "NA", "N/A", "NULL"]
-        line_list = []
-        for line, line_no in _read_line(in_file):
-            if line_no < row_no:
-                continue
-            elif line_no > row_no:
-                break
-            else:
-                if rm_blank:
-                    line_list = list(map(lambda x: x.strip(), line.split(sep)))
-                if fill_null:
-                    line_list = ["NA" if x in null_list else x for x in line_list]
-                return line_list
+        return _v2()._row2list(in_file, sep, row_no, rm_blank, fill_null, null_list)
     except Exception as e:
         print(e) if not no_log else 1
 
@@ -991,7 +1048,9 @@ def get_col2list(in_file, col_no=1, sep="\t",
             null_list = [null_list, ]
         if null_list is None:
             null_list = ["", "NA", "N/A", "NULL"]
-        col_elements = []
+        if col_no >= 1:
+            return _v2()._col2list(in_file, sep, col_no, rm_blank, fill_null, null_list)
+        col_elements = []  # 非正列号按列表下标自末尾取列
         for row, no in _read_line(in_file):
             row_list = row.split(sep)
             if rm_blank:
@@ -1660,8 +1719,7 @@ def check_file_content(in_file, out_dir, new_file=None, pre_check=True, rm_space
         row_number = get_row_num(in_file=in_file, no_log=no_log)
         col_number = get_col_num(in_file=in_file, sep=sep, no_log=no_log)
         if ck_sep:
-            for row in range(1, row_number + 1):
-                in_line = get_row_line(in_file=in_file, line_num=row, no_log=True)
+            for row, in_line in _iter_row_line(in_file, range(1, row_number + 1)):
                 err_msg = line_sep(in_line, sep_r=sep_r, no_log=True)
                 if err_msg:
                     error_list.append(f"{add_info}输入文件{in_file_name}第{row}行{_wrap(err_msg, self_cut=False)}")
@@ -1723,9 +1781,7 @@ def check_file_content(in_file, out_dir, new_file=None, pre_check=True, rm_space
                 ck_row_list = range(1, row_number + 1)
             if isinstance(ck_row_list, int):
                 ck_row_list = [ck_row_list, ]
-            for row in ck_row_list:
-                in_list = get_row2list(in_file=in_file, row_no=row, sep=sep, rm_blank=rm_blank,
-                                       fill_null=fill_null, null_list=null_list, no_log=True)
+            for row, in_list in _iter_row2list(in_file, ck_row_list, sep, rm_blank, fill_null, null_list):
                 if ck_row_length and row_length is not None:
                     err_msg = list_length(in_list=in_list, exp_len=row_length, no_log=True)
                     if err_msg:
@@ -1755,9 +1811,7 @@ def check_file_content(in_file, out_dir, new_file=None, pre_check=True, rm_space
                 ck_col_list = range(1, col_number + 1)
             if isinstance(ck_col_list, int):
                 ck_col_list = [ck_col_list, ]
-            for col in ck_col_list:
-                in_list = get_col2list(in_file=in_file, col_no=col, sep=sep, rm_blank=rm_blank,
-                                       fill_null=fill_null, null_list=null_list, no_log=True)
+            for col, in_list in _iter_col2list(in_file, ck_col_list, sep, rm_blank, fill_null, null_list):
                 if ck_col_length and col_length is not None:
                     err_msg = list_length(in_list=in_list, exp_len=col_length, no_log=True)
                     if err_msg:
@@ -1804,7 +1858,7 @@ def check_file_content(in_file, out_dir, new_file=None, pre_check=True, rm_space
                 err_msg = f"{add_info}输入文件{in_file_name}第{col_fix_no}列必须为{_wrap(allowed_title, self_cut=False)}，\n" \
                           f"实际该列为{in_title}，请检查"
                 error_list.append(err_msg)
-        row_flag = []
+        row_flag, row_const = [], {}  # 类型检查时同时记录标准化检查结果，避免重复读取
         if ck_row_type:
             if ck_row_type_list == -1:
                 ck_row_type_list = list(range(2, row_number + 1))
@@ -1812,9 +1866,9 @@ def check_file_content(in_file, out_dir, new_file=None, pre_check=True, rm_space
                 ck_row_type_list = list(range(1, row_number + 1))
             if isinstance(ck_row_type_list, int):
                 ck_row_type_list = [ck_row_type_list, ]
-            for row in ck_row_type_list:
-                in_list = get_row2list(in_file=in_file, row_no=row, sep=sep, rm_blank=rm_blank,
-                                       fill_null=fill_null, null_list=null_list, no_log=True)
+            for row, in_list in _iter_row2list(in_file, ck_row_type_list, sep, rm_blank, fill_null, null_list):
+                if ck_row_standard:
+                    row_const[row] = not list_factor(in_list=in_list, exp_num=1, rm_first=rm_first, no_log=True)
                 msg = list_type(in_list=in_list, exp_type=exp_type, rm_first=rm_first, no_log=True)
                 if isinstance(msg, str):
                     error_list.append(f"{add_info}输入文件{in_file_name}第{row}行{_wrap(msg, self_cut=False)}")
@@ -1829,7 +1883,7 @@ def check_file_content(in_file, out_dir, new_file=None, pre_check=True, rm_space
                         err_msg = list_num_ban(in_list=msg, ban_num=ban_num, no_log=True)
                         if err_msg:
                             error_list.append(f"{add_info}输入文件{in_file_name}第{row}行{_wrap(err_msg, self_cut=False)}")
-        col_flag = []
+        col_flag, col_const = [], {}
         if ck_col_type:
             if ck_col_type_list == -1:
                 ck_col_type_list = list(range(2, col_number + 1))
@@ -1837,9 +1891,9 @@ def check_file_content(in_file, out_dir, new_file=None, pre_check=True, rm_space
                 ck_col_type_list = list(range(1, col_number + 1))
             if isinstance(ck_col_type_list, int):
                 ck_col_type_list = [ck_col_type_list, ]
-            for col in ck_col_type_list:
-                in_list = get_col2list(in_file=in_file, col_no=col, sep=sep, rm_blank=rm_blank,
-                                       fill_null=fill_null, null_list=null_list, no_log=True)
+            for col, in_list in _iter_col2list(in_file, ck_col_type_list, sep, rm_blank, fill_null, null_list):
+                if ck_col_standard:
+                    col_const[col] = not list_factor(in_list=in_list, exp_num=1, rm_first=rm_first, no_log=True)
                 msg = list_type(in_list=in_list, exp_type=exp_type, rm_first=rm_first, no_log=True)
                 if isinstance(msg, str):
                     error_list.append(f"{add_info}输入文件{in_file_name}第{col}列{_wrap(msg, self_cut=False)}")
@@ -1863,10 +1917,7 @@ def check_file_content(in_file, out_dir, new_file=None, pre_check=True, rm_space
                 ck_standard_list = [ck_standard_list, ]
             if set(ck_standard_list).issubset(set(ck_row_type_list)):
                 for row in ck_standard_list:
-                    in_list = get_row2list(in_file=in_file, row_no=row, sep=sep, rm_blank=rm_blank,
-                                           fill_null=fill_null, null_list=null_list, no_log=True)
-                    msg = list_factor(in_list=in_list, exp_num=1, rm_first=rm_first, no_log=True)
-                    if not msg:
+                    if row_const[row]:
                         error_list.append(f"{add_info}输入文件{in_file_name}第{row}行数据完全一致，"
                                           f"标准差为0，不能按行进行标准化，请删除该行或尝试按列标准化")
         if col_flag and ck_col_standard:
@@ -1878,10 +1929,7 @@ def check_file_content(in_file, out_dir, new_file=None, pre_check=True, rm_space
                 ck_standard_list = [ck_standard_list, ]
             if set(ck_standard_list).issubset(set(ck_col_type_list)):
                 for col in ck_standard_list:
-                    in_list = get_col2list(in_file=in_file, col_no=col, sep=sep, rm_blank=rm_blank,
-                                           fill_null=fill_null, null_list=null_list, no_log=True)
-                    msg = list_factor(in_list=in_list, exp_num=1, rm_first=rm_first, no_log=True)
-                    if not msg:
+                    if col_const[col]:
                         error_list.append(f"{add_info}输入文件{in_file_name}第{col}列数据完全一致，"
                                           f"标准差为0，不能按列进行标准化，请删除该列或尝试按行标准化")
         if com_col_row_mum and row_greater is not None:
@@ -18,21 +18,40 @@ Maintenance records:
 # ---- ---- ---- ---- ---- #
 import sys
 import os
+import io
+import asyncio
+import tempfile
 import re
+import math
+import random
 import codecs
+import copy
+import gzip
+import json
+import hashlib
 import chardet
 import subprocess
 import shutil
 import textwrap
+import numpy as np
 import pandas as pd
 from collections import Counter
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor
 from zipfile import ZipFile
+from multiprocessing import shared_memory
+from multiprocessing import resource_tracker
 from functools import wraps
+from functools import partial
+from functools import lru_cache
+from contextlib import contextmanager
 import yaml
 import inspect
+import itertools
 import logging
 import platform
+from statistics import NormalDist
 from typing import Union
 from typing import List as Li
 
@@ -45,6 +64,33 @@ _num_list = Union[_num, Li[_num]]
 YAML = "language.yaml"
 LANG = "CN"  # default language, CN/EN
 NONE_LIST = ["", "NA", "N/A", "NULL"]
+ASYNC_WORKERS = 4  # AsyncFile默认共享线程池大小
+DECOMPRESS_THREADS = 4  # bgzip多线程解压线程数
+COMPRESS_SUFFIX = {"gzip": ".gz", "bgzip": ".gz", "zstd": ".zst"}
+CJK_PATTERN = re.compile('[\u4e00-\u9fa5]')  # 中文字符（Str.chinese检查范围）
+REGEX_CACHE_SIZE = 256  # 正则编译缓存条数
+SEP_ISSUES = ("head_sep", "sep_sep", "blank_sep", "sep_blank", "tail_blank")  # 分隔符问题类型，顺序同_line_sep_pats
+SIDECAR_SUFFIX = ".sidecar"  # 列式缓存目录后缀，与basicTools.R loadSidecar一致，仅供下游读取
+CHECKPOINT_SUFFIX = ".ckpt"  # 增量检查状态目录后缀
+CHECKPOINT_ANCHOR = 4096  # 增量检查续读前校验的已检查末尾字节数
+CHECKPOINT_BLOCK = 64 * 1024 * 1024  # 增量检查每次读取的字节数
+SAMPLE_BLOCKS = 64  # 抽样检查随机数据块个数
+SAMPLE_BLOCK_SIZE = 64 * 1024  # 抽样检查数据块字节数
+SKETCH_FP = 0.01  # 布隆过滤器预计假阳性率
+SKETCH_MAX_BITS = 1 << 30  # 布隆过滤器位数上限（128M）
+SKETCH_CHUNK = 1 << 18  # 固定内存检查每批元素个数
+HLL_P = 14  # HyperLogLog寄存器个数2^p，相对标准误约0.8%
+HLL_MARGIN = 6  # HyperLogLog判定通过所需的标准误倍数，不足时精确计数
+ROW_FLAG = {"length": 1, "dup": 2, "ban": 4, "na": 8, "type": 16, "num_range": 32, "num_ban": 64}  # 行分片检查结果位
+ROW_NUM = 128  # 行分片检查结果位，类型检查通过且为数值类型
+ROW_SKIP = 256  # 行分片检查结果位，空白行（跳过）
+ROW_STOP = 512  # 行分片检查结果位，空行（_read_line终止读取）
+ROW_CONST = 1024  # 行分片检查结果位，元素为常量（标准差为0），不能标准化
+INFER_BLOCK = 65536  # 列类型推断每批行数
+INFER_TYPES = ("int", "float", "bool", "str")  # 列类型推断候选类型，由窄到宽
+BOOL_STRS = {"True", "False", "TRUE", "FALSE", "true", "false"}  # 列类型推断识别的布尔值写法
+ROW_OPTIONS = [1, "1", "row", "行"]
+COL_OPTIONS = [2, "2", "col", "column", "列"]
 logging.basicConfig(format="%(asctime)s %(levelname)s %(message)s", level=logging.INFO)
 
 
@@ -65,21 +111,58 @@ def _name():
     return inspect.stack()[1][3]
 
 
-def _join_str(str_list, sep=","):
+def _join_str(str_list, sep=",", max_show: int = None, more=""):
     """
     将对象元素对象转化为字符串格式，并以特定分隔符连接
     :param str_list:列表、元组、集合，目标对象
     :param sep:字符串，分隔符，以第一个字符为准
+    :param max_show: 整数，最多连接的元素个数，None表示全部连接
+    :param more: 字符串，元素个数超出max_show时追加在结尾的说明信息
     :return: 正常返回元素连接后的长字符串
     """
-    new_list = list(map(lambda x: " {0}{1}{0}".format('"', str(x)), list(str_list)))
+    str_list = list(str_list)
+    cut = max_show is not None and len(str_list) > max_show
+    if cut:
+        str_list = str_list[:max_show]
+    new_list = list(map(lambda x: " {0}{1}{0}".format('"', str(x)), str_list))
     if len(str(sep)) > 1:
         sep = sep[0]
     # joined_str = "[{0} ]".format(sep.join(new_list)) # 字符串结果前后加[]
     joined_str = sep.join(new_list)
+    if cut:
+        joined_str += f"{sep} ...{more}"
     return joined_str
 
 
+def _ordered_diff(list1, list2):
+    """
+    严格顺序比较两个列表共同长度内的元素（向量化逐位比较）
+    :param list1: 列表，比较对象1
+    :param list2: 列表，比较对象2
+    :return: list1中与list2对应位置元素不同的元素列表
+    """
+    n = min(len(list1), len(list2))
+    arr1 = np.fromiter(itertools.islice(list1, n), dtype=object, count=n)
+    arr2 = np.fromiter(itertools.islice(list2, n), dtype=object, count=n)
+    return arr1[arr1 != arr2].tolist()
+
+
+def _index_diff(list1, list2, index1: dict = None):
+    """
+    基于哈希索引比较两个列表的互斥元素，结果保持元素首次出现顺序
+    :param list1: 可迭代对象，比较对象1
+    :param list2: 可迭代对象，比较对象2，仅遍历一次
+    :param index1: 字典，list1预先构建的索引（dict.fromkeys），None表示由list1构建
+    :return: (list1独有元素列表, list2独有元素列表)
+    """
+    if index1 is None:
+        index1 = dict.fromkeys(list1)
+    index2 = dict.fromkeys(list2)
+    diff1 = [x for x in index1 if x not in index2]
+    diff2 = [x for x in index2 if x not in index1]
+    return diff1, diff2
+
+
 def _wrap(err_msg: str, max_len: int = 40, head: str = " ", self_cut: bool = True, self_len=100):
     """
     预处理报错文本，根据文本长度确定是否换行
@@ -143,7 +226,7 @@ def _get_encoding(in_file, confidence: float = 0.6, line=3000):
     :return: 正常返回推测的文件编码格式（大写）
     """
     code_format = ""
-    with open(in_file, "rb") as fileIN:
+    with _open_bin(in_file) as fileIN:
         test_data = fileIN.read(line)
         format_res = chardet.detect(test_data)
         if format_res["confidence"] > confidence:
@@ -162,7 +245,11 @@ def _get_encoding2(in_file):
     :return: 正常返回检测的文件编码格式（大写）
     """
     if platform.system() == "Linux":
-        code_format = os.popen(f"file --mime-encoding {in_file}").read().rstrip('\n').split(':')[1].upper()
+        cat_cmd = _cat_cmd(in_file)
+        if cat_cmd:
+            code_format = os.popen(f"{cat_cmd} | file --mime-encoding -").read().rstrip('\n').split(':')[1].upper()
+        else:
+            code_format = os.popen(f"file --mime-encoding {in_file}").read().rstrip('\n').split(':')[1].upper()
     elif platform.system() == "Windows":
         logging.warning("Test in linux env, or the chardet method will be forced to infer the file format instead!")
         code_format = _get_encoding(in_file)
@@ -172,6 +259,98 @@ def _get_encoding2(in_file):
     return code_format
 
 
+def _compress_type(in_file):
+    """
+    根据文件头（magic bytes）识别压缩格式
+    :param in_file: 字符串，文件名
+    :return: "gzip"/"bgzip"/"zstd"，非压缩文件或无法读取返回None
+    """
+    try:
+        with open(in_file, "rb") as fileIN:
+            head = fileIN.read(18)
+    except OSError:
+        return None
+    if head[:2] == b"\x1f\x8b":
+        if len(head) >= 18 and head[3] & 4 and head[12:14] == b"BC":  # FEXTRA含BC子字段，即BGZF块
+            return "bgzip"
+        return "gzip"
+    if head[:4] == b"\x28\xb5\x2f\xfd":
+        return "zstd"
+    return None
+
+
+def _cat_cmd(in_file):
+    """
+    压缩文件解压至标准输出的shell命令，供awk/file等linux命令通过管道使用
+    :param in_file: 字符串，文件名
+    :return: 压缩文件返回命令字符串，非压缩文件返回None
+    """
+    kind = _compress_type(in_file)
+    if kind == "bgzip" and shutil.which("bgzip"):
+        return f"bgzip -dc -@ {DECOMPRESS_THREADS} '{in_file}'"
+    elif kind in ("gzip", "bgzip"):
+        return f"gzip -dc '{in_file}'"
+    elif kind == "zstd":
+        return f"zstd -dcq '{in_file}'"
+    return None
+
+
+@contextmanager
+def _open_bin(in_file):
+    """
+    以二进制流打开文件，压缩文件（gzip/bgzip/zstd）流式解压，bgzip优先使用多线程bgzip命令
+    :param in_file: 字符串，文件名
+    :return: 上下文管理器，二进制可读流
+    """
+    kind = _compress_type(in_file)
+    cmd = None
+    if kind == "bgzip" and shutil.which("bgzip"):
+        cmd = ["bgzip", "-dc", "-@", str(DECOMPRESS_THREADS), in_file]
+    elif kind == "zstd":
+        try:
+            import zstandard
+        except ImportError:
+            cmd = ["zstd", "-dcq", in_file]
+        else:
+            with open(in_file, "rb") as raw, \
+                    io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(raw)) as fileIN:  # 支持readline及逐行迭代
+                yield fileIN
+            return
+    if cmd is not None:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        try:
+            yield proc.stdout
+        finally:
+            proc.stdout.close()
+            proc.kill() if proc.poll() is None else 1
+            proc.wait()
+    elif kind in ("gzip", "bgzip"):
+        with gzip.open(in_file, "rb") as fileIN:
+            yield fileIN
+    else:
+        with open(in_file, "rb") as fileIN:
+            yield fileIN
+
+
+def _strip_compress_suffix(name):
+    """去除文件名结尾的压缩后缀（.gz/.bgz/.zst/.zstd）"""
+    return re.sub(r"\.(gz|bgz|zst|zstd)$", "", name, flags=re.I)
+
+
+def _file_md5(in_file, block_size=1048576):
+    """文件内容md5（按块读取），作为列式缓存键，与R tools::md5sum一致"""
+    md5 = hashlib.md5()
+    with open(in_file, "rb") as fileIN:
+        for block in iter(lambda: fileIN.read(block_size), b""):
+            md5.update(block)
+    return md5.hexdigest()
+
+
+def _hash64(values: list):
+    """字符串列表的64位哈希（pandas固定密钥siphash，跨进程一致），作为增量检查的已见元素集合，碰撞概率可忽略"""
+    return pd.util.hash_array(np.asarray(values, dtype=object), categorize=False)
+
+
 def _read_file(in_file, in_code, block_size=102400):
     """
     一定区块大小按照指定格式构建指定文件生成器
@@ -182,7 +361,8 @@ def _read_file(in_file, in_code, block_size=102400):
     """
     in_code = in_code.upper()
     try:
-        with codecs.open(in_file, "r", in_code) as fileIN:
+        with _open_bin(in_file) as fileBIN:
+            fileIN = codecs.getreader(in_code)(fileBIN)
             while True:
                 content_block = fileIN.read(block_size)
                 if content_block:
@@ -195,15 +375,15 @@ def _read_file(in_file, in_code, block_size=102400):
 
 def _read_line(in_file, rm_br=True):
     """
-    按行读取文件
+    按行读取文件（压缩文件流式解压）
     :param in_file: 字符串，读取对象
     :param rm_br: 布尔值，是否删除行右侧换行符，默认True
     :return: 正常返回生成器（行，行号），异常返回报错信息
     """
     try:
         line_no = 0
-        with codecs.open(in_file, "r", encoding='UTF-8') as fileIN:
-            for line in fileIN:
+        with _open_bin(in_file) as fileBIN:
+            for line in codecs.getreader('UTF-8')(fileBIN):
                 line_no += 1
                 if rm_br:
                     line = line.rstrip('\r\n')  # Windows
@@ -224,18 +404,23 @@ def _row2list(file, sep="\t", row_no=1, rm_blank=True, fill_null=False, null_lis
         null_list = [null_list, ]
     if null_list is None:
         null_list = list(NONE_LIST)
-    line_list = []
     for line, line_no in _read_line(file):
         if line_no < row_no:
             continue
         elif line_no > row_no:
             break
         else:
-            if rm_blank:
-                line_list = list(map(lambda x: x.strip(), line.split(sep)))
-            if fill_null:
-                line_list = ["NA" if x in null_list else x for x in line_list]
-            return line_list
+            return _split_row(line, sep, rm_blank, fill_null, null_list)
+
+
+def _split_row(line, sep="\t", rm_blank=True, fill_null=False, null_list=None):
+    """行字符串切分为元素列表，规则同_row2list"""
+    line_list = []
+    if rm_blank:
+        line_list = list(map(lambda x: x.strip(), line.split(sep)))
+    if fill_null:
+        line_list = ["NA" if x in null_list else x for x in line_list]
+    return line_list
 
 
 def _col2list(file, sep="\t", col_no=1, rm_blank=True, fill_null=True, null_list: list = None):
@@ -243,18 +428,540 @@ def _col2list(file, sep="\t", col_no=1, rm_blank=True, fill_null=True, null_list
         null_list = [null_list, ]
     if null_list is None:
         null_list = list(NONE_LIST)
+    null_set = set(null_list)
     col_elements = []
     for row, no in _read_line(file):
-        row_list = row.split(sep)
+        col_element = row.split(sep, col_no)[col_no - 1]  # 仅切分至目标列
         if rm_blank:
-            row_list = list(map(lambda x: x.strip(), row_list))
-        if fill_null:
-            row_list = ["NA" if x in null_list else x for x in row_list]
-        col_element = row_list[col_no - 1]
+            col_element = col_element.strip()
+        if fill_null and col_element in null_set:
+            col_element = "NA"
         col_elements.append(col_element)
     return col_elements
 
 
+def _line2list(file, sep="\t", dim="row", line_no=1, rm_blank=True, fill_null=False, null_list: list = None):
+    """按维度读取文件指定一行/列的元素列表，dim可选ROW_OPTIONS/COL_OPTIONS"""
+    if dim in ROW_OPTIONS:
+        return _row2list(file, sep, line_no, rm_blank, fill_null, null_list)
+    return _col2list(file, sep, line_no, rm_blank, fill_null, null_list)
+
+
+def _cols2lists(file, sep="\t", col_nos: list = None, rm_blank=True, fill_null=True, null_list: list = None):
+    """
+    单次读取文件，获取多列元素列表
+    :param col_nos: 正整数列表，目标列号，None元素表示该列不存在（对应结果为None）
+    :return: 与col_nos顺序一致的元素列表的列表
+    """
+    if isinstance(null_list, str):
+        null_list = [null_list, ]
+    if null_list is None:
+        null_list = list(NONE_LIST)
+    null_set = set(null_list)
+    picks = [(i, col_no - 1) for i, col_no in enumerate(col_nos) if col_no is not None]
+    cols = [[] if col_no is not None else None for col_no in col_nos]
+    if not picks:
+        return cols
+    max_no = max(col_no for col_no in col_nos if col_no is not None)
+    for row, no in _read_line(file):
+        row_list = row.split(sep, max_no)
+        for i, idx in picks:
+            col_element = row_list[idx]
+            if rm_blank:
+                col_element = col_element.strip()
+            if fill_null and col_element in null_set:
+                col_element = "NA"
+            cols[i].append(col_element)
+    return cols
+
+
+def _infer_col(col: dict, vals: list, nos: list, null_set: set):
+    """
+    以一批元素更新单列类型推断状态（见File.infer_types），数值转换规则同List.type
+    :param col: 字典，列推断状态
+    :param vals: 列表，该列一批元素（字符串）
+    :param nos: 列表，各元素所在行号
+    """
+    if not vals:
+        return
+    na = [x in null_set for x in vals]
+    col["n"] += len(vals)
+    col["na"] += sum(na)
+    if col["first"] is None:
+        col["first"] = vals[0]
+    if not col["varies"]:
+        col["varies"] = any(x != col["first"] for x in vals)
+    if col["miss"]["bool"] is None:
+        for x, no, is_na in zip(vals, nos, na):
+            if not is_na and x not in BOOL_STRS:
+                col["miss"]["bool"] = (no, x)
+                break
+    arr = np.asarray(vals, dtype=object)
+    for key, conv, dtype in (("int", int, np.int64), ("float", float, np.float64)):
+        if col["bad"][key] is not None and col["miss"][key] is not None:
+            continue
+        try:
+            nums = arr.astype(dtype)
+        except (ValueError, OverflowError):  # 含无法转换元素时逐元素定位首个反例
+            nums = None
+            for x, no, is_na in zip(vals, nos, na):
+                try:
+                    conv(x)
+                except ValueError:
+                    col["bad"][key] = col["bad"][key] or (no, x)
+                    if not is_na:
+                        col["miss"][key] = col["miss"][key] or (no, x)
+                        break
+        if key == "float" and nums is not None and col["bad"]["float"] is None:
+            nan = np.isnan(nums)
+            col["nan"] += int(nan.sum())
+            finite = nums[~nan]
+            if finite.size:
+                col["min"] = float(finite.min()) if col["min"] is None else min(col["min"], float(finite.min()))
+                col["max"] = float(finite.max()) if col["max"] is None else max(col["max"], float(finite.max()))
+
+
+def _map_jobs(func, jobs: list, pool: ProcessPoolExecutor = None):
+    """
+    按顺序执行func(*job)，提供进程池时提交进程池，结果顺序始终与jobs一致；各job参数（如整列元素列表）均序列化后传至子进程
+    :param func: 模块级函数（要求可序列化）
+    :param jobs: 参数元组列表
+    :param pool: 进程池，由调用方创建并复用，None表示串行
+    :return: 结果列表
+    """
+    if pool is None or len(jobs) <= 1:
+        return [func(*job) for job in jobs]
+    return list(pool.map(func, *zip(*jobs)))
+
+
+@lru_cache(maxsize=REGEX_CACHE_SIZE)
+def _re(pattern: str, flags=0):
+    """正则编译（模块级LRU缓存，按正则及flags复用），供Str/List.format、File.line_sep等调用"""
+    return re.compile(pattern, flags)
+
+
+@lru_cache(maxsize=REGEX_CACHE_SIZE)
+def _line_sep_pats(sep_r):
+    """
+    分隔符规范检查正则（开头分隔符、连用分隔符、分隔符前空白、分隔符后空白、结尾空白）
+    :return: (合并后的单次扫描正则, 各项正则元组)
+    """
+    pats = (f"^[{sep_r}]", f"{sep_r}{sep_r}", rf"\s{sep_r}", rf"{sep_r}\s", r"\s$")
+    return _re("|".join(f"(?:{i})" for i in pats)), tuple(_re(i) for i in pats)
+
+
+def _cjk_scan(strings, repl: str = None):
+    """
+    中文字符单次扫描，同时完成检测及（可选）替换
+    :param strings: 字符串序列
+    :param repl: 字符串，将中文字符替换为该字符，None表示不替换
+    :return: (布尔掩码numpy数组, 有序字典{序号: 中文字符列表}（仅含中文的元素）, 替换后字符串列表（repl为None时为None）)
+    """
+    strings = [str(x) for x in strings]
+    mask = np.zeros(len(strings), dtype=bool)
+    hits = OrderedDict()
+    replaced = [] if repl is not None else None
+    search = CJK_PATTERN.search
+    for i, x in enumerate(strings):
+        if search(x):
+            mask[i] = True
+            hits[i] = CJK_PATTERN.findall(x)
+            replaced.append(CJK_PATTERN.sub(repl, x)) if repl is not None else 1
+        elif repl is not None:
+            replaced.append(x)
+    return mask, hits, replaced
+
+
+def _first_dups(in_list, limit: int):
+    """按出现顺序收集重复元素（每个元素仅记录一次），收集到limit个即停止扫描"""
+    seen, dup_item = set(), {}
+    for i in in_list:
+        if i in seen:
+            if i not in dup_item:
+                dup_item[i] = None
+                if len(dup_item) >= limit:
+                    break
+        else:
+            seen.add(i)
+    return list(dup_item)
+
+
+def _first_hits(in_list, target: set, limit: int):
+    """按出现顺序收集属于target的元素（去重），收集到limit个即停止扫描"""
+    hit_item = {}
+    for i in in_list:
+        if i in target and i not in hit_item:
+            hit_item[i] = None
+            if len(hit_item) >= limit:
+                break
+    return list(hit_item)
+
+
+class _BloomFilter(object):
+    """blocked bloom filter over 64-bit hashes"""
+    __slots__ = ("m", "k", "words")
+
+    def __init__(self, n: int, fp: float = SKETCH_FP, max_bits: int = SKETCH_MAX_BITS):
+        """
+        分块布隆过滤器（每个元素的k个位落在同一64位字内，单次读写），内存至多max_bits位
+        :param n: 整数，预计元素个数
+        :param fp: 浮点数，预计假阳性率，默认SKETCH_FP
+        """
+        self.m = int(min(max(-n * math.log(fp) / math.log(2) ** 2, 64), max_bits)) // 64 * 64
+        self.k = min(max(1, round(self.m / max(n, 1) * math.log(2))), 10)
+        self.words = np.zeros(self.m // 64, dtype=np.uint64)
+
+    def add_many(self, hashes):
+        """
+        依次加入一批哈希，返回各元素此前是否可能已出现（含本批内更早出现），无假阴性
+        :param hashes: numpy数组，uint64哈希
+        :return: numpy布尔数组
+        """
+        word = (hashes % np.uint64(len(self.words))).astype(np.int64)
+        mix = (hashes >> np.uint64(32)) ^ (hashes * np.uint64(0x9E3779B97F4A7C15))  # 溢出截断即取模
+        mask = np.zeros(len(hashes), dtype=np.uint64)
+        for i in range(self.k):
+            mask |= np.uint64(1) << ((mix >> np.uint64(6 * i)) & np.uint64(63))
+        seen = (self.words[word] & mask) == mask
+        first = np.zeros(len(hashes), dtype=bool)
+        first[np.unique(hashes, return_index=True)[1]] = True
+        np.bitwise_or.at(self.words, word, mask)
+        return seen | ~first
+
+
+class _HyperLogLog(object):
+    """hyperloglog over 64-bit hashes"""
+    __slots__ = ("p", "reg")
+
+    def __init__(self, p: int = HLL_P):
+        """HyperLogLog基数估计，2^p个寄存器，相对标准误约1.04/sqrt(2^p)"""
+        self.p = p
+        self.reg = np.zeros(1 << p, dtype=np.uint8)
+
+    def add_many(self, hashes):
+        rest_bits = 64 - self.p
+        rest = hashes & np.uint64((1 << rest_bits) - 1)
+        bit_len, x = np.zeros(len(hashes), dtype=np.int64), rest.copy()
+        for s in (32, 16, 8, 4, 2, 1):  # 逐段二分求有效位数
+            hit = x >= np.uint64(1 << s)
+            bit_len[hit] += s
+            x[hit] >>= np.uint64(s)
+        bit_len += (x > 0)
+        np.maximum.at(self.reg, (hashes >> np.uint64(rest_bits)).astype(np.int64),
+                      (rest_bits - bit_len + 1).astype(np.uint8))
+
+    def count(self):
+        m = len(self.reg)
+        est = 0.7213 / (1 + 1.079 / m) * m * m / np.sum(np.ldexp(1.0, -self.reg.astype(np.int64)))
+        zeros = int(np.count_nonzero(self.reg == 0))
+        if est <= 2.5 * m and zeros:  # 小基数线性计数修正
+            est = m * math.log(m / zeros)
+        return float(est)
+
+    def error(self):
+        return 1.04 / math.sqrt(len(self.reg))
+
+
+def _iter_hash_chunks(in_list, chunk: int = SKETCH_CHUNK, strip=True):
+    """按块生成(字符串元素, 64位哈希)，strip为True时去除元素前后空白，同List.dup"""
+    for i in range(0, len(in_list), chunk):
+        keys = [str(x).strip() if strip else str(x) for x in in_list[i:i + chunk]]
+        yield keys, _hash64(keys)
+
+
+def _sketch_dups(in_list, limit: int = None):
+    """
+    固定内存的重复元素检查：布隆过滤器筛选候选元素，再次遍历仅对候选元素精确计数确认，结果同List.dup
+    :param limit: 正整数，同_first_dups收集到limit个即停止，None表示全部收集（按首次出现顺序，同Counter）
+    :return: (重复元素列表, 重复元素总数)
+    """
+    bloom, cand = _BloomFilter(len(in_list)), []
+    for keys, hashes in _iter_hash_chunks(in_list):
+        cand.append(np.unique(hashes[bloom.add_many(hashes)]))
+    cand = np.unique(np.concatenate(cand)) if cand else np.empty(0, dtype=np.uint64)
+    seen, dup_item = {}, {}
+    for keys, hashes in _iter_hash_chunks(in_list):
+        for j in np.flatnonzero(np.isin(hashes, cand)):
+            key = keys[j]
+            if limit is None:
+                seen[key] = seen.get(key, 0) + 1
+            elif key in seen:
+                if key not in dup_item:
+                    dup_item[key] = None
+                    if len(dup_item) >= limit:
+                        return list(dup_item), len(dup_item)
+            else:
+                seen[key] = 1
+    if limit is None:
+        dup_item = [key for key, value in seen.items() if value > 1]
+    return list(dup_item), len(dup_item)
+
+
+def _wilson(fail: int, n: int, z: float = 1.96):
+    """二项比例Wilson置信区间，n为0时返回(0, 1)"""
+    if not n:
+        return 0.0, 1.0
+    p = fail / n
+    denom = 1 + z * z / n
+    center = (p + z * z / (2 * n)) / denom
+    half = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denom
+    return max(center - half, 0.0), min(center + half, 1.0)
+
+
+def _cluster_wilson(pairs, z: float = 1.96):
+    """
+    整群抽样比例的置信区间：各数据块为一群（块内行相邻，并非独立抽取），按比率估计的群间方差计算设计效应，
+    以有效样本量n/deff代入Wilson区间，有效群少于2个或比例为0/1时设计效应取1，即逐行区间
+    :param pairs: [(不合格数, 检查数), ...]，各数据块统计
+    :return: (下限, 上限, 设计效应)
+    """
+    pairs = [(fail, n) for fail, n in pairs if n]
+    fail, n = sum(i[0] for i in pairs), sum(i[1] for i in pairs)
+    if not n:
+        return 0.0, 1.0, 1.0
+    p, k, deff = fail / n, len(pairs), 1.0
+    if k > 1 and 0 < p < 1:
+        var = k / (k - 1) * sum((f - p * m) ** 2 for f, m in pairs) / (n * n)
+        deff = max(var / (p * (1 - p) / n), 1.0)  # 群内正相关时方差膨胀，不低于独立抽样
+    low, high = _wilson(p * n / deff, n / deff, z)
+    return low, high, deff
+
+
+def _split_lines(data: bytes, size: int):
+    """将连续读取的字节按行对齐切分为约size字节的数据块（单行超过size时整行成块）"""
+    chunks, pos = [], 0
+    while pos < len(data):
+        end = data.rfind(b"\n", pos, pos + size) + 1
+        if end <= pos:
+            end = data.find(b"\n", pos + size) + 1 or len(data)
+        chunks.append(data[pos:end])
+        pos = end
+    return chunks
+
+
+class _BudgetReached(Exception):
+    """check_content报错数达到上限"""
+
+
+class _ErrorBudget(list):
+    """报错信息列表，条数达到上限时截断并抛出_BudgetReached，用于check_content各阶段提前结束"""
+
+    def __init__(self, max_errors: int = None):
+        super().__init__()
+        self.max_errors = max_errors
+
+    def _check(self):
+        if self.max_errors is not None and len(self) >= self.max_errors:
+            del self[self.max_errors:]
+            raise _BudgetReached()
+
+    def append(self, item):
+        super().append(item)
+        self._check()
+
+    def extend(self, items):
+        super().extend(items)
+        self._check()
+
+
+class ErrorAgg(object):
+    """bounded error aggregation"""
+    __slots__ = ("max_keep", "_stat")
+
+    def __init__(self, max_keep: int = None):
+        """
+        报错聚合，各检查记录准确报错总数及前max_keep个报错位置/元素，内存及格式化开销与max_keep同阶
+        :param max_keep: 正整数，各检查保留的报错位置/元素个数，None表示全部保留，默认None
+        """
+        self.max_keep = max_keep
+        self._stat = OrderedDict()  # {检查: [总数, 保留个数上限, [(位置, 元素), ...], 总数是否准确]}
+
+    def reset(self, check: str, max_keep: int = None):
+        """清空指定检查的记录，max_keep为None时沿用默认值"""
+        self._stat[check] = [0, self.max_keep if max_keep is None else max_keep, [], True]
+
+    def add_many(self, check: str, pos=None, values=None, count: int = None, exact=True):
+        """
+        追加一批报错，仅保留至上限，pos与values至少提供一个
+        :param pos: 可迭代对象，报错位置，None表示不记录位置
+        :param values: 可迭代对象，报错元素，None表示不记录元素
+        :param count: 整数，本批报错总数，None表示按实际迭代个数计
+        :param exact: 布尔值，count是否为准确总数，提前停止扫描时为False，即总数为下限，默认True
+        """
+        if check not in self._stat:
+            self.reset(check)
+        stat = self._stat[check]
+        room = None if stat[1] is None else max(stat[1] - len(stat[2]), 0)
+        pos_iter = itertools.repeat(None) if pos is None else iter(pos)
+        val_iter = itertools.repeat(None) if values is None else iter(values)
+        pairs = list(itertools.islice(zip(pos_iter, val_iter), room))
+        stat[2].extend(pairs)
+        if count is None:  # 未给出总数时，输入须为序列
+            count = len(pos if pos is not None else values)
+        stat[0] += count
+        stat[3] = stat[3] and exact
+
+    def count(self, check: str):
+        return self._stat[check][0] if check in self._stat else 0
+
+    def exact(self, check: str):
+        """报错总数是否准确，False表示扫描提前停止，count仅为下限"""
+        return self._stat[check][3] if check in self._stat else True
+
+    def positions(self, check: str):
+        return [i[0] for i in self._stat[check][2]] if check in self._stat else []
+
+    def values(self, check: str):
+        return [i[1] for i in self._stat[check][2]] if check in self._stat else []
+
+    def summary(self):
+        """
+        各检查报错汇总
+        :return: 有序字典{检查: {"count": 总数, "exact": 总数是否准确, "first": [(位置, 元素), ...]}}，仅含有报错的检查
+        """
+        return OrderedDict((k, {"count": v[0], "exact": v[3], "first": list(v[2])})
+                           for k, v in self._stat.items() if v[0])
+
+
+def _list_base_msgs(in_list, lang=LANG, opts: dict = None):
+    """
+    行/列基础检查（长度、重复、禁用、缺失），供check_content串行/并行调用
+    :param in_list: 列表，检查对象
+    :param lang: 字符串，报错语言
+    :param opts: 字典，检查参数，键同check_content对应参数去掉row_/col_前缀
+    :return: [(检查类型, 报错信息), ...]
+    """
+    tagged = []
+    ob_list = List(in_list=in_list, no_log=True, lang=lang, max_errors=opts.get("max_errors"),
+                   max_show=opts.get("max_show"), sketch=opts.get("sketch", False))
+    if opts["ck_length"] and opts["length"] is not None:
+        err_msg = ob_list.length(exp_len=opts["length"])
+        if err_msg:
+            tagged.append(("length", err_msg))
+    elif not opts["ck_length"] and opts["ck_length_range"]:
+        err_msg = ob_list.range(min_len=opts["min_len"], max_len=opts["max_len"])
+        if err_msg:
+            tagged.append(("length", err_msg))
+    if opts["ck_dup"]:
+        err_msg = ob_list.dup()
+        if err_msg:
+            tagged.append(("dup", err_msg))
+    if opts["ck_ban"] and opts["ban_list"] is not None:
+        err_msg = ob_list.ban(ban_list=opts["ban_list"])
+        if err_msg:
+            tagged.append(("ban", err_msg))
+    if opts["ck_na"]:
+        err_msg = ob_list.na(na_list=opts["na_list"])
+        if err_msg:
+            tagged.append(("na", err_msg))
+    return tagged
+
+
+def _num_const(nums):
+    """
+    数值序列是否为常量（忽略nan后最小值等于最大值，即标准差为0），供行/列标准化检查
+    :param nums: 列表/numpy数组，数值序列
+    :return: 布尔值，无有效数值时返回False
+    """
+    if isinstance(nums, np.ndarray):
+        nums = nums[~np.isnan(nums)]
+        return bool(nums.size) and bool(nums.min() == nums.max())
+    finite = [x for x in nums if x == x]
+    return bool(finite) and min(finite) == max(finite)
+
+
+def _list_type_msgs(in_list, lang=LANG, opts: dict = None):
+    """
+    行/列元素类型检查（类型、数值范围、数值禁用），同时得出能否标准化，供check_content串行/并行调用
+    :param in_list: 列表，检查对象
+    :param lang: 字符串，报错语言
+    :param opts: 字典，检查参数，键同check_content对应参数去掉row_/col_前缀
+    :return: ([(检查类型, 报错信息), ...], 是否为数值类型, 是否为常量)，类型检查未通过时按元素字符串判断是否为常量
+    """
+    msg = List(in_list=in_list, rm_first=opts["rm_first"], no_log=True, lang=lang).type(exp_type=opts["exp_type"])
+    if isinstance(msg, str):
+        return [("type", msg), ], False, len(set(in_list[1:] if opts["rm_first"] else in_list)) == 1
+    tagged = []
+    ob_list = List(in_list=msg, no_log=True, lang=lang, max_errors=opts.get("max_errors"),
+                   max_show=opts.get("max_show"))
+    if opts["ck_num_range"]:
+        err_msg = ob_list.num_range(min_num=opts["min_num"], max_num=opts["max_num"])
+        if err_msg:
+            tagged.append(("num_range", err_msg))
+    if opts["ck_num_ban"] and opts["ban_num"] is not None:
+        err_msg = ob_list.num_ban(ban_num=opts["ban_num"])
+        if err_msg:
+            tagged.append(("num_ban", err_msg))
+    return tagged, opts["exp_type"] in ['float', 'int'], _num_const(msg)
+
+
+def _array_type_msgs(values, nums, ok, lang=LANG, opts: dict = None):
+    """
+    行/列元素类型检查（数组版本，元素已整体转换为数值），结果同_list_type_msgs
+    :param values: numpy数组，元素（字符串）
+    :param nums: numpy数组，转换后的数值（float64）
+    :param ok: numpy布尔数组，各元素能否转换为期望类型
+    :return: ([(检查类型, 报错信息), ...], 是否为数值类型, 是否为常量)
+    """
+    if not ok.all():  # 同List.type，仅报首个转换失败元素
+        bad = values[int(np.argmin(ok))]
+        return [("type", List(in_list=[bad, ], no_log=True, lang=lang).type(exp_type=opts["exp_type"])), ], False, \
+            bool((values == values[0]).all())
+    tagged = []
+    ob_list = ArrayList(nums, no_log=True, lang=lang, max_errors=opts.get("max_errors"), max_show=opts.get("max_show"))
+    if opts["ck_num_range"]:
+        err_msg = ob_list.num_range(min_num=opts["min_num"], max_num=opts["max_num"])
+        if err_msg:
+            tagged.append(("num_range", err_msg))
+    if opts["ck_num_ban"] and opts["ban_num"] is not None:
+        err_msg = ob_list.num_ban(ban_num=opts["ban_num"])
+        if err_msg:
+            tagged.append(("num_ban", err_msg))
+    return tagged, opts["exp_type"] in ['float', 'int'], _num_const(nums)
+
+
+def _row_shard_job(file, start, end, sep="\t", rm_blank=True, fill_null=False, null_list: list = None,
+                   lang=LANG, base_opts: dict = None, type_opts: dict = None):
+    """
+    检查文件字节区间[start, end)内的各行（区间须对齐行边界），结果位写入新建共享内存，供check_content多进程调用
+    :param base_opts: 字典，行基础检查参数，同_list_base_msgs，None表示不检查
+    :param type_opts: 字典，行类型检查参数，同_list_type_msgs，None表示不检查
+    :return: (共享内存名称, 区间行数)，共享内存内容为各行uint16结果位（ROW_FLAG/ROW_NUM/ROW_CONST/ROW_SKIP/ROW_STOP）
+    """
+    with open(file, "rb") as fileIN:
+        fileIN.seek(start)
+        lines = fileIN.read(end - start).decode("utf-8").splitlines()  # 换行规则同codecs逐行读取
+    null_set = set(NONE_LIST if null_list is None else null_list)
+    shm = shared_memory.SharedMemory(create=True, size=max(1, len(lines) * 2))
+    try:
+        flags = np.ndarray((len(lines),), dtype=np.uint16, buffer=shm.buf)
+        for i, line in enumerate(lines):
+            if line.isspace():
+                flags[i] = ROW_SKIP
+                continue
+            elif not line:
+                flags[i] = ROW_STOP
+                continue
+            in_list = _split_row(line, sep, rm_blank, fill_null, null_set)
+            flag = 0
+            if base_opts is not None:
+                for tag, _ in _list_base_msgs(in_list, lang, base_opts):
+                    flag |= ROW_FLAG[tag]
+            if type_opts is not None:
+                tagged, is_num, const = _list_type_msgs(in_list, lang, type_opts)
+                for tag, _ in tagged:
+                    flag |= ROW_FLAG[tag]
+                if is_num:
+                    flag |= ROW_NUM
+                if const:
+                    flag |= ROW_CONST
+            flags[i] = flag
+        del flags
+    finally:
+        shm.close()
+    return shm.name, len(lines)
+
+
 def _path_pre_proc(path: str):
     """
     路径预处理，删除前后空白，及结尾路径符号
@@ -348,13 +1055,13 @@ class Str(object):
         try:
             s_str = self.other_str if self.other_str else self.in_str
             if re_obj is None:
-                re_obj = re.compile(r"^[A-Za-z1-9][A-Za-z0-9-.]*$")
+                re_obj = _re(r"^[A-Za-z1-9][A-Za-z0-9-.]*$")
                 if re_ban_body is None:
-                    re_ban_body = re.compile(r"[^A-Za-z0-9-.]")
+                    re_ban_body = _re(r"[^A-Za-z0-9-.]")
                 if ck_head and re_ban_head is None:
-                    re_ban_head = re.compile(r"^[^A-Za-z1-9]")
+                    re_ban_head = _re(r"^[^A-Za-z1-9]")
                 if ck_tail and re_ban_tail is None:
-                    re_ban_tail = re.compile(r"[^A-Za-z0-9]$")
+                    re_ban_tail = _re(r"[^A-Za-z0-9]$")
                 if not ck_head:
                     re_ban_head = re_ban_body
             if re.match(re_obj, self.in_str):
@@ -389,11 +1096,7 @@ class Str(object):
         print(__name__, self._c, _name()) if not self.no_log else 1
         try:
             s_str = self.other_str if self.other_str else self.in_str
-            in_str = str(self.in_str)
-            str_list = []
-            for i_str in in_str:
-                if "\u4e00" <= i_str <= "\u9fa5":
-                    str_list.append(i_str)
+            str_list = CJK_PATTERN.findall(str(self.in_str))
             if len(str_list) != 0:
                 return f"{self.add_info}{s_str}{self._e['中文']}{_wrap(_join_str(str_list))}"
             else:
@@ -402,6 +1105,16 @@ class Str(object):
             print(e) if not self.no_log else 1
             return f"{self.add_info}{self._e['chinese']}"
 
+    @staticmethod
+    def chinese_mask(strings):
+        """
+        整列中文字符检测（预编译正则单次扫描）
+        :param strings: 字符串/字符串序列，检查对象
+        :return: (布尔掩码numpy数组，含中文为True, 有序字典{序号: 中文字符列表}，仅含未通过的元素)
+        """
+        mask, hits, _ = _cjk_scan([strings, ] if isinstance(strings, str) else strings)
+        return mask, hits
+
     def ban(self, ban_list=None):
         """
         便捷字符串禁用字符检查（完整版使用format）
@@ -451,7 +1164,7 @@ class Str(object):
         try:
             error_list = []
             if not ck_chinese:  # 如果不禁用中文字符，那么将所有中文字符替换为"a",规避正则检查
-                self.in_str = re.sub('[\u4e00-\u9fa5]', 'a', self.in_str)
+                self.in_str = CJK_PATTERN.sub('a', self.in_str)
             if allow_space:  # 如果允许空格，那么将所有空格替换为"b",规避正则检查
                 self.in_str = re.sub(' ', 'b', self.in_str)
             if ck_length:
@@ -479,6 +1192,77 @@ class Str(object):
             print(e) if not self.no_log else 1
             return [f"{self.add_info}{self._e['check']}", ]
 
+    @classmethod
+    def check_many(cls, strings, add_info="", no_log=False, lang=LANG,
+                   ck_length=True, ck_format=True, ck_chinese=True, ck_ban=True, allow_space=False,
+                   elen: int = None, min_len: int = 1, max_len: int = 20,
+                   re_obj=None, re_ban_body=None, ck_head=True, re_ban_head=None,
+                   ban_list: list = None):
+        """
+        批量字符串检查，规则及报错信息同check，各规则对整个序列单次遍历（正则预编译），仅为未通过的元素生成报错信息
+        :param strings: 可迭代对象，检查对象序列（如样本名列）
+        :param add_info: 字符串，附加信息
+        :param no_log: 不打印调用及报错信息，默认为False
+        :param lang: 字符串，选择报错语言，可选["CN", "EN"]，默认CN
+        其余参数同check
+        :return: 全部符合期望返回0，否则返回有序字典{序号（从0开始）: 报错信息列表}
+        """
+        print(__name__, cls.__name__, _name()) if not no_log else 1
+        raw_strings = strings = list(strings)
+        try:
+            if not ck_chinese and not all(isinstance(x, str) for x in strings):
+                raise TypeError("expected string elements")  # 与check一致，非字符串元素转逐个检查
+            cjk_mask, _, masked = _cjk_scan(strings, repl=None if ck_chinese else 'a')  # 检测与替换共用一次扫描
+            strings = strings if ck_chinese else masked
+            if allow_space:
+                strings = [x.replace(' ', 'b') for x in strings]
+            flags = OrderedDict()  # {规则: 未通过序号集合}
+            if ck_length:
+                if elen is not None:
+                    flags["length"] = {i for i, x in enumerate(strings) if len(x) != elen}
+                else:
+                    flags["length"] = {i for i, x in enumerate(strings) if not min_len <= len(x) <= max_len}
+            if ck_format:
+                match = _re(r"^[A-Za-z1-9][A-Za-z0-9-.]*$").match if re_obj is None else \
+                    partial(re.match, re_obj)
+                flags["format"] = {i for i, x in enumerate(strings) if not match(x)}
+            if ck_chinese:
+                flags["chinese"] = set(np.flatnonzero(cjk_mask).tolist())
+            if ck_ban and ban_list is not None:
+                bans = [str(i) for i in ban_list]
+                flags["ban"] = {i for i, x in enumerate(strings) if any(b in x for b in bans)}
+            res = OrderedDict()
+            for i in sorted(set().union(*flags.values())):
+                ob_str = cls(in_str=strings[i], add_info=add_info, no_log=True, lang=lang)
+                error_list = []
+                for rule, bad in flags.items():
+                    if i not in bad:
+                        continue
+                    if rule == "length":
+                        err_msg = ob_str.length(elen=elen, max_len=max_len, min_len=min_len)
+                    elif rule == "format":
+                        err_msg = ob_str.format(re_obj=re_obj, re_ban_body=re_ban_body,
+                                                ck_head=ck_head, re_ban_head=re_ban_head)
+                    elif rule == "chinese":
+                        err_msg = ob_str.chinese()
+                    else:
+                        err_msg = ob_str.ban(ban_list=ban_list)
+                    if err_msg:
+                        error_list.append(f"{add_info}{err_msg}")
+                if error_list:
+                    res[i] = error_list
+        except Exception as e:  # 含非字符串元素等情况，逐个检查
+            print(e) if not no_log else 1
+            res = OrderedDict()
+            for i, x in enumerate(raw_strings):
+                error_list = cls(in_str=x, add_info=add_info, no_log=True, lang=lang).check(
+                    ck_length=ck_length, ck_format=ck_format, ck_chinese=ck_chinese, ck_ban=ck_ban,
+                    allow_space=allow_space, elen=elen, min_len=min_len, max_len=max_len, re_obj=re_obj,
+                    re_ban_body=re_ban_body, ck_head=ck_head, re_ban_head=re_ban_head, ban_list=ban_list)
+                if error_list:
+                    res[i] = error_list
+        return res if res else 0
+
 
 @_pre_class
 class Num(object):
@@ -602,8 +1386,11 @@ class File(object):
         self.no_log = no_log
         self.lang = lang
         self._c = self.__class__.__name__  # 类名
-        self._e = self.lang_dic[self.lang][self._c]  # 报错字典初定位
+        self._e = self.lang_dic[self.lang]["File"]  # 报错字典初定位，子类共用
         self.__name = os.path.basename(in_file)
+        self._line_index = {}  # 行/列成员索引缓存 {参数: (文件状态, 索引)}
+        self._type_cache = {}  # 列类型推断缓存 {参数: (文件状态, 推断结果)}
+        self.err_agg = ErrorAgg()  # 报错聚合
         if not os.path.isfile(in_file):
             print("Warning: Input Is Not A File! [{}]".format(in_file))
 
@@ -644,9 +1431,12 @@ class File(object):
                 suffix_list = [suffix_list.lower(), ]
             else:
                 suffix_list = list(map(lambda x: x.lower(), suffix_list))
+            names = [self.in_file, ]
+            if _compress_type(self.in_file):
+                names.append(_strip_compress_suffix(self.in_file))  # 压缩文件同时检查解压后文件名
             for i_suf in suffix_list:
-                re_obj = re.compile(str(i_suf) + r"$")
-                if re.search(re_obj, self.in_file):
+                re_obj = _re(str(i_suf) + r"$")
+                if any(re.search(re_obj, name) for name in names):
                     return 0
             return f"{self.add_info}{self.__name}{self._e['不支持后缀']}{self._e['支持后缀']}{_wrap(_join_str(suffix_list))}"
         except Exception as e:
@@ -662,6 +1452,11 @@ class File(object):
         try:
             if os.path.getsize(self.in_file) == 0:
                 return f"{self.add_info}{self._e['输入']}{self.__name}{self._e['空文件']}"
+            elif _compress_type(self.in_file):
+                with _open_bin(self.in_file) as fileIN:
+                    if not fileIN.read(1):
+                        return f"{self.add_info}{self._e['输入']}{self.__name}{self._e['空文件']}"
+                return 0
             else:
                 return 0
         except Exception as e:
@@ -687,6 +1482,12 @@ class File(object):
             print(e) if not self.no_log else 1
             return f"{self.add_info}{self._e['size']}"
 
+    def _detect_encoding(self, use_1=False):
+        """推测（chardet）或检测（linux file）文件编码格式"""
+        if use_1:
+            return _get_encoding(self.in_file)
+        return _get_encoding2(self.in_file)
+
     def encoding(self, allowed_encode: list = None, use_1=False):
         """
         检查编码格式是否在允许范围内（默认UTF-8）（二进制文件如xlsx，无法检测文件编码）
@@ -702,10 +1503,7 @@ class File(object):
                 allowed_encode = [allowed_encode.upper(), ]
             else:
                 allowed_encode = list(map(lambda x: x.upper(), allowed_encode))
-            if use_1:
-                doc_encoding = _get_encoding(self.in_file)
-            else:
-                doc_encoding = _get_encoding2(self.in_file)
+            doc_encoding = self._detect_encoding(use_1=use_1)
             if doc_encoding in allowed_encode:
                 return 0
             else:
@@ -862,7 +1660,11 @@ class File(object):
             logging.error("需要用到Linux系统命令awk，否则强制替换行为4")
             return 4
         try:
-            out = subprocess.getoutput("awk 'END{print NR}' %s" % self.in_file)
+            cat_cmd = _cat_cmd(self.in_file)
+            if cat_cmd:
+                out = subprocess.getoutput("%s | awk 'END{print NR}'" % cat_cmd)
+            else:
+                out = subprocess.getoutput("awk 'END{print NR}' %s" % self.in_file)
             return int(out.split()[0])
         except Exception as e:
             print(e) if not self.no_log else 1
@@ -877,7 +1679,11 @@ class File(object):
             logging.error("需要用到Linux系统命令awk，否则强制替换列为3")
             return 3
         try:
-            out = subprocess.getoutput("awk -F '%s' 'END{print NF}' %s" % (self.sep, self.in_file))
+            cat_cmd = _cat_cmd(self.in_file)
+            if cat_cmd:
+                out = subprocess.getoutput("%s | awk -F '%s' 'END{print NF}'" % (cat_cmd, self.sep))
+            else:
+                out = subprocess.getoutput("awk -F '%s' 'END{print NF}' %s" % (self.sep, self.in_file))
             return int(out)
         except Exception as e:
             print(e) if not self.no_log else 1
@@ -902,24 +1708,28 @@ class File(object):
 
     get_row = get_row_line = get_line
 
-    def line_dup(self):
+    def line_dup(self, max_show: int = None):
         """
         数据重复行检查
-        :return: 无重复返回0，有重复返回字符串报错信息
+        :param max_show: 正整数，报错信息最多展示的重复行号个数，超出时追加总数，None表示全部展示，默认None
+        :return: 无重复返回0，有重复返回字符串报错信息，汇总见err_agg.summary()，元素记录为行的64位哈希（不保存行文本，
+            需要时按行号以get_line读取）
         """
         print(__name__, self._c, _name()) if not self.no_log else 1
         try:
-            res_list = []
-            err = []
+            res_set = set()
+            self.err_agg.reset("line_dup", max_keep=None if max_show is None else max_show + 1)
             for line, line_no in _read_line(self.in_file):
-                if line in res_list:
-                    err.append(line_no)
+                if line in res_set:
+                    self.err_agg.add_many("line_dup", pos=(line_no, ), values=(int(_hash64((line, ))[0]), ))
                 else:
-                    res_list.append(line)
-            if err:
-
+                    res_set.add(line)
+            if self.err_agg.count("line_dup"):
+                more = "" if max_show is None else \
+                    f"{self._e['共计']}{self.err_agg.count('line_dup')}{self._e['行']}"
+                err = _join_str(self.err_agg.positions("line_dup"), max_show=max_show, more=more)
                 return f"{self.add_info}{self._e['输入']}{self.__name}" \
-                       f"{self._e['重复行号']}{_wrap(_join_str(err), self_len=160)}"
+                       f"{self._e['重复行号']}{_wrap(err, self_len=160)}"
             else:
                 return 0
         except Exception as e:
@@ -935,7 +1745,7 @@ class File(object):
         print(__name__, self._c, _name()) if not self.no_log else 1
         try:
             in_line = in_line.strip()
-            blank_pat = re.compile(r"^\s*$")
+            blank_pat = _re(r"^\s*$")
             if re.search(blank_pat, in_line):
                 return f"{self.add_info}{self._e['空白行']}"
             else:
@@ -953,11 +1763,9 @@ class File(object):
         """
         print(__name__, self._c, _name()) if not self.no_log else 1
         try:
-            head_sep = re.compile(f"^[{sep_r}]")
-            sep_sep = re.compile(f"{sep_r}{sep_r}")
-            blank_sep = re.compile(rf"\s{sep_r}")
-            sep_blank = re.compile(rf"{sep_r}\s")
-            tail_blank = re.compile(r"\s$")
+            any_pat, (head_sep, sep_sep, blank_sep, sep_blank, tail_blank) = _line_sep_pats(sep_r)
+            if not any_pat.search(in_line):  # 合并正则单次扫描，规范行直接返回
+                return 0
             msg = ''
             if re.search(head_sep, in_line):
                 msg = msg + f"{self._e['开头符']}{sep_r};"
@@ -977,6 +1785,666 @@ class File(object):
             print(e) if not self.no_log else 1
             return f"{self.add_info}{self._e['line_sep']}"
 
+    def _iter_sep_lines(self, sep_r=r'\t'):
+        """
+        单次流式读取文件，逐行分类分隔符问题（合并正则单次扫描，命中后再定位类型）
+        :return: 生成器，(行号, 行字符串, 问题类型元组)，规范行的问题类型为空元组
+        """
+        any_pat, pats = _line_sep_pats(sep_r)
+        for line, line_no in _read_line(self.in_file, rm_br=True):
+            if any_pat.search(line):
+                yield line_no, line, tuple(k for k, pat in zip(SEP_ISSUES, pats) if pat.search(line))
+            else:
+                yield line_no, line, ()
+
+    def file_sep(self, sep_r=r'\t'):
+        """
+        全文件分隔符规范检查，单次读取文件，按问题类型汇总行号
+        :param sep_r: 字符串，纯文本读入的分隔符，同line_sep，默认r'\t'
+        :return: 规范返回0，不规范返回有序字典{问题类型: 行号列表}，问题类型为SEP_ISSUES中的
+            head_sep（开头分隔符）、sep_sep（连续分隔符）、blank_sep（分隔符前空白）、sep_blank（分隔符后空白）、tail_blank（空白结尾），
+            错误无返回
+        """
+        print(__name__, self._c, _name()) if not self.no_log else 1
+        try:
+            res = OrderedDict((k, []) for k in SEP_ISSUES)
+            for line_no, line, kinds in self._iter_sep_lines(sep_r):
+                for k in kinds:
+                    res[k].append(line_no)
+            res = OrderedDict((k, v) for k, v in res.items() if v)
+            return res if res else 0
+        except Exception as e:
+            print(e) if not self.no_log else 1
+
+    def _file_sig(self):
+        """文件状态标识（路径、修改时间、大小），用于缓存失效判断"""
+        stat = os.stat(self.in_file)
+        return self.in_file, stat.st_mtime_ns, stat.st_size
+
+    def get_line_index(self, dim="row", line_no=1, rm_blank=True, fill_null=False, null_list: list = None):
+        """
+        获取文件指定一行/列元素（字符串）的成员索引，结果按文件状态缓存，文件变动后自动重建
+        :param dim: 部分整数/字符串，检查维度【取行/列】，可选[1, '1', 'row', '行'][2, '2', 'col', 'column', '列']
+        :param line_no: 正整数，指定读取行/列号，默认1
+        :param rm_blank: 布尔值，是否移除元素前后空白，默认True
+        :param fill_null: 布尔值，是否将缺失数据统一替换为NA，默认False
+        :param null_list: 字符串/字符串列表，指定原数据表示缺失数据的符号，默认["", "NA", "N/A", "NULL"]
+        :return: 正常返回元素集合（frozenset），错误无返回
+        """
+        try:
+            if isinstance(null_list, str):
+                null_list = [null_list, ]
+            if null_list is None:
+                null_list = list(NONE_LIST)
+            dim = "row" if dim in ROW_OPTIONS else "col"
+            key = (dim, line_no, rm_blank, fill_null, tuple(null_list))
+            sig = self._file_sig()
+            cache = self._line_index.get(key)
+            if cache is None or cache[0] != sig:
+                in_list = _line2list(self.in_file, self.sep, dim, line_no, rm_blank, fill_null, null_list)
+                cache = (sig, frozenset(map(str, in_list)))
+                self._line_index[key] = cache
+            return cache[1]
+        except Exception as e:
+            print(e) if not self.no_log else 1
+
+    def infer_types(self, rm_first=False, rm_blank=True, fill_null=False, null_list: list = None):
+        """
+        单次读取文件，推断各列可容纳全部非缺失元素的最窄类型（int、float、bool、str），
+        结果按文件状态缓存，文件变动后自动重建，check_content(infer_type=True)列类型检查据此查表
+        :param rm_first: 布尔值，是否去掉各列首个元素（标题行），默认False
+        :param rm_blank: 布尔值，是否移除元素前后空白，默认True
+        :param fill_null: 布尔值，是否将缺失数据统一替换为NA，默认False
+        :param null_list: 字符串/字符串列表，指定原数据表示缺失数据的符号，默认["", "NA", "N/A", "NULL"]
+        :return: 正常返回有序字典{列号: {"type": 推断类型（全部缺失时为None）, "na": 缺失元素个数,
+            "n": 元素个数, "counter": 否定前一候选类型（如str列为bool）的首个反例(行号, 元素)（int/全部缺失时为None）, "bad": {"int"/"float": 含缺失元素在内
+            首个无法转换的元素(行号, 元素)}, "min"/"max": 数值最小/最大值（忽略nan）, "short": 是否有行缺少该列, ...}}，
+            结果为缓存对象，请勿修改，错误无返回
+        """
+        try:
+            if isinstance(null_list, str):
+                null_list = [null_list, ]
+            if null_list is None:
+                null_list = list(NONE_LIST)
+            key = (rm_first, rm_blank, fill_null, tuple(null_list))
+            sig = self._file_sig()
+            cache = self._type_cache.get(key)
+            if cache is None or cache[0] != sig:
+                cache = (sig, self._infer_types(rm_first, rm_blank, fill_null, null_list))
+                self._type_cache[key] = cache
+            return cache[1]
+        except Exception as e:
+            print(e) if not self.no_log else 1
+
+    def _infer_types(self, rm_first=False, rm_blank=True, fill_null=False, null_list: list = None):
+        """infer_types单次读取实现，元素切分规则同_cols2lists"""
+        null_set = set(null_list) | ({"NA"} if fill_null else set())
+        cols, rows, nos, row_num, fed = [], [], [], 0, [0]
+
+        def feed():
+            for i in range(max(map(len, rows))):
+                if len(cols) <= i:
+                    cols.append(dict(type=None, n=0, na=0, counter=None, bad=dict(int=None, float=None),
+                                     miss=dict(int=None, float=None, bool=None), min=None, max=None, nan=0,
+                                     first=None, varies=False, short=fed[0] > 0))
+                vals = [row[i] for row in rows if len(row) > i]
+                if len(vals) < len(rows):
+                    cols[i]["short"] = True
+                    _infer_col(cols[i], vals, [no for row, no in zip(rows, nos) if len(row) > i], null_set)
+                else:
+                    _infer_col(cols[i], vals, nos, null_set)
+            for col in cols[max(map(len, rows)):]:
+                col["short"] = True
+            fed[0] += len(rows)
+
+        for line, line_no in _read_line(self.in_file):
+            row_num += 1
+            if rm_first and row_num == 1:
+                continue
+            row = line.split(self.sep)
+            if rm_blank:
+                row = [x.strip() for x in row]
+            if fill_null:
+                row = ["NA" if x in null_set else x for x in row]
+            rows.append(row)
+            nos.append(line_no)
+            if len(rows) >= INFER_BLOCK:
+                feed()
+                rows, nos = [], []
+        if rows:
+            feed()
+        res = OrderedDict()
+        for no, col in enumerate(cols, 1):
+            miss = col["miss"]
+            if col["n"] > col["na"]:
+                col["type"] = next((t for t in INFER_TYPES[:-1] if miss[t] is None), "str")
+            rank = INFER_TYPES.index(col["type"]) if col["type"] else 0
+            col["counter"] = miss[INFER_TYPES[rank - 1]] if rank else None  # 否定前一候选类型的首个反例
+            res[no] = col
+        return res
+
+    def _sidecar_dir(self, sidecar_dir: str = None):
+        return sidecar_dir if sidecar_dir else self.in_file + SIDECAR_SUFFIX
+
+    def _write_sidecar(self, df, sidecar_dir: str = None):
+        """
+        将已解析的表格（首行为标题，元素为字符串）写为列式缓存：数值列float64（NONE_LIST元素为NaN）、其余列
+        定长字符串（含全缺失列），每列一个.npy，安装pyarrow时另存table.feather，meta.json记录源文件md5及文件状态
+        """
+        sidecar_dir = self._sidecar_dir(sidecar_dir)
+        os.makedirs(sidecar_dir, exist_ok=True)
+        columns = [str(i) for i in df.iloc[0].tolist()]
+        body = df.iloc[1:].reset_index(drop=True)
+        body.columns = range(body.shape[1])
+        kinds, data = [], {}
+        for i in range(body.shape[1]):
+            col = body[i].astype(str).str.strip()
+            na_mask = col.isin(NONE_LIST)
+            nums = pd.to_numeric(col.mask(na_mask), errors="coerce")
+            if not na_mask.all() and not (nums.isna() & ~na_mask).any():  # 非缺失元素均可转为数值
+                arr = nums.to_numpy(dtype=np.float64)
+                kinds.append("num")
+            else:
+                arr = body[i].to_numpy(dtype=str)
+                kinds.append("str")
+            np.save(os.path.join(sidecar_dir, f"{i}.npy"), arr, allow_pickle=False)
+            data[i] = arr
+        feather = 0
+        try:
+            table = pd.DataFrame(data)
+            table.columns = columns
+            table.to_feather(os.path.join(sidecar_dir, "table.feather"))
+            feather = 1
+        except Exception as e:  # 未安装pyarrow或标题重复时仅保留.npy
+            print(e) if not self.no_log else 1
+        sig = self._file_sig()
+        meta = {"source": self.in_file, "md5": _file_md5(self.in_file), "mtime_ns": sig[1], "size": sig[2],
+                "sep": self.sep, "nrows": int(body.shape[0]), "columns": columns, "kinds": kinds,
+                "feather": feather}
+        with open(os.path.join(sidecar_dir, "meta.json"), "w", encoding="UTF-8") as fileOU:
+            json.dump(meta, fileOU, ensure_ascii=False)
+        return sidecar_dir
+
+    def save_sidecar(self, sidecar_dir: str = None, encoding="utf-8"):
+        """
+        解析文件并保存列式缓存（首行为标题），仅供load_sidecar及下游（如basicTools.R loadTable）直接读取；
+        缓存数值列已转为float64，不保留原字符串，File各检查（含check_content/check_incremental）不读取缓存，始终读取源文件
+        :param sidecar_dir: 字符串，缓存目录，默认为in_file + ".sidecar"
+        :param encoding: 字符串，输入文件编码格式，默认utf-8
+        :return: 正常返回缓存目录，错误无返回
+        """
+        print(__name__, self._c, _name()) if not self.no_log else 1
+        try:
+            with _open_bin(self.in_file) as fileIN:
+                df = pd.read_csv(fileIN, sep=self.sep, header=None, na_filter=False, encoding=encoding,
+                                 na_values="", dtype='str', keep_default_na=False)
+            return self._write_sidecar(df, sidecar_dir)
+        except Exception as e:
+            print(e) if not self.no_log else 1
+
+    def load_sidecar(self, sidecar_dir: str = None, mmap=True):
+        """
+        读取列式缓存，文件状态变化时以md5复核源文件内容，内容一致则沿用缓存
+        :param sidecar_dir: 字符串，缓存目录，默认为in_file + ".sidecar"
+        :param mmap: 布尔值，是否以内存映射方式读取各列，默认True
+        :return: 缓存有效返回有序字典{列名: numpy数组}（重复列名按pandas规则追加".序号"），缓存缺失或失效返回None
+        """
+        try:
+            sidecar_dir = self._sidecar_dir(sidecar_dir)
+            meta_file = os.path.join(sidecar_dir, "meta.json")
+            if not os.path.isfile(meta_file):
+                return None
+            with open(meta_file, encoding="UTF-8") as fileIN:
+                meta = json.load(fileIN)
+            sig = self._file_sig()
+            if meta["sep"] != self.sep:
+                return None
+            if (meta["mtime_ns"], meta["size"]) != sig[1:]:
+                if meta["size"] != sig[2] or meta["md5"] != _file_md5(self.in_file):
+                    return None
+                meta["mtime_ns"] = sig[1]  # 内容未变，仅更新文件状态
+                with open(meta_file, "w", encoding="UTF-8") as fileOU:
+                    json.dump(meta, fileOU, ensure_ascii=False)
+            table, seen = OrderedDict(), Counter()
+            for i, name in enumerate(meta["columns"]):
+                key = name if not seen[name] else f"{name}.{seen[name]}"
+                seen[name] += 1
+                table[key] = np.load(os.path.join(sidecar_dir, f"{i}.npy"), mmap_mode="r" if mmap else None,
+                                     allow_pickle=False)
+            return table
+        except Exception as e:
+            print(e) if not self.no_log else 1
+
+    def _ckpt_dir(self, state_dir: str = None):
+        return state_dir if state_dir else self.in_file + CHECKPOINT_SUFFIX
+
+    def _ckpt_anchor(self, offset: int):
+        """偏移位置前至多CHECKPOINT_ANCHOR字节的md5，续读前校验，确认文件仅在末尾追加"""
+        with open(self.in_file, "rb") as fileIN:
+            fileIN.seek(max(offset - CHECKPOINT_ANCHOR, 0))
+            return hashlib.md5(fileIN.read(min(offset, CHECKPOINT_ANCHOR))).hexdigest()
+
+    @staticmethod
+    def _ckpt_new(sig: str, gen: int = 0):
+        """空检查状态：offset为已检查的完整行末字节偏移，n为已读元素个数（含首行），cols/arrs为各列累计结果"""
+        return {"sig": sig, "gen": gen, "offset": 0, "line_no": 0, "stopped": False, "n": 0, "ncols": None,
+                "anchor": "", "cols": [], "arrs": []}
+
+    def _ckpt_load(self, state_dir: str, sig: str):
+        """读取检查状态，参数变化、文件变短或已检查部分被改写时返回空状态（全量重新检查）"""
+        state_file = os.path.join(state_dir, "state.json")
+        if not os.path.isfile(state_file):
+            return self._ckpt_new(sig)
+        with open(state_file, encoding="UTF-8") as fileIN:
+            state = json.load(fileIN)
+        if state["sig"] != sig or state["offset"] > os.path.getsize(self.in_file) or \
+                state["anchor"] != self._ckpt_anchor(state["offset"]):
+            return self._ckpt_new(sig, state["gen"])
+        state["arrs"] = []
+        for i in range(len(state["cols"])):
+            with np.load(os.path.join(state_dir, f"{i}.{state['gen']}.npz")) as arrs:
+                state["arrs"].append([arrs["h"], arrs["f"], arrs["c"]])
+        return state
+
+    @staticmethod
+    def _ckpt_save(state: dict, state_dir: str):
+        """保存检查状态，各列哈希集合按代号另存，state.json替换后再删除旧代文件"""
+        os.makedirs(state_dir, exist_ok=True)
+        state["gen"] += 1
+        for i, (h, f, c) in enumerate(state["arrs"]):
+            np.savez(os.path.join(state_dir, f"{i}.{state['gen']}.npz"), h=h, f=f, c=c)
+        tmp_file = os.path.join(state_dir, "state.json.tmp")
+        with open(tmp_file, "w", encoding="UTF-8") as fileOU:
+            json.dump({k: v for k, v in state.items() if k != "arrs"}, fileOU, ensure_ascii=False)
+        os.replace(tmp_file, os.path.join(state_dir, "state.json"))
+        for name in os.listdir(state_dir):
+            if name.endswith(".npz") and not name.endswith(f".{state['gen']}.npz"):
+                os.remove(os.path.join(state_dir, name))
+
+    def _ckpt_feed(self, state: dict, lines, opts: dict):
+        """
+        按_read_line规则（空白行跳过但计行号，遇空行停止读取）解析新增行，并更新各列检查状态
+        :param lines: 可迭代对象，含换行符的行字符串
+        """
+        if state["stopped"]:
+            return
+        rows = []
+        for line in lines:
+            state["line_no"] += 1
+            line = line.rstrip('\r\n')
+            if line.isspace():
+                continue
+            elif not line:
+                state["stopped"] = True
+                break
+            rows.append(line.split(self.sep))
+        if not rows:
+            return
+        if state["ncols"] is None:  # 列数以首行为准
+            state["ncols"] = len(rows[0])
+            state["cols"] = [dict(dup=[], ban=[], na=[], type_bad=None, range_pos=[], ban_pos=[], first=None,
+                                  varies=False, min=None, max=None) for _ in range(state["ncols"])]
+            state["arrs"] = [[np.empty(0, np.uint64), np.empty(0, np.int64), np.empty(0, np.uint8)]
+                             for _ in range(state["ncols"])]
+        if min(map(len, rows)) < state["ncols"]:
+            raise IndexError("row has fewer elements than the first row")
+        null_set = set(opts["null_list"])
+        for i, col_elements in zip(range(state["ncols"]), zip(*rows)):
+            if opts["rm_blank"]:
+                col_elements = [x.strip() for x in col_elements]
+            if opts["fill_null"]:
+                col_elements = ["NA" if x in null_set else x for x in col_elements]
+            self._ckpt_feed_col(state["cols"][i], state["arrs"][i], col_elements, state["n"], opts)
+        state["n"] += len(rows)
+
+    @staticmethod
+    def _ckpt_feed_col(col: dict, arrs: list, col_elements: list, base: int, opts: dict):
+        """
+        以新增元素更新单列检查状态，结果同List.dup/ban/na/type/num_range/num_ban对全列的检查
+        :param col: 字典，该列累计结果
+        :param arrs: 列表，[已见元素哈希（升序）, 首次出现位置, 出现次数（至多记2）]
+        :param base: 整数，新增元素首个在全列中的位置（从0计）
+        """
+        if opts["ck_dup"]:
+            keys = list(col_elements) if opts["rm_blank"] else [x.strip() for x in col_elements]  # 同List.dup去空白
+            uniq, first, counts = np.unique(_hash64(keys), return_index=True, return_counts=True)
+            h, f, c = arrs
+            pos = np.searchsorted(h, uniq)
+            found = pos < len(h)
+            found[found] = h[pos[found]] == uniq[found]
+            old_dup = found.copy()
+            old_dup[found] = c[pos[found]] == 1  # 此前仅出现1次
+            new_dup = [[int(p), keys[j]] for p, j in zip(f[pos[old_dup]], first[old_dup])]
+            new_dup += [[base + int(j), keys[j]] for j in first[~found & (counts > 1)]]
+            c = c.copy()
+            c[pos[found]] = np.minimum(c[pos[found]] + counts[found], 2)
+            h = np.concatenate([h, uniq[~found]])
+            f = np.concatenate([f, base + first[~found]])
+            c = np.concatenate([c, np.minimum(counts[~found], 2).astype(np.uint8)])
+            order = np.argsort(h, kind="stable")
+            arrs[:] = [h[order], f[order], c[order]]
+            col["dup"] = sorted(col["dup"] + new_dup)  # 同Counter，按首次出现顺序
+        for key in ("ban", "na"):
+            if opts[f"{key}_list"] is not None:
+                items, seen = set(opts[f"{key}_list"]), set(col[key])
+                col[key].extend(x for x in dict.fromkeys(col_elements) if x in items and x not in seen)
+        if not opts["ck_type"]:
+            return
+        skip = 1 if opts["rm_first"] and base == 0 else 0
+        body = col_elements[skip:]
+        body_base = base + skip - (1 if opts["rm_first"] else 0)  # body[0]在去首元素列表中的位置（从0计）
+        if not body:
+            return
+        if col["first"] is None:
+            col["first"] = body[0]
+        col["varies"] = col["varies"] or any(x != col["first"] for x in body)
+        if col["type_bad"] is not None:
+            return
+        conv = eval(opts["exp_type"].lower())
+        num_list = []
+        for x in body:
+            try:
+                num_list.append(conv(x))
+            except ValueError:
+                col["type_bad"] = x  # 同List.type，仅报首个转换失败元素
+                return
+        num_arr = np.asarray(num_list, dtype=np.float64)
+        if opts["ck_num_range"]:
+            in_range = (num_arr >= opts["min_num"]) & (num_arr <= opts["max_num"])
+            col["range_pos"] += (np.flatnonzero(~in_range) + body_base + 1).tolist()
+        if opts["ban_num"] is not None:
+            ban_arr = np.array([i for i in opts["ban_num"] if isinstance(i, (int, float))], dtype=np.float64)
+            col["ban_pos"] += (np.flatnonzero(np.isin(num_arr, ban_arr)) + body_base + 1).tolist()
+        finite = num_arr[~np.isnan(num_arr)]
+        if finite.size:
+            col["min"] = float(finite.min()) if col["min"] is None else min(col["min"], float(finite.min()))
+            col["max"] = float(finite.max()) if col["max"] is None else max(col["max"], float(finite.max()))
+
+    def _ckpt_msgs(self, state: dict, opts: dict, len_opts: dict):
+        """由检查状态生成报错信息，顺序及内容同check_content列基础检查、列类型检查及列标准化检查"""
+        error_list = []
+        for no, col in enumerate(state["cols"], 1):
+            tagged = []
+            ob_list = List([], no_log=True, lang=self.lang)
+            ob_list.fix_list = range(state["n"])  # 长度检查仅需元素个数
+            if len_opts["ck_length"] and len_opts["length"] is not None:
+                err_msg = ob_list.length(exp_len=len_opts["length"])
+                if err_msg:
+                    tagged.append(("length", err_msg))
+            elif not len_opts["ck_length"] and len_opts["ck_length_range"]:
+                err_msg = ob_list.range(min_len=len_opts["min_len"], max_len=len_opts["max_len"])
+                if err_msg:
+                    tagged.append(("length", err_msg))
+            if opts["ck_dup"] and col["dup"]:
+                tagged.append(("dup", List([x for _, x in col["dup"]] * 2, no_log=True, lang=self.lang).dup()))
+            if opts["ban_list"] is not None and col["ban"]:
+                tagged.append(("ban", List(col["ban"], no_log=True, lang=self.lang).ban(ban_list=opts["ban_list"])))
+            if opts["na_list"] is not None and col["na"]:
+                tagged.append(("na", List(col["na"], no_log=True, lang=self.lang).na(na_list=opts["na_list"])))
+            error_list.extend(self._line_msgs(self._e['列号'], no, tagged))
+        if error_list or not opts["ck_type"]:
+            return error_list
+        col_flag = []
+        for no, col in enumerate(state["cols"], 1):
+            tagged = []
+            if col["type_bad"] is not None:
+                tagged.append(("type", List([col["type_bad"]], no_log=True, lang=self.lang).type(opts["exp_type"])))
+            else:
+                col_flag.append(1)
+                ob_list = List([], no_log=True, lang=self.lang)
+                if opts["ck_num_range"] and col["range_pos"]:
+                    tagged.append(("num_range", ob_list._num_range_msg(col["range_pos"], opts["min_num"],
+                                                                       opts["max_num"])))
+                if opts["ban_num"] is not None and col["ban_pos"]:
+                    ob_list.err_agg.add_many("num_ban", pos=col["ban_pos"])
+                    tagged.append(("num_ban", ob_list._num_ban_msg(opts["ban_num_raw"])))
+            error_list.extend(self._line_msgs(self._e['列号'], no, tagged))
+        if col_flag and opts["ck_standard"]:  # 同check_content，数值列以最小值等于最大值判断为常量
+            for no, col in enumerate(state["cols"], 1):
+                if col["first"] is not None and (not col["varies"] if col["type_bad"] is not None else
+                                                 col["min"] is not None and col["min"] == col["max"]):
+                    error_list.append(
+                        f"{self.add_info}{self._e['输入']}{self.__name}{self._e['列号']}{no}{self._e['列标准化要求']}")
+        return error_list
+
+    def check_incremental(self, state_dir: str = None, reset=False, rm_blank=True, fill_null=False, null_list=None,
+                          ck_col_base=True, ck_col_length=True, ck_col_length_range=True, ck_col_dup=True,
+                          ck_col_na=True, ck_col_ban=True, col_length: int = None, col_min_len=0,
+                          col_max_len: int = float('inf'), ban_list: list = None, na_list: list = None,
+                          ck_col_type=False, exp_type='float', rm_first=False, ck_col_num_range=False,
+                          col_min_num=float('-inf'), col_max_num=float('inf'), ck_col_num_ban=True,
+                          ban_num: list = None, ck_col_standard=False):
+        """
+        追加写入文件的增量列检查：保存已检查字节偏移及各列累计结果（已见元素哈希集合、重复/禁用/缺失元素、
+        首个类型错误、数值超限/禁用位置、最值），再次检查时仅读取新增部分，结果同全量检查
+        check_content(pre_check=False, ck_row_base=False, ck_col_list=None, ck_col_type_list=None,
+        ck_standard_list=None)的全部列检查；参数变化、文件变短或已检查部分末尾被改写时自动全量重新检查，
+        末尾不完整行参与本次结果但不保存状态，压缩文件每次全量检查且不保存状态
+        :param state_dir: 字符串，检查状态目录，默认为in_file + ".ckpt"
+        :param reset: 布尔值，是否忽略已有状态全量重新检查，默认False
+        :param exp_type: 字符串，期望列元素类型，限定为"float"/"int"，默认"float"
+        :return: 符合期望返回0，不符合返回报错信息列表，列数以首行为准，其余参数同check_content
+        """
+        print(__name__, self._c, _name()) if not self.no_log else 1
+        try:
+            if isinstance(null_list, str):
+                null_list = [null_list, ]
+            if isinstance(ban_list, str):
+                ban_list = [ban_list, ]
+            if isinstance(na_list, str):
+                na_list = [na_list, ]
+            if isinstance(ban_num, (int, float)):
+                ban_num = [ban_num, ]
+            if ck_col_type and exp_type.lower() not in ("float", "int"):
+                raise ValueError(f"exp_type {exp_type} not supported")
+            opts = dict(sep=self.sep, rm_blank=rm_blank, fill_null=fill_null,
+                        null_list=list(NONE_LIST) if null_list is None else list(null_list),
+                        ck_dup=ck_col_base and ck_col_dup,
+                        ban_list=list(map(str, ban_list)) if ck_col_base and ck_col_ban and ban_list is not None
+                        else None,
+                        na_list=(list(NONE_LIST) if na_list is None else list(map(str, na_list)))
+                        if ck_col_base and ck_col_na else None,
+                        ck_type=ck_col_type, exp_type=exp_type, rm_first=rm_first, ck_num_range=ck_col_num_range,
+                        min_num=col_min_num, max_num=col_max_num,
+                        ban_num=(ban_num if isinstance(ban_num, list) else [ban_num, ])
+                        if ck_col_num_ban and ban_num is not None else None,
+                        ck_standard=ck_col_standard)
+            sig = json.dumps(opts, sort_keys=True, default=str)
+            opts["ban_num_raw"] = ban_num
+            len_opts = dict(ck_length=ck_col_base and ck_col_length, length=col_length,
+                            ck_length_range=ck_col_base and ck_col_length_range, min_len=col_min_len,
+                            max_len=col_max_len)
+            state_dir = self._ckpt_dir(state_dir)
+            if _compress_type(self.in_file):  # 压缩文件无法按字节偏移续读
+                state = self._ckpt_new(sig)
+                with _open_bin(self.in_file) as fileBIN:
+                    reader = codecs.getreader('UTF-8')(fileBIN)
+                    for lines in iter(lambda: list(itertools.islice(reader, 100000)), []):
+                        self._ckpt_feed(state, lines, opts)
+                error_list = self._ckpt_msgs(state, opts, len_opts)
+                return error_list if error_list else 0
+            state = self._ckpt_new(sig) if reset else self._ckpt_load(state_dir, sig)
+            offset, rest = state["offset"], b""
+            with open(self.in_file, "rb") as fileIN:
+                fileIN.seek(offset)
+                for block in iter(lambda: fileIN.read(CHECKPOINT_BLOCK), b""):
+                    block = rest + block
+                    cut = block.rfind(b"\n") + 1  # 仅完整行计入状态
+                    rest = block[cut:]
+                    if cut:
+                        self._ckpt_feed(state, block[:cut].decode("UTF-8").splitlines(True), opts)
+                        state["offset"] += cut
+                    if state["stopped"]:
+                        rest = b""
+                        break
+            if state["offset"] != offset or reset or state["gen"] == 0:
+                state["anchor"] = self._ckpt_anchor(state["offset"])
+                self._ckpt_save(state, state_dir)
+            if rest:
+                state = copy.deepcopy(state)
+                self._ckpt_feed(state, rest.decode("UTF-8").splitlines(True), opts)
+            error_list = self._ckpt_msgs(state, opts, len_opts)
+            return error_list if error_list else 0
+        except Exception as e:
+            print(e) if not self.no_log else 1
+            return [f"{self.add_info}{self._e['check_incremental']}", ]
+
+    def _sample_chunks(self, blocks: int, block_size: int, seed: int = None):
+        """
+        读取首行及随机行对齐数据块：普通文件随机定位K个数据块并读取末尾数据块（重叠块合并，块首尾不完整行舍弃），
+        压缩文件无法定位，读取首行后连续K个数据块（未到文件末尾时舍弃末尾不完整行）；连续读取的数据按行对齐
+        切分为约block_size的数据块，各数据块作为置信区间计算的群
+        :return: (首行字节, 数据块字节列表, 是否随机定位, 首行后字节数（压缩文件为None）)
+        """
+        with _open_bin(self.in_file) as fileIN:
+            header = fileIN.readline()
+            if _compress_type(self.in_file):
+                parts, need = [], blocks * block_size
+                while need > 0:  # 流式解压单次读取可能不足，读满或到文件末尾为止
+                    part = fileIN.read(need)
+                    if not part:
+                        break
+                    parts.append(part)
+                    need -= len(part)
+                data = b"".join(parts)
+                if need <= 0:  # 未到文件末尾
+                    data = data[:data.rfind(b"\n") + 1]
+                return header, _split_lines(data, block_size), False, None
+            start, size = len(header), os.path.getsize(self.in_file)
+            if size - start <= (blocks + 1) * block_size:  # 小文件全部读取
+                return header, _split_lines(fileIN.read(), block_size), True, size - start
+            rng = random.Random(seed)
+            offsets = sorted(rng.sample(range(start + 1, size - block_size), blocks)) + [size - block_size, ]
+            spans = []
+            for i in offsets:
+                if spans and i <= spans[-1][1]:
+                    spans[-1][1] = max(spans[-1][1], i + block_size)
+                else:
+                    spans.append([i, i + block_size])
+            chunks = []
+            for begin, end in spans:
+                fileIN.seek(begin - 1)  # 多读1字节，前一字节为换行符时首行完整
+                data = fileIN.read(end - begin + 1)
+                data = data[data.find(b"\n") + 1:]
+                chunks.append(data if end == size else data[:data.rfind(b"\n") + 1])
+            return header, chunks, True, size - start
+
+    def check_sample(self, blocks: int = SAMPLE_BLOCKS, block_size: int = SAMPLE_BLOCK_SIZE, seed: int = None,
+                     confidence=0.95, rm_blank=True, fill_null=False, null_list=None,
+                     ck_sep=True, sep_r=r'\t', ck_row_dup=True, ck_row_na=True, row_fix_content: list = None,
+                     ck_col_na=True, na_list: list = None, ck_col_type=True, exp_type='float',
+                     ck_col_num_range=False, col_min_num=float('-inf'), col_max_num=float('inf')):
+        """
+        大文件抽样快速预检：首行（标题行）精确检查，其余按随机行对齐数据块抽样检查，报告各项不合格率估计及
+        置信区间（数据块为群，按设计效应校正的Wilson区间，见_cluster_wilson）；抽样行中的空白行/空行直接跳过，
+        首行视为标题行不参与列检查
+        :param blocks: 正整数，随机数据块个数，默认SAMPLE_BLOCKS
+        :param block_size: 正整数，数据块字节数，默认SAMPLE_BLOCK_SIZE
+        :param seed: 整数，随机种子，None表示不固定
+        :param confidence: 浮点数，置信水平，默认0.95
+        :param ck_sep: 布尔值，是否检查分隔符规范（首行精确，其余抽样），默认True
+        :param ck_row_dup: 布尔值，是否精确检查首行重复，默认True
+        :param ck_row_na: 布尔值，是否精确检查首行缺失，默认True
+        :param row_fix_content: 字符串/字符串列表，首行期望固定内容，精确检查，None表示不检查
+        :param ck_col_na: 布尔值，是否抽样检查各列缺失，默认True
+        :param ck_col_type: 布尔值，是否抽样检查各列元素类型，默认True
+        :param exp_type: 字符串，期望列元素类型，限定为"float"/"int"，默认"float"
+        :param ck_col_num_range: 布尔值，是否抽样检查各列数值范围（仅类型正确的元素），默认False
+        :return: 有序字典{"errors": 首行精确检查报错信息列表或0, "rows": 抽样行数, "est_rows": 估计总行数,
+            "seek": 是否随机定位（压缩文件为False，仅抽取开头部分）, "sep"/"col_num": 分隔符不规范行/列数与首行不一致行
+            的统计, "na"/"type"/"num_range": {列号: 统计}}，统计为{"fail": 不合格数, "n": 检查数, "rate": 不合格率,
+            "low": 置信下限, "high": 置信上限, "deff": 数据块整群抽样的设计效应}，其余参数同check_content，
+            错误返回None
+        """
+        print(__name__, self._c, _name()) if not self.no_log else 1
+        try:
+            if isinstance(null_list, str):
+                null_list = [null_list, ]
+            null_set = set(NONE_LIST if null_list is None else null_list)
+            if isinstance(na_list, str):
+                na_list = [na_list, ]
+            na_set = set(map(str, NONE_LIST if na_list is None else na_list))
+            if ck_col_type and exp_type.lower() not in ("float", "int"):
+                raise ValueError(f"exp_type {exp_type} not supported")
+            z = NormalDist().inv_cdf((1 + confidence) / 2)
+            header, chunks, seek, body_size = self._sample_chunks(blocks, block_size, seed)
+            header_line = header.decode("UTF-8").rstrip('\r\n')
+
+            def _split(line):
+                line_list = line.split(self.sep)
+                line_list = [x.strip() for x in line_list] if rm_blank else line_list
+                return ["NA" if x in null_set else x for x in line_list] if fill_null else line_list
+
+            def _stat(pairs):
+                fail, n = sum(i[0] for i in pairs), sum(i[1] for i in pairs)
+                low, high, deff = _cluster_wilson(pairs, z)
+                return OrderedDict(fail=fail, n=n, rate=round(fail / n, 6) if n else 0.0, low=round(low, 6),
+                                   high=round(high, 6), deff=round(deff, 6))
+
+            error_list = []
+            head_list = _split(header_line)
+            if ck_sep:
+                err_msg = self.line_sep(header_line, sep_r=sep_r)
+                if err_msg:
+                    error_list.append(f"{self.add_info}{self._e['输入']}{self.__name}{self._e['第']}1"
+                                      f"{self._e['行']}{_wrap(err_msg, self_cut=False)}")
+            base_opts = dict(ck_length=False, length=None, ck_length_range=False, min_len=0, max_len=float('inf'),
+                             ck_dup=ck_row_dup, ck_ban=False, ban_list=None, ck_na=ck_row_na, na_list=na_list)
+            error_list.extend(self._line_msgs(self._e['行号'], 1, _list_base_msgs(head_list, self.lang, base_opts)))
+            if row_fix_content is not None:
+                error_list.extend(self.check_line_fix(rm_blank=rm_blank, fill_null=fill_null, null_list=null_list,
+                                                      ck_col_fix=False, row_fix_content=row_fix_content) or [])
+            ncols = len(head_list)
+            any_pat = _line_sep_pats(sep_r)[0]
+            conv = eval(exp_type.lower())
+            rows, n_bytes, sep_pairs, num_pairs = 0, 0, [], []
+            pairs = {key: [[] for _ in range(ncols)] for key in ("na", "type", "num_range")}  # 各列各数据块统计
+            for chunk in chunks:
+                n_bytes += len(chunk)
+                chunk_rows, sep_fail, num_fail = 0, 0, 0
+                counts = {key: [[0, 0] for _ in range(ncols)] for key in pairs}
+                for line in chunk.decode("UTF-8", "replace").splitlines():
+                    if not line or line.isspace():
+                        continue
+                    chunk_rows += 1
+                    sep_fail += 1 if ck_sep and any_pat.search(line) else 0
+                    line_list = _split(line)
+                    num_fail += 1 if len(line_list) != ncols else 0
+                    for i, x in enumerate(line_list[:ncols]):
+                        if ck_col_na:
+                            counts["na"][i][0] += x in na_set
+                            counts["na"][i][1] += 1
+                        if not ck_col_type:
+                            continue
+                        counts["type"][i][1] += 1
+                        try:
+                            num = conv(x)
+                        except ValueError:
+                            counts["type"][i][0] += 1
+                            continue
+                        if ck_col_num_range:
+                            counts["num_range"][i][0] += not (col_min_num <= num <= col_max_num)
+                            counts["num_range"][i][1] += 1
+                rows += chunk_rows
+                sep_pairs.append((sep_fail, chunk_rows))
+                num_pairs.append((num_fail, chunk_rows))
+                for key in pairs:
+                    for i in range(ncols):
+                        pairs[key][i].append(tuple(counts[key][i]))
+            report = OrderedDict()
+            report["errors"] = error_list if error_list else 0
+            report["rows"] = rows
+            report["est_rows"] = 1 + round(body_size / n_bytes * rows) if body_size is not None and n_bytes else None
+            report["seek"] = seek
+            report["sep"] = _stat(sep_pairs if ck_sep else [])
+            report["col_num"] = _stat(num_pairs)
+            for key, flag in (("na", ck_col_na), ("type", ck_col_type), ("num_range", ck_col_type and ck_col_num_range)):
+                if flag:
+                    report[key] = OrderedDict((i + 1, _stat(pairs[key][i])) for i in range(ncols))
+            return report
+        except Exception as e:
+            print(e) if not self.no_log else 1
+
     def get_row2list(self, row_no=1, rm_blank=True, fill_null=False, null_list: list = None):
         """
         获取文件指定一行的元素列表，并默认移除元素前后空白，默认第一行
@@ -1198,36 +2666,50 @@ class File(object):
 
     check_heading = check_line_fix
 
-    def pre_check_content(self, out_dir, new_file=None, encoding="utf-8", rm_space: bool = True):
+    def pre_check_content(self, out_dir, new_file=None, encoding="utf-8", rm_space: bool = True,
+                          out_compress: str = None, sidecar: bool = False):
         """
         文件详细内容检查预处理，自动消除BOM，注意new_file与in_file为同一文件时，处理后将会替换旧文件，已内置于check_file_content
         :param out_dir: 字符串，处理后对象输出目录，推荐os.path.join(args.outdir,"tmp/analysis")
-        :param new_file: 字符串，处理后对象名，将保存到out_dir目录下,默认与原文件同名
+        :param new_file: 字符串，处理后对象名，将保存到out_dir目录下,默认与原文件同名（压缩输入默认去除压缩后缀）
         :param encoding: 字符串，输入及输出文件编码格式，不区分大小写,默认utf-8，不推荐修改
         :param rm_space: 布尔值，是否去除元素前后空格，影响检查速度，默认True
+        :param out_compress: 字符串，处理后对象压缩格式，限定为"gzip"/"bgzip"/"zstd"，None表示不压缩，默认None
+        :param sidecar: 布尔值，是否将处理后表格保存为new_file的列式缓存（new_file + ".sidecar"，仅供下游读取），默认False
         :return: 正常返回0，异常返回字符串报错信息
         """
         print(__name__, self._c, _name()) if not self.no_log else 1
+        plain_file = None
         try:
             encoding = encoding.lower()
+            in_compress = _compress_type(self.in_file)
             if new_file is None:
-                new_file = os.path.join(os.path.abspath(out_dir), self.__name)
+                new_name = _strip_compress_suffix(self.__name)
+                new_name += COMPRESS_SUFFIX[out_compress] if out_compress else ""
+                new_file = os.path.join(os.path.abspath(out_dir), new_name)
             else:
                 new_file = os.path.join(os.path.abspath(out_dir), os.path.basename(new_file))
-            if self.in_file == new_file:  # 去空白行
-                cmd = f'sed -i "/^\s*$/d" {new_file}'
-            else:
-                cmd = f'mkdir -p {out_dir} && cp {self.in_file} {new_file} && sed -i "/^\s*$/d" {new_file}'
-            if platform.system() == "Linux":
-                print(cmd) if not self.no_log else 1
-                os.system(cmd)
+            if in_compress or out_compress:  # 去空白行后写入out_dir下临时文件，不改动输入文件
+                os.makedirs(out_dir, exist_ok=True)
+                fd, plain_file = tempfile.mkstemp(dir=out_dir, suffix=".tmp")
+                with _open_bin(self.in_file) as fileIN, os.fdopen(fd, "wb") as fileOUT:
+                    fileOUT.writelines(line for line in fileIN if line.strip())
             else:
-                logging.warning("Test in linux env, otherwise blank lines will not be removed !")
-                if self.in_file != new_file:
-                    cmd = f'mkdir {out_dir} && copy {self.in_file} {new_file}'
+                plain_file = new_file
+                if self.in_file == new_file:  # 去空白行
+                    cmd = f'sed -i "/^\s*$/d" {new_file}'
+                else:
+                    cmd = f'mkdir -p {out_dir} && cp {self.in_file} {new_file} && sed -i "/^\s*$/d" {new_file}'
+                if platform.system() == "Linux":
                     print(cmd) if not self.no_log else 1
                     os.system(cmd)
-            df = pd.read_csv(new_file, sep=self.sep, header=None, na_filter=False, encoding=encoding,
+                else:
+                    logging.warning("Test in linux env, otherwise blank lines will not be removed !")
+                    if self.in_file != new_file:
+                        cmd = f'mkdir {out_dir} && copy {self.in_file} {new_file}'
+                        print(cmd) if not self.no_log else 1
+                        os.system(cmd)
+            df = pd.read_csv(plain_file, sep=self.sep, header=None, na_filter=False, encoding=encoding,
                              na_values="", dtype='str', keep_default_na=False)
             df.columns = list(map(str, df.columns.tolist()))
             if rm_space:
@@ -1235,7 +2717,17 @@ class File(object):
                 df.columns = df_col
                 for col in df_col:
                     df.loc[:, col] = df[col].str.strip()
-            df.to_csv(new_file, sep=self.sep, index=0, header=None, quotechar=self.sep)
+            if not out_compress:
+                df.to_csv(new_file, sep=self.sep, index=0, header=None, quotechar=self.sep)
+            elif out_compress == "bgzip" and shutil.which("bgzip"):
+                df.to_csv(plain_file, sep=self.sep, index=0, header=None, quotechar=self.sep)
+                os.system(f"bgzip -f -@ {DECOMPRESS_THREADS} -c {plain_file} > {new_file}")
+            else:
+                compression = "gzip" if out_compress in ("gzip", "bgzip") else out_compress
+                df.to_csv(new_file, sep=self.sep, index=0, header=None, quotechar=self.sep,
+                          compression=compression)
+            if sidecar:
+                File(new_file, sep=self.sep, no_log=self.no_log, lang=self.lang)._write_sidecar(df)
         except pd.errors.ParserError as e:
             print(e) if not self.no_log else 1
             list1 = str(e).strip().split(' ')
@@ -1249,6 +2741,9 @@ class File(object):
             return f"{self.add_info}{self._e['pre_check_content']}"
         else:
             return 0
+        finally:
+            if plain_file is not None and plain_file != new_file and os.path.exists(plain_file):
+                os.remove(plain_file)  # 删除临时文件
 
     def check_content(self, out_dir, new_file=None, pre_check=True, rm_space: bool = True,
                       rm_blank=True, fill_null=False, null_list=None,
@@ -1271,7 +2766,10 @@ class File(object):
                       col_min_num=float('-inf'), col_max_num=float('inf'),
                       ck_row_num_ban=True, ck_col_num_ban=True, ban_num: list = None,
                       ck_row_standard=False, ck_col_standard=False, ck_standard_list: _list = None,
-                      com_col_row_mum=True, row_greater: bool = None, contain_equal=True):
+                      com_col_row_mum=True, row_greater: bool = None, contain_equal=True, workers: int = None,
+                      row_shards: int = None, out_compress: str = None, sidecar: bool = False,
+                      fail_fast=False, max_errors: int = None, max_show: int = None, sketch=False, matrix=False,
+                      infer_type=False):
         """
         文件详细内容检查，注意new_file与in_file为同一文件时，处理后将会替换旧文件，后续检查及程序应使用new_file替代in_file传参
         :param out_dir: 字符串，处理后对象输出目录，推荐os.path.join(args.outdir,"tmp/analysis")
@@ -1344,29 +2842,60 @@ class File(object):
         :param com_col_row_mum: 布尔值，是否比较的行列数维度关系，默认False
         :param row_greater: 布尔值，是否行数更多，None表示不检查，忽视com_col_row_mum
         :param contain_equal: 布尔值，比较的行列数维度关系时，是否含等号，作为row_greater参数补充,默认为True
+        :param workers: 正整数，列基础检查及列类型检查的进程数，多列分批单次读取后每列元素列表均序列化传至子进程，
+            单次调用内复用同一进程池，None或1表示串行逐列检查，默认None
+        :param row_shards: 正整数，全部行（ck_row_list/ck_row_type_list为None/0/-1）基础及类型检查的多进程分片数，
+            None或1表示串行逐行检查，默认None
+        :param out_compress: 字符串，预处理后对象压缩格式，限定为"gzip"/"bgzip"/"zstd"，None表示不压缩，默认None
+        :param sidecar: 布尔值，是否保存new_file的列式缓存供下游读取（见save_sidecar），本次及后续检查不读取缓存，默认False
+        :param fail_fast: 布尔值，是否在首条报错后立即结束检查，等同max_errors=1，默认False
+        :param max_errors: 非负整数，报错信息条数上限，达到后结束其余检查，单条行/列报错中的元素也最多展示该数目，
+            0同1（即fail_fast），None表示不限制，默认None
+        :param max_show: 正整数，重复行及行/列重复、数值禁用报错中最多展示的元素/位置个数，超出时追加总数，None表示全部展示，默认None
+        :param sketch: 布尔值，列重复检查是否以固定内存方式（布隆过滤器筛选后精确确认，见List）进行，结果不变，默认False
+        :param matrix: 布尔值，全部行/列（ck_row_type_list/ck_col_type_list为None/0/-1）类型检查及标准化检查是否单次读取全表，
+            整体转换为数值矩阵后按行/列检查，结果不变，要求rm_blank=True、exp_type为float/int且各行元素个数一致，否则自动回退，默认False
+        :param infer_type: 布尔值，列类型检查是否以列类型推断结果（见infer_types，缓存于File）查表，exp_type为float/int时
+            类型不符的列直接由首个反例报错，无需再读取；需确认数值范围/禁用值的列仍读取检查，结果不变，默认False
         :return: 符合期望返回0，不符合返回报错信息列表
         """
         print(__name__, self._c, _name()) if not self.no_log else 1
+        max_errors = 1 if fail_fast or max_errors == 0 else max_errors
+        pool = ProcessPoolExecutor(max_workers=workers) if workers and workers > 1 else None  # 首次提交时才创建子进程
         try:
-            error_list = []
+            error_list = _ErrorBudget(max_errors) if max_errors is not None else []
+            batch_size = 1 if pool is None else workers * 4
             if new_file is None:
-                new_file = os.path.join(os.path.abspath(out_dir), self.__name)
+                new_name = _strip_compress_suffix(self.__name) if pre_check else self.__name
+                new_name += COMPRESS_SUFFIX[out_compress] if pre_check and out_compress else ""
+                new_file = os.path.join(os.path.abspath(out_dir), new_name)
             else:
                 new_file = os.path.join(os.path.abspath(out_dir), os.path.basename(new_file))
                 # new_file = os.path.join(os.path.dirname(os.path.abspath(in_file)), os.path.basename(new_file))  # 同路径
             if pre_check:
                 err_msg = self.pre_check_content(out_dir=out_dir, new_file=new_file, encoding='utf-8',
-                                                 rm_space=rm_space)
+                                                 rm_space=rm_space, out_compress=out_compress, sidecar=sidecar)
                 if err_msg:
                     error_list.append(f"{self._e['输入']}{self.__name}:{err_msg}")
-                    return error_list
+                    return list(error_list)
             self.in_file = new_file  # 分隔符检查前，需确保使用去除空行及元素前后空白的新文件
+            if sidecar and not pre_check:
+                self.save_sidecar()
             row_number = self.get_row_num()
             col_number = self.get_col_num()
             if ck_sep:
+                sep_lines, read_rows = {}, set()
+                for line_no, line, kinds in self._iter_sep_lines(sep_r):  # 单次读取，仅不规范行生成报错信息
+                    read_rows.add(line_no)
+                    if kinds:
+                        sep_lines[line_no] = line
                 for row in range(1, row_number + 1):
-                    in_line = self.get_row_line(line_num=row)
-                    err_msg = self.line_sep(in_line, sep_r=sep_r)
+                    if row in sep_lines:
+                        err_msg = self.line_sep(sep_lines[row], sep_r=sep_r)
+                    elif row not in read_rows:  # 空白行/空行后未读取的行，同逐行读取结果
+                        err_msg = self.line_sep(None, sep_r=sep_r)
+                    else:
+                        continue
                     if err_msg:
                         error_list.append(f"{self.add_info}{self._e['输入']}{self.__name}{self._e['第']}{row}"
                                           f"{self._e['行']}{_wrap(err_msg, self_cut=False)}")
@@ -1377,11 +2906,11 @@ class File(object):
                     msg = f"{self.add_info}{self._e['输入']}{self.__name}{self._e['首行要求']}"
                     error_list.append(msg)
             if ck_line_dup:
-                err_msg = self.line_dup()
+                err_msg = self.line_dup(max_show=max_show)
                 if err_msg:
                     error_list.append(f"{_wrap(err_msg, self_cut=False)}")
             if error_list:  # 维度检查前需确保分隔符正确
-                return error_list
+                return list(error_list)
             col1 = self.get_col2list(col_no=1, rm_blank=rm_blank, fill_null=fill_null, null_list=null_list)
             row1 = self.get_row2list(row_no=1, rm_blank=rm_blank, fill_null=fill_null, null_list=null_list)
             if ck_row_num and row_num_exp is not None:
@@ -1417,7 +2946,22 @@ class File(object):
                     error_list.append(f"{self.add_info}{self._e['输入']}{self.__name}{self._e['列数范围有误']}"
                                       f"{_wrap(err_msg, self_cut=False)}")
             if error_list:  # 行列内容检查前需确保维度正确
-                return error_list
+                return list(error_list)
+            row_shards = row_shards if row_shards and row_shards > 1 else None
+            shard_base = row_shards and ck_row_base and (ck_row_list is None or ck_row_list in (0, -1))
+            shard_type = row_shards and ck_row_type and (ck_row_type_list is None or ck_row_type_list in (0, -1))
+            row_base_opts = dict(ck_length=ck_row_length, length=row_length, ck_length_range=ck_row_length_range,
+                                 min_len=row_min_len, max_len=row_max_len, ck_dup=ck_row_dup,
+                                 ck_ban=ck_row_ban, ban_list=ban_list, ck_na=ck_row_na, na_list=na_list,
+                                 max_errors=max_errors, max_show=max_show)
+            row_type_opts = dict(rm_first=rm_first, exp_type=exp_type, ck_num_range=ck_row_num_range,
+                                 min_num=row_min_num, max_num=row_max_num, ck_num_ban=ck_row_num_ban, ban_num=ban_num,
+                                 max_errors=max_errors, max_show=max_show)
+            row_flags = None
+            if shard_base or shard_type:
+                row_flags = self._shard_row_flags(row_shards, rm_blank, fill_null, null_list,
+                                                  base_opts=row_base_opts if shard_base else None,
+                                                  type_opts=row_type_opts if shard_type else None)
             if ck_row_base:
                 if ck_row_list == -1:
                     ck_row_list = range(2, row_number + 1)
@@ -1425,42 +2969,22 @@ class File(object):
                     ck_row_list = range(1, row_number + 1)
                 if isinstance(ck_row_list, int):
                     ck_row_list = [ck_row_list, ]
-                for row in ck_row_list:
+                base_opts = row_base_opts
+                base_mask = ROW_FLAG["length"] | ROW_FLAG["dup"] | ROW_FLAG["ban"] | ROW_FLAG["na"]
+                picked = self._shard_rows(row_flags, list(ck_row_list), base_mask, rm_blank, fill_null,
+                                          null_list) if shard_base else None
+                for row, in_list in picked.items() if picked is not None else []:
+                    tagged = _list_base_msgs(in_list, self.lang, base_opts)
+                    error_list.extend(self._line_msgs(self._e['行号'], row, tagged))
+                for row in ck_row_list if picked is None else []:
                     if isinstance(row, int):
                         in_list = self.get_row2list(row_no=row, rm_blank=rm_blank, fill_null=fill_null,
                                                     null_list=null_list)
                     else:
                         in_list = self.get_namerow2list(name=row, rm_blank=rm_blank, fill_null=fill_null,
                                                         null_list=null_list)
-                    ob_list = List(in_list=in_list, no_log=True, lang=self.lang)
-                    if ck_row_length and row_length is not None:
-                        err_msg = ob_list.length(exp_len=row_length)
-                        if err_msg:
-                            error_list.append(f"{self.add_info}{self._e['输入']}{self.__name}{self._e['行号']}{row}"
-                                              f"{_wrap(err_msg, self_cut=False)}")
-                    elif not ck_row_length and ck_row_length_range:
-                        err_msg = ob_list.range(
-                            min_len=row_min_len, max_len=row_max_len)
-                        if err_msg:
-                            error_list.append(f"{self.add_info}{self._e['输入']}{self.__name}{self._e['行号']}{row}"
-                                              f"{_wrap(err_msg, self_cut=False)}")
-                    if ck_row_dup:
-                        err_msg = ob_list.dup()
-                        if err_msg:
-                            error_list.append(
-                                f"{self.add_info}{self._e['输入']}{self.__name}{self._e['行号']}{row}{self._e['有重复']}"
-                                f"{_wrap(err_msg, self_cut=False)}{self._e['要无重']}")
-                    if ck_row_ban and ban_list is not None:
-                        err_msg = ob_list.ban(ban_list=ban_list)
-                        if err_msg:
-                            error_list.append(f"{self.add_info}{self._e['输入']}{self.__name}{self._e['行号']}{row}"
-                                              f"{self._e['有非法']}{_wrap(err_msg, self_cut=False)}")
-                    if ck_row_na:
-                        err_msg = ob_list.na(na_list=na_list)
-                        if err_msg:
-                            err_msg += f"{self._e['表格检查']}"
-                            error_list.append(f"{self.add_info}{self._e['输入']}{self.__name}{self._e['行号']}{row}"
-                                              f"{_wrap(err_msg, self_cut=False)}")
+                    tagged = _list_base_msgs(in_list, self.lang, base_opts)
+                    error_list.extend(self._line_msgs(self._e['行号'], row, tagged))
             if ck_col_base:
                 if ck_col_list == -1:
                     ck_col_list = range(2, col_number + 1)
@@ -1468,41 +2992,14 @@ class File(object):
                     ck_col_list = range(1, col_number + 1)
                 if isinstance(ck_col_list, int):
                     ck_col_list = [ck_col_list, ]
-                for col in ck_col_list:
-                    if isinstance(col, int):
-                        in_list = self.get_col2list(col_no=col, rm_blank=rm_blank, fill_null=fill_null,
-                                                    null_list=null_list)
-                    else:
-                        in_list = self.get_namecol2list(name=col, rm_blank=rm_blank, fill_null=fill_null,
-                                                        null_list=null_list)
-                    ob_list = List(in_list=in_list, no_log=True, lang=self.lang)
-                    if ck_col_length and col_length is not None:
-                        err_msg = ob_list.length(exp_len=col_length)
-                        if err_msg:
-                            error_list.append(f"{self.add_info}{self._e['输入']}{self.__name}{self._e['列号']}{col}"
-                                              f"{_wrap(err_msg, self_cut=False)}")
-                    elif not ck_col_length and ck_col_length_range:
-                        err_msg = ob_list.range(
-                            min_len=col_min_len, max_len=col_max_len)
-                        if err_msg:
-                            error_list.append(f"{self.add_info}{self._e['输入']}{self.__name}{self._e['列号']}{col}"
-                                              f"{_wrap(err_msg, self_cut=False)}")
-                    if ck_col_dup:
-                        err_msg = ob_list.dup()
-                        if err_msg:
-                            error_list.append(f"{self.add_info}{self._e['输入']}{self.__name}{self._e['列号']}{col}"
-                                              f"{self._e['有重复']}{_wrap(err_msg, self_cut=False)}{self._e['要无重']}")
-                    if ck_col_ban and ban_list is not None:
-                        err_msg = ob_list.ban(ban_list=ban_list)
-                        if err_msg:
-                            error_list.append(f"{self.add_info}{self._e['输入']}{self.__name}{self._e['列号']}{col}"
-                                              f"{self._e['有非法']}{_wrap(err_msg, self_cut=False)}")
-                    if ck_col_na:
-                        err_msg = ob_list.na(na_list=na_list)
-                        if err_msg:
-                            err_msg += f"{self._e['表格检查']}"
-                            error_list.append(f"{self.add_info}{self._e['输入']}{self.__name}{self._e['列号']}{col}"
-                                              f"{_wrap(err_msg, self_cut=False)}")
+                base_opts = dict(ck_length=ck_col_length, length=col_length, ck_length_range=ck_col_length_range,
+                                 min_len=col_min_len, max_len=col_max_len, ck_dup=ck_col_dup,
+                                 ck_ban=ck_col_ban, ban_list=ban_list, ck_na=ck_col_na, na_list=na_list,
+                                 max_errors=max_errors, max_show=max_show, sketch=sketch)
+                for batch, col_lists in self._iter_col_batch(ck_col_list, batch_size, rm_blank, fill_null, null_list):
+                    res_list = _map_jobs(_list_base_msgs, [(x, self.lang, base_opts) for x in col_lists], pool=pool)
+                    for col, tagged in zip(batch, res_list):
+                        error_list.extend(self._line_msgs(self._e['列号'], col, tagged))
             if ck_row_fix and row_fix_content is not None:
                 in_list = self.get_row2list(
                     row_no=row_fix_no, rm_blank=rm_blank, fill_null=fill_null, null_list=null_list)
@@ -1548,8 +3045,14 @@ class File(object):
                               f"{self._e['实际为']}{in_title}{self._e['请检查']}"
                     error_list.append(err_msg)
             if error_list:  # (新增按行列名取行/列)确保行列内容检查前需确保行列名存在
-                return error_list
-            row_flag = []
+                return list(error_list)
+            full_row_type = ck_row_type and (ck_row_type_list is None or ck_row_type_list in (0, -1))
+            full_col_type = ck_col_type and (ck_col_type_list is None or ck_col_type_list in (0, -1))
+            mat = None
+            if matrix and rm_blank and exp_type in ('float', 'int') and (full_row_type or full_col_type):
+                mat = self._numeric_matrix(rm_blank, fill_null, null_list, exp_type)
+                mat = mat if mat is not None and mat[0].shape == (row_number, col_number) else None
+            row_flag, row_const = [], {}  # 类型检查同时记录各行/列是否为常量，标准化检查直接查表
             if ck_row_type:
                 if ck_row_type_list == -1:
                     ck_row_type_list = list(range(2, row_number + 1))
@@ -1557,32 +3060,36 @@ class File(object):
                     ck_row_type_list = list(range(1, row_number + 1))
                 if isinstance(ck_row_type_list, int):
                     ck_row_type_list = [ck_row_type_list, ]
-                for row in ck_row_type_list:
+                type_opts = row_type_opts
+                type_mask = ROW_FLAG["type"] | ROW_FLAG["num_range"] | ROW_FLAG["num_ban"]
+                matrix_rows = mat is not None and full_row_type
+                picked = self._shard_rows(row_flags, ck_row_type_list, type_mask, rm_blank, fill_null,
+                                          null_list) if shard_type and not matrix_rows else None
+                for row in ck_row_type_list if matrix_rows else []:
+                    tagged, is_num, row_const[row] = _array_type_msgs(*(i[row - 1, int(rm_first):] for i in mat),
+                                                                      self.lang, type_opts)
+                    if is_num:
+                        row_flag.append(1)
+                    error_list.extend(self._line_msgs(self._e['行号'], row, tagged))
+                if picked is not None:
+                    if np.any(row_flags[np.asarray(ck_row_type_list) - 1] & ROW_NUM):
+                        row_flag.append(1)
+                    row_const.update((row, bool(row_flags[row - 1] & ROW_CONST)) for row in ck_row_type_list)
+                    for row, in_list in picked.items():
+                        tagged, is_num, _ = _list_type_msgs(in_list, self.lang, type_opts)
+                        error_list.extend(self._line_msgs(self._e['行号'], row, tagged))
+                for row in ck_row_type_list if picked is None and not matrix_rows else []:
                     if isinstance(row, int):
                         in_list = self.get_row2list(row_no=row, rm_blank=rm_blank, fill_null=fill_null,
                                                     null_list=null_list)
                     else:
                         in_list = self.get_namerow2list(name=row, rm_blank=rm_blank, fill_null=fill_null,
                                                         null_list=null_list)
-                    msg = List(in_list=in_list, rm_first=rm_first, no_log=True, lang=self.lang).type(exp_type=exp_type)
-                    if isinstance(msg, str):
-                        error_list.append(f"{self.add_info}{self._e['输入']}{self.__name}{self._e['行号']}{row}"
-                                          f"{_wrap(msg, self_cut=False)}")
-                    else:
-                        ob_list = List(in_list=msg, no_log=True, lang=self.lang)
-                        if exp_type in ['float', 'int']:
-                            row_flag.append(1)
-                        if ck_row_num_range:
-                            err_msg = ob_list.num_range(min_num=row_min_num, max_num=row_max_num)
-                            if err_msg:
-                                error_list.append(f"{self.add_info}{self._e['输入']}{self.__name}{self._e['行号']}{row} "
-                                                  f"{_wrap(err_msg, self_cut=False)}")
-                        if ck_row_num_ban and ban_num is not None:
-                            err_msg = ob_list.num_ban(ban_num=ban_num)
-                            if err_msg:
-                                error_list.append(f"{self.add_info}{self._e['输入']}{self.__name}{self._e['行号']}{row} "
-                                                  f"{_wrap(err_msg, self_cut=False)}")
-            col_flag = []
+                    tagged, is_num, row_const[row] = _list_type_msgs(in_list, self.lang, type_opts)
+                    if is_num:
+                        row_flag.append(1)
+                    error_list.extend(self._line_msgs(self._e['行号'], row, tagged))
+            col_flag, col_const = [], {}
             if ck_col_type:
                 if ck_col_type_list == -1:
                     ck_col_type_list = list(range(2, col_number + 1))
@@ -1590,31 +3097,34 @@ class File(object):
                     ck_col_type_list = list(range(1, col_number + 1))
                 if isinstance(ck_col_type_list, int) or isinstance(ck_col_type_list, str):
                     ck_col_type_list = [ck_col_type_list, ]
-                for col in ck_col_type_list:
-                    if isinstance(col, int):
-                        in_list = self.get_col2list(col_no=col, rm_blank=rm_blank, fill_null=fill_null,
-                                                    null_list=null_list)
-                    else:
-                        in_list = self.get_namecol2list(name=col, rm_blank=rm_blank, fill_null=fill_null,
-                                                        null_list=null_list)
-                    msg = List(in_list=in_list, rm_first=rm_first, no_log=True, lang=self.lang).type(exp_type=exp_type)
-                    if isinstance(msg, str):
-                        error_list.append(f"{self.add_info}{self._e['输入']}{self.__name}{self._e['列号']}{col}"
-                                          f"{_wrap(msg, self_cut=False)}")
-                    else:
-                        ob_list = List(in_list=msg, no_log=True, lang=self.lang)
-                        if exp_type in ['float', 'int']:
+                type_opts = dict(rm_first=rm_first, exp_type=exp_type, ck_num_range=ck_col_num_range,
+                                 min_num=col_min_num, max_num=col_max_num, ck_num_ban=ck_col_num_ban, ban_num=ban_num,
+                                 max_errors=max_errors, max_show=max_show)
+                matrix_cols = mat is not None and full_col_type
+                for col in ck_col_type_list if matrix_cols else []:
+                    tagged, is_num, col_const[col] = _array_type_msgs(*(i[int(rm_first):, col - 1] for i in mat),
+                                                                      self.lang, type_opts)
+                    if is_num:
+                        col_flag.append(1)
+                    error_list.extend(self._line_msgs(self._e['列号'], col, tagged))
+                col_res = self._infer_col_msgs(ck_col_type_list, type_opts, rm_blank, fill_null, null_list) \
+                    if infer_type and not matrix_cols else {}
+                col_batches = [] if matrix_cols else self._iter_col_batch(
+                    [x for x in ck_col_type_list if x not in col_res], batch_size, rm_blank, fill_null, null_list)
+                for batch, col_lists in col_batches:
+                    res_list = _map_jobs(_list_type_msgs, [(x, self.lang, type_opts) for x in col_lists], pool=pool)
+                    if col_res:  # 查表结果与读取检查结果按列顺序合并报错
+                        col_res.update(zip(batch, res_list))
+                        continue
+                    for col, (tagged, is_num, col_const[col]) in zip(batch, res_list):
+                        if is_num:
                             col_flag.append(1)
-                        if ck_col_num_range:
-                            err_msg = ob_list.num_range(min_num=col_min_num, max_num=col_max_num)
-                            if err_msg:
-                                error_list.append(f"{self.add_info}{self._e['输入']}{self.__name}{self._e['列号']}{col} "
-                                                  f"{_wrap(err_msg, self_cut=False)}")
-                        if ck_col_num_ban and ban_num is not None:
-                            err_msg = ob_list.num_ban(ban_num=ban_num)
-                            if err_msg:
-                                error_list.append(f"{self.add_info}{self._e['输入']}{self.__name}{self._e['列号']}{col} "
-                                                  f"{_wrap(err_msg, self_cut=False)}")
+                        error_list.extend(self._line_msgs(self._e['列号'], col, tagged))
+                for col in ck_col_type_list if col_res else []:
+                    tagged, is_num, col_const[col] = col_res[col]
+                    if is_num:
+                        col_flag.append(1)
+                    error_list.extend(self._line_msgs(self._e['列号'], col, tagged))
             if row_flag and ck_row_standard:
                 if ck_standard_list == -1:
                     ck_standard_list = list(range(2, row_number + 1))
@@ -1624,14 +3134,7 @@ class File(object):
                     ck_standard_list = [ck_standard_list, ]
                 if set(ck_standard_list).issubset(set(ck_row_type_list)):
                     for row in ck_standard_list:
-                        if isinstance(row, int):
-                            in_list = self.get_row2list(
-                                row_no=row, rm_blank=rm_blank, fill_null=fill_null, null_list=null_list)
-                        else:
-                            in_list = self.get_namerow2list(
-                                name=row, rm_blank=rm_blank, fill_null=fill_null, null_list=null_list)
-                        msg = List(in_list=in_list, rm_first=rm_first, no_log=True, lang=self.lang).factor(exp_num=1)
-                        if not msg:
+                        if row_const.get(row):
                             error_list.append(
                                 f"{self.add_info}{self._e['输入']}{self.__name}{self._e['行号']}{row}{self._e['行标准化要求']}")
             if col_flag and ck_col_standard:
@@ -1643,14 +3146,7 @@ class File(object):
                     ck_standard_list = [ck_standard_list, ]
                 if set(ck_standard_list).issubset(set(ck_col_type_list)):
                     for col in ck_standard_list:
-                        if isinstance(col, int):
-                            in_list = self.get_col2list(
-                                col_no=col, rm_blank=rm_blank, fill_null=fill_null, null_list=null_list)
-                        else:
-                            in_list = self.get_namecol2list(
-                                name=col, rm_blank=rm_blank, fill_null=fill_null, null_list=null_list)
-                        msg = List(in_list=in_list, rm_first=rm_first, no_log=True, lang=self.lang).factor(exp_num=1)
-                        if not msg:
+                        if col_const.get(col):
                             error_list.append(
                                 f"{self.add_info}{self._e['输入']}{self.__name}{self._e['列号']}{col}{self._e['列标准化要求']}")
             if com_col_row_mum and row_greater is not None:
@@ -1660,17 +3156,198 @@ class File(object):
             if len(error_list) == 0:
                 return 0
             else:
-                return error_list
+                return list(error_list)
+        except _BudgetReached:
+            return list(error_list)
         except Exception as e:
             print(e) if not self.no_log else 1
             return [f"{self.add_info}{self._e['check_content']}", ]
+        finally:
+            pool.shutdown(cancel_futures=True) if pool is not None else 1
+
+    def _infer_col_msgs(self, col_list: list, opts: dict, rm_blank=True, fill_null=False, null_list=None):
+        """
+        由列类型推断结果查表得出列类型检查结果，同_list_type_msgs，需读取元素确认数值范围/禁用值的列不在结果中
+        :param col_list: 列表，检查列号
+        :param opts: 字典，检查参数，同_list_type_msgs
+        :return: 有序字典{列号: ([(检查类型, 报错信息), ...], 是否为数值类型, 是否为常量)}
+        """
+        res = OrderedDict()
+        if opts["exp_type"] not in ('float', 'int'):
+            return res
+        info = self.infer_types(opts["rm_first"], rm_blank, fill_null, null_list) or {}
+        for col in col_list:
+            col_info = info.get(col) if isinstance(col, int) else None
+            if col_info is None or col_info["short"]:
+                continue  # 有行缺少该列时交由读取检查给出一致结果
+            bad = col_info["bad"][opts["exp_type"]]
+            if bad is not None:  # 同List.type，仅报首个转换失败元素
+                res[col] = [("type", List(in_list=[bad[1], ], no_log=True, lang=self.lang).type(
+                    exp_type=opts["exp_type"])), ], False, col_info["first"] is not None and not col_info["varies"]
+                continue
+            low, high = col_info["min"], col_info["max"]
+            in_range = not col_info["nan"] and (low is None or opts["min_num"] <= low and high <= opts["max_num"])
+            if (in_range or not opts["ck_num_range"]) and not (opts["ck_num_ban"] and opts["ban_num"] is not None):
+                res[col] = [], True, low is not None and low == high
+        return res
+
+    def _numeric_matrix(self, rm_blank=True, fill_null=False, null_list=None, exp_type='float'):
+        """
+        单次读取全表并整体转换为数值矩阵，供check_content(matrix=True)行/列类型及标准化检查，转换规则同List.type
+        :return: (元素二维数组（object）, 数值二维数组（float64）, 可转换二维布尔数组)，空文件或各行元素个数不一致时返回None
+        """
+        if isinstance(null_list, str):
+            null_list = [null_list, ]
+        if null_list is None:
+            null_list = list(NONE_LIST)
+        rows = [_split_row(line, self.sep, rm_blank, fill_null, null_list) for line, no in _read_line(self.in_file)]
+        if not rows or any(len(row) != len(rows[0]) for row in rows):
+            return None
+        values = np.empty((len(rows), len(rows[0])), dtype=object)
+        values[:] = rows
+        conv, dtype = (int, np.int64) if exp_type == 'int' else (float, np.float64)
+        ok = np.ones(values.shape, dtype=bool)
+        try:
+            nums = values.astype(dtype).astype(np.float64)
+        except (ValueError, OverflowError):  # 含无法转换元素时逐行转换，失败行再逐元素定位
+            nums = np.full(values.shape, np.nan)
+            for r in range(values.shape[0]):
+                try:
+                    nums[r] = values[r].astype(dtype)
+                except (ValueError, OverflowError):
+                    for c, x in enumerate(values[r]):
+                        try:
+                            nums[r, c] = float(conv(x))
+                        except ValueError:
+                            ok[r, c] = False
+        return values, nums, ok
+
+    def _line_msgs(self, dim, no, tagged: list):
+        """
+        将行/列检查结果格式化为报错信息列表
+        :param dim: 字符串，self._e['行号']或self._e['列号']
+        :param no: 正整数/字符串，行/列号或行/列名
+        :param tagged: 列表，[(检查类型, 报错信息), ...]
+        :return: 报错信息列表
+        """
+        head = f"{self.add_info}{self._e['输入']}{self.__name}{dim}{no}"
+        msg_list = []
+        for tag, err_msg in tagged:
+            if tag == "dup":
+                msg_list.append(f"{head}{self._e['有重复']}{_wrap(err_msg, self_cut=False)}{self._e['要无重']}")
+            elif tag == "ban":
+                msg_list.append(f"{head}{self._e['有非法']}{_wrap(err_msg, self_cut=False)}")
+            elif tag == "na":
+                msg_list.append(f"{head}{_wrap(err_msg + self._e['表格检查'], self_cut=False)}")
+            elif tag in ("num_range", "num_ban"):
+                msg_list.append(f"{head} {_wrap(err_msg, self_cut=False)}")
+            else:  # length/type
+                msg_list.append(f"{head}{_wrap(err_msg, self_cut=False)}")
+        return msg_list
+
+    def _iter_col_batch(self, col_list, batch_size=1, rm_blank=True, fill_null=False, null_list=None):
+        """
+        按批次获取多列元素列表，每批次单次读取文件
+        :param col_list: 正整数/列名列表，目标列
+        :param batch_size: 正整数，每批次列数，1表示逐列读取
+        :return: 生成器（列号/列名列表，元素列表的列表）
+        """
+        col_list = list(col_list)
+        header = None
+        for i in range(0, len(col_list), batch_size):
+            batch = col_list[i:i + batch_size]
+            if batch_size == 1:
+                col = batch[0]
+                if isinstance(col, int):
+                    in_list = self.get_col2list(col_no=col, rm_blank=rm_blank, fill_null=fill_null,
+                                                null_list=null_list)
+                else:
+                    in_list = self.get_namecol2list(name=col, rm_blank=rm_blank, fill_null=fill_null,
+                                                    null_list=null_list)
+                yield batch, [in_list, ]
+                continue
+            if header is None and not all(isinstance(col, int) for col in batch):
+                header = _row2list(self.in_file, self.sep, 1, rm_blank, fill_null, null_list)
+            col_nos = []
+            for col in batch:
+                if isinstance(col, int):
+                    col_nos.append(col)
+                else:
+                    col_nos.append(header.index(str(col)) + 1 if str(col) in header else None)
+            yield batch, _cols2lists(self.in_file, self.sep, col_nos, rm_blank, fill_null, null_list)
+
+    def _shard_row_flags(self, shards: int, rm_blank=True, fill_null=False, null_list=None,
+                         base_opts: dict = None, type_opts: dict = None):
+        """
+        按行边界将文件切分为字节区间，多进程检查全部行，汇总各行结果位
+        :param shards: 正整数，分片（进程）数
+        :return: 各行uint16结果位数组（下标+1为行号），失败返回None
+        """
+        try:
+            if _compress_type(self.in_file):  # 压缩文件无法按字节区间切分，回退串行
+                return None
+            if isinstance(null_list, str):
+                null_list = [null_list, ]
+            size = os.path.getsize(self.in_file)
+            bounds = [0, ]
+            with open(self.in_file, "rb") as fileIN:
+                for k in range(1, shards):
+                    fileIN.seek(max(size * k // shards, bounds[-1] + 1) - 1)
+                    fileIN.readline()  # 对齐至下一行行首
+                    pos = fileIN.tell()
+                    if bounds[-1] < pos < size:
+                        bounds.append(pos)
+            bounds.append(size)
+            jobs = [(self.in_file, start, end, self.sep, rm_blank, fill_null, null_list, self.lang, base_opts, type_opts)
+                    for start, end in zip(bounds[:-1], bounds[1:])]
+            parts = []
+            resource_tracker.ensure_running()  # 子进程共用父进程的共享内存登记，避免退出时误清理
+            with ProcessPoolExecutor(max_workers=len(jobs)) as pool:
+                for shm_name, line_num in pool.map(_row_shard_job, *zip(*jobs)):
+                    shm = shared_memory.SharedMemory(name=shm_name)
+                    try:
+                        parts.append(np.ndarray((line_num,), dtype=np.uint16, buffer=shm.buf).copy())
+                    finally:
+                        shm.close()
+                        shm.unlink()
+            return np.concatenate(parts) if parts else np.zeros(0, dtype=np.uint16)
+        except Exception as e:
+            print(e) if not self.no_log else 1
+            return None
+
+    def _shard_rows(self, flags, row_list, mask: int, rm_blank=True, fill_null=False, null_list=None):
+        """
+        根据分片结果位筛选待报错行，并单次读取文件获取这些行的元素列表
+        :param flags: 数组，_shard_row_flags结果，None表示分片失败
+        :param row_list: 正整数列表，检查行号
+        :param mask: 整数，需要报错的结果位
+        :return: 有序字典{行号: 元素列表}，结果位不可用（分片失败、含空白行或空行）时返回None
+        """
+        if flags is None or not row_list:
+            return None
+        stop = np.flatnonzero(flags & ROW_STOP)
+        valid_len = int(stop[0]) if len(stop) else len(flags)
+        rows = np.asarray(row_list, dtype=np.int64)
+        if rows.min() < 1 or rows.max() > valid_len or np.any(flags[rows - 1] & ROW_SKIP):
+            return None  # 交由逐行检查给出与串行一致的结果
+        bad_rows = set(rows[(flags[rows - 1] & mask) != 0].tolist())
+        picked = OrderedDict()
+        if bad_rows:
+            last_row = max(bad_rows)
+            for line, line_no in _read_line(self.in_file):
+                if line_no in bad_rows:
+                    picked[line_no] = _split_row(line, self.sep, rm_blank, fill_null,
+                                                 NONE_LIST if null_list is None else null_list)
+                if line_no >= last_row:
+                    break
+        return OrderedDict((row, picked[row]) for row in row_list if row in picked)
 
     def compare_line(self, in_file2,
                      file1_dim="row", file2_dim="row", file1_no=1, file2_no=1,
                      order_strict=False, rm_first=False, ck_1_in_2=False,
-                     rm_blank=True, fill_null=False, null_list=None, key='样本'):
+                     rm_blank=True, fill_null=False, null_list=None, key='样本', max_show: int = 100):
         """
-        对比两个文件某一行/列数据的差异
+        对比两个文件某一行/列数据的差异（两文件各单次读取，哈希索引比较）
         :param in_file2: 字符串，检查对象2,例如："D:\b.txt"
         :param file1_dim: 部分整数/字符串，文件1检查维度【取行/列】，可选[1, '1', 'row', '行'][2, '2', 'col', 'column', '列']
         :param file2_dim: 部分整数/字符串，文件2检查维度【取行/列】，可选[1, '1', 'row', '行'][2, '2', 'col', 'column', '列']
@@ -1683,15 +3360,14 @@ class File(object):
         :param fill_null: 布尔值，是否将缺失数据统一替换为NA，默认True
         :param null_list: 字符串列表，指定原数据表示缺失数据的符号，默认["", "NA", "N/A", "NULL"]
         :param key: 字符串，关键字信息，中文默认"样本"，英文默认" sample(s) "
+        :param max_show: 整数，报错信息中最多展示的不同元素个数，超出时仅追加总数，None表示全部展示，默认100
         :return: 符合期望返回0，不符合返回报错信息列表
-        print(__name__, self._c, _name()) if not self.no_log else 1
         """
         print(__name__, self._c, _name()) if not self.no_log else 1
         try:
             key = " sample(s) " if self.lang == "EN" and key == "样本" else key
-            row_options = [1, "1", "row", "行"]
-            col_options = [2, "2", "col", "column", "列"]
-            dim_options = row_options + col_options
+            row_options = ROW_OPTIONS
+            dim_options = ROW_OPTIONS + COL_OPTIONS
             if file1_dim not in dim_options:
                 print(f'文件1检查维度设置错误，重置为取行，仅接受{dim_options}')
                 file1_dim = 1
@@ -1717,7 +3393,7 @@ class File(object):
                                      fill_null=fill_null, null_list=null_list)
             in_list2 = in_list2[1:] if rm_first else in_list2
             msg = List(in_list=in_list1, key=key, rm_first=rm_first, no_log=self.no_log, lang=self.lang).compare(
-                list2=in_list2, order_strict=order_strict, ck_1_in_2=ck_1_in_2)
+                list2=in_list2, order_strict=order_strict, ck_1_in_2=ck_1_in_2, max_show=max_show)
             if msg != 0:
                 return [f'{self.add_info}{self.__name}{dim1}{file1_no} <-> {file2_name}{dim2}{file2_no}:{msg}', ]
             else:
@@ -1728,6 +3404,79 @@ class File(object):
 
     com_line = compare_line
 
+    def compare_lines(self, targets: list, file1_dim="row", file1_no=1,
+                      order_strict=False, rm_first=False, ck_1_in_2=False,
+                      rm_blank=True, fill_null=False, null_list=None, key='样本', max_show: int = 100,
+                      workers: int = 4, by_file=False):
+        """
+        对比本文件某一行/列与多个文件某一行/列数据的差异（本文件仅读取一次，目标文件并行读取）
+        :param targets: 列表，比较对象，元素为文件名，或(文件名, 维度, 行/列号)元组，未指定维度及行/列号时同file1_dim、file1_no
+        :param file1_dim: 部分整数/字符串，本文件检查维度【取行/列】，可选[1, '1', 'row', '行'][2, '2', 'col', 'column', '列']
+        :param file1_no: 正整数，本文件要检查的行/列号，默认1
+        :param order_strict: 布尔值，是否严格顺序比较，默认False，即不考虑元素顺序
+        :param rm_first: 布尔值，是否移除首个元素，默认False
+        :param ck_1_in_2: 布尔值，是否检查本文件行/列是否包含于目标文件行/列，默认False，即仅寻找互斥元素
+        :param rm_blank: 布尔值，是否移除该列元素前后空白，默认True
+        :param fill_null: 布尔值，是否将缺失数据统一替换为NA，默认False
+        :param null_list: 字符串列表，指定原数据表示缺失数据的符号，默认["", "NA", "N/A", "NULL"]
+        :param key: 字符串，关键字信息，中文默认"样本"，英文默认" sample(s) "
+        :param max_show: 整数，报错信息中最多展示的不同元素个数，超出时仅追加总数，None表示全部展示，默认100
+        :param workers: 正整数，并行读取目标文件的线程数，默认4
+        :param by_file: 布尔值，是否按目标文件返回结果字典{目标文件: 0或报错信息}，默认False
+        :return: 符合期望返回0，不符合返回报错信息列表（按targets顺序）；by_file=True时返回有序字典
+        """
+        print(__name__, self._c, _name()) if not self.no_log else 1
+        try:
+            key = " sample(s) " if self.lang == "EN" and key == "样本" else key
+            dim_options = ROW_OPTIONS + COL_OPTIONS
+            if file1_dim not in dim_options:
+                print(f'文件1检查维度设置错误，重置为取行，仅接受{dim_options}')
+                file1_dim = 1
+            jobs = []
+            for target in targets:
+                if isinstance(target, str):
+                    target = [target, ]
+                in_file2 = target[0]
+                file2_dim = target[1] if len(target) > 1 else file1_dim
+                file2_no = target[2] if len(target) > 2 else file1_no
+                if file2_dim not in dim_options:
+                    print(f'文件2检查维度设置错误，重置为取行，仅接受{dim_options}')
+                    file2_dim = 1
+                jobs.append((in_file2, file2_dim, file2_no))
+            dim1 = f"{self._e['行号']}" if file1_dim in ROW_OPTIONS else f"{self._e['列号']}"
+            in_list1 = _line2list(self.in_file, self.sep, file1_dim, file1_no, rm_blank, fill_null, null_list)
+            in_list1 = in_list1[1:] if rm_first else in_list1
+            fix_index = dict.fromkeys(in_list1)  # 各任务只读共享
+
+            def _one(job):
+                in_file2, file2_dim, file2_no = job
+                if not os.path.isfile(in_file2):
+                    return f"{self.add_info}{self._e['比较文件出错']}{in_file2}{self._e['非文件']}"
+                in_list2 = _line2list(in_file2, self.sep, file2_dim, file2_no, rm_blank, fill_null, null_list)
+                in_list2 = in_list2[1:] if rm_first else in_list2
+                ob_list = List(in_list=in_list1, key=key, no_log=True, lang=self.lang)  # 每个任务独立对象，err_agg不共享
+                ob_list.fix_index = fix_index
+                msg = ob_list.compare(list2=in_list2, order_strict=order_strict, ck_1_in_2=ck_1_in_2,
+                                      max_show=max_show)
+                if msg == 0:
+                    return 0
+                dim2 = f"{self._e['行号']}" if file2_dim in ROW_OPTIONS else f"{self._e['列号']}"
+                return f'{self.add_info}{self.__name}{dim1}{file1_no} <-> ' \
+                       f'{os.path.basename(in_file2)}{dim2}{file2_no}:{msg}'
+
+            with ThreadPoolExecutor(max_workers=max(1, int(workers))) as pool:
+                res_list = list(pool.map(_one, jobs))  # map保持targets顺序
+            if by_file:
+                return OrderedDict(zip([job[0] for job in jobs], res_list))
+            error_list = [msg for msg in res_list if msg]
+            if len(error_list) == 0:
+                return 0
+            else:
+                return error_list
+        except Exception as e:
+            print(e) if not self.no_log else 1
+            return [f"{self.add_info}{self._e['compare_lines']}", ]
+
     def str_in_line(self, in_str, ck_row=True, ck_col=True, row_no: int = None, col_no: int = None, rm_blank=True,
                     fill_null=False, null_list=None):
         """
@@ -1746,21 +3495,20 @@ class File(object):
         try:
             if isinstance(in_str, str):
                 in_str = [in_str, ]
+            in_str = list(dict.fromkeys(map(lambda x: str(x), in_str)))
             error_list = []
             if ck_row and row_no is not None:
-                in_list = self.get_row2list(row_no=row_no, rm_blank=rm_blank, fill_null=fill_null, null_list=null_list)
-                in_list = list(map(lambda x: str(x), in_list))
-                in_str = list(map(lambda x: str(x), in_str))
-                str_item = set(in_str).difference(set(in_list))
+                line_index = self.get_line_index(dim="row", line_no=row_no, rm_blank=rm_blank,
+                                                 fill_null=fill_null, null_list=null_list)
+                str_item = [x for x in in_str if x not in line_index]
                 if str_item:
                     error_list.append(
                         f"{self.add_info}{self.__name}{self._e['行号']}{row_no}{self._e['不含']}"
                         f"{_wrap(_join_str(str_item))}{self._e['元素']}")
             if ck_col and col_no is not None:
-                in_list = self.get_col2list(col_no=col_no, rm_blank=rm_blank, fill_null=fill_null, null_list=null_list)
-                in_list = list(map(lambda x: str(x), in_list))
-                in_str = list(map(lambda x: str(x), in_str))
-                str_item = set(in_str).difference(set(in_list))
+                line_index = self.get_line_index(dim="col", line_no=col_no, rm_blank=rm_blank,
+                                                 fill_null=fill_null, null_list=null_list)
+                str_item = [x for x in in_str if x not in line_index]
                 if str_item:
                     error_list.append(
                         f"{self.add_info}{self.__name}{self._e['列号']}{col_no}{self._e['不含']}"
@@ -1774,11 +3522,111 @@ class File(object):
             return [f"{self.add_info}{self._e['str_in_line']}", ]
 
 
+class AsyncFile(File):
+    """check File (asyncio)"""
+
+    _pool = None  # 默认共享有界线程池，首次使用时创建
+
+    def __init__(self, in_file, sep="\t", add_info="", no_log=False, lang=LANG, executor=None):
+        """
+        文件检查异步版本，供asyncio事件循环内调用，子进程步骤异步执行，其余耗时步骤提交有界线程池
+        async check tools for File
+        :param in_file: 字符串，检查对象，例如："D:/a.txt"
+        :param sep: 字符串，指定行元素间分隔符，默认"\t"
+        :param add_info: 字符串，附加信息
+        :param no_log: 不打印调用及报错信息，默认为False
+        :param lang: 字符串，选择报错语言，可选["CN", "EN"]，默认CN
+        :param executor: concurrent.futures执行器，None表示使用类共享的线程池（ASYNC_WORKERS个线程）
+        """
+        super().__init__(in_file, sep=sep, add_info=add_info, no_log=no_log, lang=lang)
+        self.executor = executor
+        self._encoding_buff = None  # 异步检测的文件编码 缓冲
+
+    def __repr__(self):
+        return 'AsyncFile(in：{0.in_file!r}, sep：{0.sep!r}, add：{0.add_info!r}, ' \
+               'quiet：{0.no_log!r}, lang：{0.lang!r})'.format(self)
+
+    def _get_executor(self):
+        if self.executor is None:
+            if AsyncFile._pool is None:
+                AsyncFile._pool = ThreadPoolExecutor(max_workers=ASYNC_WORKERS, thread_name_prefix="check2")
+            self.executor = AsyncFile._pool
+        return self.executor
+
+    async def run(self, func, *args, **kwargs):
+        """
+        在有界执行器中运行同步函数/方法，不阻塞事件循环
+        :param func: 可调用对象，例如 File.check_dim
+        :return: func的返回值
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), partial(func, *args, **kwargs))
+
+    @staticmethod
+    async def _run_cmd(*cmd):
+        """异步执行外部命令，返回标准输出字符串"""
+        proc = await asyncio.create_subprocess_exec(*cmd, stdout=asyncio.subprocess.PIPE,
+                                                    stderr=asyncio.subprocess.DEVNULL)
+        out, _ = await proc.communicate()
+        return out.decode(errors="replace")
+
+    def _detect_encoding(self, use_1=False):
+        if not use_1 and self._encoding_buff is not None:
+            return self._encoding_buff
+        return super()._detect_encoding(use_1=use_1)
+
+    async def get_dim(self):
+        """
+        异步获取文件行数及列数（列数不一致时，以最后一行统计为准）
+        :return: 正常返回(行数, 列数)，错误返回(None, None)
+        """
+        print(__name__, self._c, _name()) if not self.no_log else 1
+        if platform.system() == "Windows":
+            logging.error("需要用到Linux系统命令awk，否则强制替换行列为4, 3")
+            return 4, 3
+        try:
+            if _compress_type(self.in_file):  # 压缩文件经管道解压计数
+                return tuple(await asyncio.gather(self.run(File.get_row_num, self), self.run(File.get_col_num, self)))
+            row_out, col_out = await asyncio.gather(
+                self._run_cmd("awk", "END{print NR}", self.in_file),
+                self._run_cmd("awk", "-F", self.sep, "END{print NF}", self.in_file))
+            return int(row_out.split()[0]), int(col_out.split()[0])
+        except Exception as e:
+            print(e) if not self.no_log else 1
+            return None, None
+
+    async def check_base(self, ck_encoding=True, use_1=False, **kwargs):
+        """
+        文件基础检查异步版本，参数同File.check_base，linux.file编码检测以异步子进程执行
+        :return: 符合期望返回0，不符合返回报错信息列表
+        """
+        try:
+            self._encoding_buff = None
+            if ck_encoding and not use_1 and platform.system() == "Linux" and os.path.isfile(self.in_file) \
+                    and not _compress_type(self.in_file):
+                out = await self._run_cmd("file", "--mime-encoding", self.in_file)
+                self._encoding_buff = out.rstrip('\n').split(':')[1].upper()  # 同_get_encoding2
+            return await self.run(File.check_base, self, ck_encoding=ck_encoding, use_1=use_1, **kwargs)
+        except Exception as e:
+            print(e) if not self.no_log else 1
+            return [f"{self.add_info}{self._e['check_base']}", ]
+        finally:
+            self._encoding_buff = None
+
+    async def check_content(self, out_dir, **kwargs):
+        """
+        文件详细内容检查异步版本，参数同File.check_content，整体提交有界执行器执行
+        :return: 符合期望返回0，不符合返回报错信息列表
+        """
+        return await self.run(File.check_content, self, out_dir, **kwargs)
+
+
 @_pre_class
 class List(object):
     """check List"""
 
-    def __init__(self, in_list: list, key="元素", rm_first=False, add_info="", no_log=False, lang=LANG):
+    def __init__(self, in_list: list, key="元素", rm_first=False, add_info="", no_log=False, lang=LANG,
+                 max_errors: int = None, max_show: int = None, sketch=False):
         """
         列表类型数据检查
         check tools for List
@@ -1788,6 +3636,12 @@ class List(object):
         :param add_info: 字符串，附加信息
         :param no_log: 不打印调用及报错信息，默认为False
         :param lang: 字符串，选择报错语言，可选["CN", "EN"]，默认CN
+        :param max_errors: 非负整数，各检查最多收集的报错元素个数，达到后停止扫描并以"..."结尾，0同1，即首个报错即停止，
+            None表示不限制，默认None
+        :param max_show: 正整数，dup/num_ban/compare报错信息最多展示的元素/位置个数，超出时追加总数，None表示全部展示，
+            各检查汇总见err_agg.summary()，默认None
+        :param sketch: 布尔值，是否以固定内存方式检查，dup以布隆过滤器筛选候选后精确确认（结果不变），factor范围检查以
+            HyperLogLog估计明确在范围内时直接通过，其余情况精确计数，默认False
         """
         fix_list = [in_list, ] if isinstance(in_list, str) else list(in_list)
         fix_list = fix_list[1:] if rm_first else fix_list
@@ -1802,6 +3656,11 @@ class List(object):
         self.na_add_info = add_info  # na实际使用附加信息 缓冲
         self.ban_add_info = add_info  # ban实际使用附加信息 缓冲
         self.factor_buff = ""  # factor实际检查使用列表 缓冲
+        self.fix_index = None  # compare使用的哈希索引 缓冲，同一对象多次比较时复用
+        self.max_errors = None if max_errors is None else max(max_errors, 1)  # 报错元素收集上限，0同1
+        self.max_show = max_show  # 报错元素展示上限
+        self.err_agg = ErrorAgg(self._keep())  # 报错聚合，保留个数与展示上限同阶
+        self.sketch = sketch  # 固定内存检查模式
 
     def __repr__(self):
         return 'List(in：{0.fix_list!r}, key：{0.key!r}, add：{0.add_info!r}, ' \
@@ -1811,6 +3670,28 @@ class List(object):
         return '(in：{0.fix_list!s}, key：{0.key!r}, add：{0.add_info!s}, ' \
                'quiet：{0.no_log!s}, lang：{0.lang!s})'.format(self)
 
+    def _cap(self):
+        """报错元素收集个数上限（多收集1个用于判断是否截断），无上限返回None"""
+        return None if self.max_errors is None else self.max_errors + 1
+
+    def _keep(self):
+        """报错元素展示个数上限（取max_errors与max_show较小者），无上限返回None"""
+        limits = [i for i in (self.max_errors, self.max_show) if i is not None]
+        return min(limits) if limits else None
+
+    def _agg_join(self, check: str, field="value"):
+        """连接聚合器中保留的报错元素/位置，超出展示上限时以"..."结尾，设置max_show时追加总数（提前停止时为"≥下限"）"""
+        items = self.err_agg.positions(check) if field == "pos" else self.err_agg.values(check)
+        bound = "" if self.err_agg.exact(check) else "≥"
+        more = "" if self.max_show is None else f"{self._e['共计']}{bound}{self.err_agg.count(check)}"
+        more += f"{self._e['个']}{self.key}" if more and field == "value" else ""  # 位置报错后文已有单位
+        return _join_str(items, max_show=self._keep(), more=more)
+
+    def _join_more(self, items, max_show: int = None):
+        """连接报错元素，超出max_show时仅展示前max_show个并追加总数"""
+        more = f"{self._e['共计']}{len(items)}{self._e['个']}{self.key}"
+        return _join_str(items, max_show=max_show, more=more)
+
     def length(self, exp_len: int = None, min_len=0, max_len: int = float('inf')):
         """
         检查列表长度是否为固定长度/在范围内，固定长度检查优先级高于范围内检查
@@ -1856,15 +3737,29 @@ class List(object):
         """
         print(__name__, self._c, _name()) if not self.no_log else 1
         try:
-            self.in_list = list(map(lambda x: str(x).strip(), self.fix_list))
-            if len(self.in_list) == len(set(self.in_list)):
-                return 0
-            list_count = dict(Counter(self.in_list))
-            dup_item = [key for key, value in list_count.items() if value > 1]
-            if not dup_item:
+            keep = self._keep()
+            if self.sketch:  # 固定内存模式，不生成去空白列表及计数字典
+                dup_item, count = _sketch_dups(self.fix_list, self._cap())
+                self.err_agg.reset("dup", max_keep=None if keep is None else keep + 1)
+                self.err_agg.add_many("dup", values=dup_item, count=count,
+                                      exact=self._cap() is None or count < self._cap())
+            elif self.max_errors is not None:  # 收集到上限即停止，惰性去空白，不生成去空白列表
+                dup_item = _first_dups((str(x).strip() for x in self.fix_list), self._cap())
+                self.err_agg.reset("dup", max_keep=None if keep is None else keep + 1)
+                self.err_agg.add_many("dup", values=dup_item, exact=len(dup_item) < self._cap())
+            else:
+                self.in_list = list(map(lambda x: str(x).strip(), self.fix_list))
+                if len(self.in_list) == len(set(self.in_list)):
+                    return 0
+                self.err_agg.reset("dup", max_keep=None if keep is None else keep + 1)
+                list_count = Counter(self.in_list)
+                self.err_agg.add_many("dup", values=(key for key, value in list_count.items() if value > 1),
+                                      count=sum(1 for value in list_count.values() if value > 1))
+            if not self.err_agg.count("dup"):
                 return 0
             else:
-                return f"{self.add_info}{self._e['重复']}{self.key}:{_wrap(_join_str(dup_item))}{self._e['检查']}"
+                return f"{self.add_info}{self._e['重复']}{self.key}:" \
+                       f"{_wrap(self._agg_join('dup'))}{self._e['检查']}"
         except Exception as e:
             print(e) if not self.no_log else 1
             return f"{self.add_info}{self._e['dup']}"
@@ -1885,9 +3780,12 @@ class List(object):
                 ban_list = []
             self.in_list = list(map(lambda x: str(x), self.fix_list))
             ban_list = list(map(lambda x: str(x), ban_list))
-            ban_item = set(self.in_list).intersection(set(ban_list))
+            if self.max_errors is None:
+                ban_item = set(self.in_list).intersection(set(ban_list))
+            else:
+                ban_item = _first_hits(self.in_list, set(ban_list), self.max_errors + 1)
             if ban_item:
-                return f"{self.ban_add_info}{self.key}:{_join_str(ban_item)}{self._e['检查']}"
+                return f"{self.ban_add_info}{self.key}:{_join_str(ban_item, max_show=self.max_errors)}{self._e['检查']}"
             else:
                 return 0
         except Exception as e:
@@ -1926,13 +3824,13 @@ class List(object):
         print(__name__, self._c, _name()) if not self.no_log else 1
         try:
             if re_obj is None:
-                re_obj = re.compile(r'^[A-Za-z0-9]([A-Za-z0-9._-])*$')
+                re_obj = _re(r'^[A-Za-z0-9]([A-Za-z0-9._-])*$')
                 if re_ban_body is None:
-                    re_ban_body = re.compile(r"[^A-Za-z0-9._-]")
+                    re_ban_body = _re(r"[^A-Za-z0-9._-]")
                 if ck_head and re_ban_head is None:
-                    re_ban_head = re.compile(r"^[^A-Za-z0-9]")
+                    re_ban_head = _re(r"^[^A-Za-z0-9]")
                 if ck_tail and re_ban_tail is None:
-                    re_ban_tail = re.compile(r"[^A-Za-z0-9]$")
+                    re_ban_tail = _re(r"[^A-Za-z0-9]$")
             error_item = []
             for i in self.fix_list:
                 err_msg = Str(in_str=i, no_log=True, lang=self.lang).format(
@@ -1940,8 +3838,11 @@ class List(object):
                     re_ban_tail=re_ban_tail)
                 if err_msg:
                     error_item.append(i)
+                    if self.max_errors is not None and len(error_item) > self.max_errors:
+                        break
             if error_item:
-                return f"{self.add_info}{self._e['不合规']}{self.key}{_wrap(_join_str(error_item))}"
+                return f"{self.add_info}{self._e['不合规']}{self.key}" \
+                       f"{_wrap(_join_str(error_item, max_show=self.max_errors))}"
             else:
                 return 0
         except Exception as e:
@@ -1958,6 +3859,14 @@ class List(object):
         """
         print(__name__, self._c, _name()) if not self.no_log else 1
         try:
+            if self.sketch and exp_num is None:  # 固定内存模式，HyperLogLog估计明确在范围内时直接通过，否则精确计数
+                hll = _HyperLogLog()
+                for keys, hashes in _iter_hash_chunks(self.fix_list, strip=False):
+                    hll.add_many(hashes)
+                est = hll.count()
+                margin = HLL_MARGIN * hll.error() * est
+                if est > 2.5 * len(hll.reg) and min_num <= est - margin and est + margin <= max_num:
+                    return 0
             self.factor_buff = list(set(self.fix_list))
             msg = self.length(exp_len=exp_num, min_len=min_num, max_len=max_num)
             if msg:
@@ -2000,24 +3909,23 @@ class List(object):
         """
         print(__name__, self._c, _name()) if not self.no_log else 1
         try:
-            err_list = []
-            for i in range(1, len(self.fix_list) + 1):
-                msg = Num(in_num=float(self.fix_list[i - 1]), add_info=f'第{i}个数值：', no_log=True,
-                          lang=self.lang).range(min_num=min_num, max_num=max_num)
-                if msg:
-                    err_list.append(i)
-            if err_list:
-                min_num = f"{self._e['负无穷']}" if min_num == float('-inf') else min_num
-                max_num = f"{self._e['正无穷']}" if max_num == float('inf') else max_num
-                index = self._e['第']
-                return f"{self.add_info}{self._e['下限']}{min_num}{self._e['上限']}{max_num}{self._e['检测到']}" \
-                       f"{_wrap(index + _join_str(err_list))}{self._e['个']}{self.key}{self._e['超限']}"
-            else:
-                return 0
+            num_arr = np.asarray(self.fix_list, dtype=np.float64)
+            in_range = (num_arr >= min_num) & (num_arr <= max_num)  # NaN视为超限，同Num.range
+            err_list = (np.flatnonzero(~in_range)[:self._cap()] + 1).tolist()
+            return self._num_range_msg(err_list, min_num, max_num) if err_list else 0
         except Exception as e:
             print(e) if not self.no_log else 1
             return f"{self.add_info}{self._e['num_range']}"
 
+    def _num_range_msg(self, err_list: list, min_num=float('-inf'), max_num=float('inf')):
+        """数值超限报错信息，err_list为超限元素位置（从1计）"""
+        min_num = f"{self._e['负无穷']}" if min_num == float('-inf') else min_num
+        max_num = f"{self._e['正无穷']}" if max_num == float('inf') else max_num
+        index = self._e['第']
+        return f"{self.add_info}{self._e['下限']}{min_num}{self._e['上限']}{max_num}{self._e['检测到']}" \
+               f"{_wrap(index + _join_str(err_list, max_show=self.max_errors))}{self._e['个']}{self.key}" \
+               f"{self._e['超限']}"
+
     def num_ban(self, ban_num: list = None):
         """
         检查数值列表元素数值有无禁用值
@@ -2026,66 +3934,75 @@ class List(object):
         """
         print(__name__, self._c, _name()) if not self.no_log else 1
         try:
-            err_list = []
             if isinstance(ban_num, float) or isinstance(ban_num, int):
                 ban_num = [ban_num, ]
-            for i in range(1, len(self.fix_list) + 1):
-                msg = Num(in_num=float(self.fix_list[i - 1]), add_info="", no_log=True, lang=self.lang).ban(
-                    ban_num=ban_num)
-                if msg:
-                    err_list.append(i)
-            if err_list:
-                index = self._e['第']
-                return f"{self.add_info}{self._e['禁用']}{_join_str(ban_num)}{self._e['检测到']}" \
-                       f"{_wrap(index + _join_str(err_list), self_len=160)}{self._e['个']}{self.key}{self._e['为禁用']}"
-            else:
-                return 0
+            num_arr = np.asarray(self.fix_list, dtype=np.float64)
+            ban_items = ban_num if isinstance(ban_num, list) else [ban_num, ]  # 同Num.ban
+            ban_arr = np.array([i for i in ban_items if isinstance(i, (int, float))], dtype=np.float64)
+            err_idx = np.flatnonzero(np.isin(num_arr, ban_arr))
+            keep = self._keep()
+            keep_idx = err_idx if keep is None else err_idx[:keep + 1]
+            self.err_agg.reset("num_ban", max_keep=None if keep is None else keep + 1)
+            self.err_agg.add_many("num_ban", pos=(keep_idx + 1).tolist(), values=num_arr[keep_idx].tolist(),
+                                  count=len(err_idx))
+            return self._num_ban_msg(ban_num) if len(err_idx) else 0
         except Exception as e:
             print(e) if not self.no_log else 1
             return f"{self.add_info}{self._e['num_ban']}"
 
-    def compare(self, list2: list, order_strict=False, ck_1_in_2=False):
+    def _num_ban_msg(self, ban_num: list = None):
+        """数值禁用报错信息，禁用元素位置取自err_agg中的num_ban记录"""
+        index = self._e['第']
+        return f"{self.add_info}{self._e['禁用']}{_join_str(ban_num)}{self._e['检测到']}" \
+               f"{_wrap(index + self._agg_join('num_ban', field='pos'), self_len=160)}" \
+               f"{self._e['个']}{self.key}{self._e['为禁用']}"
+
+    def compare(self, list2: list, order_strict=False, ck_1_in_2=False, max_show: int = None):
         """
         比较两个列表元素是否相同
         :param list2: 列表，第二个比较对象
         :param order_strict: 布尔值，是否严格顺序比较，默认False,即不考虑元素顺序
         :param ck_1_in_2: 布尔值，是否检查list1是否包含于list2，默认False，即仅寻找互斥元素
+        :param max_show: 整数，报错信息中最多展示的不同元素个数，超出时仅追加总数，None表示沿用对象max_show
         :return: 相同返回0，不同返回字符串报错信息
         """
         print(__name__, self._c, _name()) if not self.no_log else 1
         try:
+            max_show = self.max_show if max_show is None else max_show
+            keep = None if max_show is None else max_show + 1
+            for check in ("compare", "compare_2"):
+                self.err_agg.reset(check, max_keep=keep)
             if order_strict:
                 other = ''
-                err = []
                 if ck_1_in_2 and len(self.fix_list) > len(list2):
                     other += f"{self._e['存在多的']}{self.key}{self._e['且']}"
                 elif not ck_1_in_2 and len(self.fix_list) != len(list2):
                     other += f"{self._e['不等']}"
-                n = min(len(self.fix_list), len(list2))
-                for i in range(1, n + 1):
-                    if self.fix_list[i - 1] != list2[i - 1]:
-                        # err.append(i)  # 元素位置
-                        err.append(self.fix_list[i - 1])  # 元素名
+                err = _ordered_diff(self.fix_list, list2)  # 元素名
+                self.err_agg.add_many("compare", values=err)
                 if len(err) != 0:
                     # msg = f"{self.add_info}发现不同{self.key}，分别为第{_join_str(err)}个{other} "  # 元素位置
-                    msg = f"{self.add_info}{other}{self._e['发现不同']}{self.key}{self._e['为']}{_wrap(_join_str(err))} "
+                    msg = f"{self.add_info}{other}{self._e['发现不同']}{self.key}{self._e['为']}" \
+                          f"{_wrap(self._join_more(err, max_show))} "
                     return msg
                 else:
                     return 0
             else:
-                set1 = set(self.fix_list)
-                set2 = set(list2)
-                diff_items = list(set1.symmetric_difference(set2))
-                if not diff_items:
+                if self.fix_index is None:
+                    self.fix_index = dict.fromkeys(self.fix_list)
+                diff1, diff2 = _index_diff(self.fix_list, list2, index1=self.fix_index)
+                self.err_agg.add_many("compare", values=diff1)
+                self.err_agg.add_many("compare_2", values=diff2)
+                if not diff1 and not diff2:
                     return 0
-                diff1 = list(set1.difference(set2))
                 if ck_1_in_2 and diff1:
-                    return f"{self.add_info}{self._e['发现多的']}{self.key}{self._e['为']}{_wrap(_join_str(diff1))}"
+                    return f"{self.add_info}{self._e['发现多的']}{self.key}{self._e['为']}" \
+                           f"{_wrap(self._join_more(diff1, max_show))}"
                 elif not ck_1_in_2:
-                    diff2 = list(set2.difference(set1))
                     index = self._e['和']
-                    return f"{self.add_info}{self._e['发现不同']}{self.key}{self._e['为']}{_wrap(_join_str(diff1))}\n" \
-                           f"{_wrap(index + _join_str(diff2))}"
+                    return f"{self.add_info}{self._e['发现不同']}{self.key}{self._e['为']}" \
+                           f"{_wrap(self._join_more(diff1, max_show))}\n" \
+                           f"{_wrap(index + self._join_more(diff2, max_show))}"
                 else:
                     return 0
         except Exception as e:
@@ -2093,6 +4010,170 @@ class List(object):
             return f"{self.add_info}{self._e['compare']}"
 
 
+@_pre_class
+class ArrayList(object):
+    """check List (compact, numpy array backed)"""
+    __slots__ = ("_arr", "_offset", "key", "add_info", "no_log", "lang", "_c", "_e", "in_list", "na_add_info",
+                 "ban_add_info", "factor_buff", "fix_index", "max_errors", "max_show", "err_agg")
+
+    def __init__(self, in_list, key="元素", rm_first=False, add_info="", no_log=False, lang=LANG,
+                 max_errors: int = None, max_show: int = None):
+        """
+        列表类型数据检查紧凑版本，直接引用numpy数组（非数组输入仅转换一次），rm_first记为偏移量，各方法基于视图检查，
+        参数及报错信息同List
+        :param in_list: numpy数组/列表，检查对象
+        :param rm_first: 布尔值，是否跳过首个元素（偏移量，不复制），默认False
+        """
+        self._arr = np.asarray([in_list, ] if isinstance(in_list, str) else in_list)
+        self._offset = 1 if rm_first else 0
+        self.key = " element(s) " if lang == "EN" and key == "元素" else key
+        self.add_info = add_info
+        self.no_log = no_log
+        self.lang = lang
+        self._c = self.__class__.__name__  # 类名
+        self._e = self.lang_dic[self.lang]["List"]  # 报错字典同List
+        self.in_list = None
+        self.na_add_info = add_info
+        self.ban_add_info = add_info
+        self.factor_buff = ""
+        self.fix_index = None
+        self.max_errors = None if max_errors is None else max(max_errors, 1)
+        self.max_show = max_show
+        self.err_agg = ErrorAgg(self._keep())
+
+    @property
+    def fix_list(self):
+        """检查对象视图（已按rm_first偏移）"""
+        return self._arr[self._offset:]
+
+    def _str_codes(self, strip=False):
+        """
+        按元素字符串（同List中str(x)，strip为True时去除前后空白）编码：对象数组以pd.factorize按原值去重（可含缺失值
+        等混合类型），其余数组以np.unique去重（仅字符串数组去空白，bytes数组按解码后字符串），再对去重后元素转换字符串，
+        不生成对象数组的整列字符串副本
+        :return: (各元素编码数组, 按首次出现顺序的字符串数组)
+        """
+        arr = self.fix_list
+        if arr.dtype.kind == "O":
+            codes, uniques = pd.factorize(arr, use_na_sentinel=False)
+        else:
+            arr = arr.astype(str) if arr.dtype.kind == "S" else arr
+            arr = np.char.strip(arr) if strip and arr.dtype.kind == "U" else arr
+            key = arr.view(f"i{arr.itemsize}") if arr.dtype.kind == "f" else arr  # 按位去重，区分0.0与-0.0
+            first, codes = np.unique(key, return_index=True, return_inverse=True)[1:]
+            order = np.argsort(first, kind="stable")
+            rank = np.empty_like(order)
+            rank[order] = np.arange(len(order))
+            codes, uniques = rank[codes.ravel()], arr[first[order]]
+        labels = np.asarray([str(x).strip() if strip else str(x) for x in uniques], dtype=object)
+        label_codes, labels = pd.factorize(labels)  # 不同原值可能对应相同字符串（如1与"1"）
+        return label_codes[codes], np.asarray(labels, dtype=object)
+
+    __repr__ = List.__repr__
+    __str__ = List.__str__
+    _cap = List._cap
+    _keep = List._keep
+    _agg_join = List._agg_join
+    _join_more = List._join_more
+    length = List.length
+    range = List.range
+    na = List.na
+    format = List.format
+    num_range = List.num_range
+    _num_range_msg = List._num_range_msg
+    num_ban = List.num_ban
+    _num_ban_msg = List._num_ban_msg
+    compare = List.compare
+
+    def dup(self):
+        """
+        检查列表中的重复元素（向量化，报错元素按首次出现顺序）
+        :return: 无重复0，有重复返回字符串报错信息
+        """
+        print(__name__, self._c, _name()) if not self.no_log else 1
+        try:
+            codes, labels = self._str_codes(strip=True)
+            count = np.bincount(codes, minlength=len(labels))
+            if len(labels) == len(codes):
+                return 0
+            keep = self._keep()
+            dup_uniq = labels[count > 1]  # 编码按首次出现顺序
+            self.err_agg.reset("dup", max_keep=None if keep is None else keep + 1)
+            self.err_agg.add_many("dup", values=dup_uniq[:None if keep is None else keep + 1].tolist(),
+                                  count=len(dup_uniq))
+            return f"{self.add_info}{self._e['重复']}{self.key}:" \
+                   f"{_wrap(self._agg_join('dup'))}{self._e['检查']}"
+        except Exception as e:
+            print(e) if not self.no_log else 1
+            return f"{self.add_info}{self._e['dup']}"
+
+    def ban(self, ban_list: list = None):
+        """
+        检查列表中的禁用元素（向量化）
+        :param ban_list: 字符串/字符串列表，禁用元素，默认[]，即无禁用
+        :return: 无禁用返回0，有禁用返回字符串报错信息
+        """
+        print(__name__, self._c, _name()) if not self.no_log else 1
+        self.ban_add_info = self.na_add_info if f"{self._e['空缺']}" in self.na_add_info else self.add_info
+        self.na_add_info = self.add_info
+        try:
+            if isinstance(ban_list, str):
+                ban_list = [ban_list, ]
+            if ban_list is None:
+                ban_list = []
+            ban_list = list(map(lambda x: str(x), ban_list))
+            if not ban_list:
+                return 0
+            arr = self.fix_list
+            if arr.dtype.kind in "US":  # 字符串数组直接比较，无需转换
+                arr = arr.astype(str) if arr.dtype.kind == "S" else arr
+                ban_item = list(dict.fromkeys(arr[np.isin(arr, ban_list)].tolist()))
+            else:
+                labels = self._str_codes()[1]
+                ban_item = labels[np.isin(labels, ban_list)].tolist()
+            ban_item = ban_item[:self._cap()]  # 按首次出现顺序
+            if ban_item:
+                return f"{self.ban_add_info}{self.key}:{_join_str(ban_item, max_show=self.max_errors)}{self._e['检查']}"
+            else:
+                return 0
+        except Exception as e:
+            print(e) if not self.no_log else 1
+            return f"{self.add_info}{self._e['ban']}"
+
+    def factor(self, exp_num=None, min_num=1, max_num: int = float('inf')):
+        """
+        列表因子（非重复元素）个数检查，参数同List.factor
+        :return: 范围内返回0，范围外返回字符串报错信息
+        """
+        print(__name__, self._c, _name()) if not self.no_log else 1
+        try:
+            arr = self.fix_list
+            self.factor_buff = (pd.unique(arr) if arr.dtype.kind == "O" else np.unique(arr)).tolist()  # 对象数组可混合类型
+            msg = self.length(exp_len=exp_num, min_len=min_num, max_len=max_num)
+            return f"{msg}" if msg else 0
+        except Exception as e:
+            print(e) if not self.no_log else 1
+            return f"{self.add_info}{self._e['factor']}"
+
+    factor_num = class_num = group_num = factor
+
+    def type(self, exp_type='float'):
+        """
+        检查列表元素类型，int/float整体转换为numpy数组，失败时按List.type逐个定位报错元素
+        :param exp_type: 字符串，期望列表元素类型，默认"float"
+        :return: 正常返回期望类型的新数组（int/float）或列表（其他类型），异常返回字符串报错信息
+        """
+        if exp_type.lower() in ("float", "int"):
+            try:
+                arr = self.fix_list
+                if exp_type.lower() == "float" or arr.dtype.kind in "iu":
+                    return arr.astype(np.float64 if exp_type.lower() == "float" else np.int64, copy=False)
+            except (ValueError, TypeError, OverflowError):
+                pass
+        return List(self.fix_list.tolist(), key=self.key, add_info=self.add_info, no_log=self.no_log,
+                    lang=self.lang).type(exp_type=exp_type)  # 报错元素以python类型展示
+
+
 @_pre_class
 class Tool(object):
     """Start check / outfit / End check / make result or give err_log"""
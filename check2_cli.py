@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+"""
+Command line entry of general check module[v2] +
+validate / serve(daemon) / watch, checks are run by check2.File +
+"""
+# ---- ---- ---- ---- ---- #
+import sys
+import os
+import time
+import argparse
+import tempfile
+import socket
+import socketserver
+import stat
+import threading
+import json
+import hashlib
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
+from contextlib import redirect_stdout
+from typing import Union
+try:
+    from .check2 import File, LANG, ASYNC_WORKERS, SIDECAR_SUFFIX, CHECKPOINT_SUFFIX, \
+        _load_yaml, _open_bin, _file_md5, _strip_compress_suffix
+except ImportError:
+    from check2 import File, LANG, ASYNC_WORKERS, SIDECAR_SUFFIX, CHECKPOINT_SUFFIX, \
+        _load_yaml, _open_bin, _file_md5, _strip_compress_suffix
+
+CLI_EXIT = {"ok": 0, "fail": 1, "usage": 2, "error": 3}  # validate命令退出码：全部通过/存在不符合/参数或配置错误/检查出错
+DAEMON_SOCKET = os.path.join(tempfile.gettempdir(), f"check2-{os.getuid() if hasattr(os, 'getuid') else 0}.sock")
+DAEMON_CACHE_SIZE = 1024  # 守护进程结果缓存条数
+WATCH_INTERVAL = 0.2  # watch命令轮询间隔（秒）
+
+
+def _validate_file(in_file, spec: dict, out_dir=None):
+    """
+    命令行单文件检查，检查期间的打印信息重定向至标准错误，保证标准输出仅为JSON结果
+    :param in_file: 字符串，检查对象
+    :param spec: 字典，检查配置，见main
+    :param out_dir: 字符串，check_content默认输出目录，默认None（使用临时目录，检查结束后删除）
+    :return: 字典，{"file", "status": ok/fail/error, "errors", "elapsed"}
+    """
+    if not out_dir:
+        with tempfile.TemporaryDirectory(prefix="check2_") as tmp_dir:
+            return _validate_file(in_file, spec, tmp_dir)
+    start = time.time()
+    res = {"file": in_file, "status": "ok", "errors": []}
+    with redirect_stdout(sys.stderr):
+        try:
+            ob_file = File(in_file, sep=spec.get("sep", "\t"), add_info=spec.get("add_info", ""),
+                           no_log=spec.get("no_log", True), lang=spec.get("lang", LANG))
+            base_opts = spec.get("base", {})
+            if base_opts is not False:
+                err_msg = ob_file.check_base(**(base_opts or {}))
+                res["errors"].extend(err_msg or [])
+            content_opts = spec.get("content")
+            if content_opts is not None and content_opts is not False and not res["errors"]:
+                content_opts = dict(content_opts or {})
+                content_opts.setdefault("out_dir", out_dir)
+                err_msg = ob_file.check_content(**content_opts)
+                res["errors"].extend(err_msg or [])
+            res["status"] = "fail" if res["errors"] else "ok"
+        except Exception as e:
+            res["status"] = "error"
+            res["errors"].append(f"{e.__class__.__name__}: {e}")
+    res["elapsed"] = round(time.time() - start, 3)
+    return res
+
+
+class _DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """check2守护进程，常驻进程池及缓存，见serve"""
+    daemon_threads = True
+
+    def __init__(self, socket_path, jobs: int = ASYNC_WORKERS, cache_size: int = DAEMON_CACHE_SIZE):
+        super().__init__(socket_path, _DaemonHandler)
+        self.pool = ProcessPoolExecutor(max_workers=jobs)  # 子进程fork自已加载check2的守护进程，无需重复导入
+        self.cache = OrderedDict()  # 结果LRU缓存 {(文件md5, 文件路径, 配置, 输出目录): 结果}
+        self.cache_size = cache_size
+        self.specs = {}  # 配置文件缓存 {路径: (修改时间, 配置)}
+        self.lock = threading.Lock()
+
+    def load_spec(self, spec_path):
+        mtime = os.stat(spec_path).st_mtime_ns
+        cache = self.specs.get(spec_path)
+        if cache is None or cache[0] != mtime:
+            cache = (mtime, _load_yaml(spec_path) or {})
+            self.specs[spec_path] = cache
+        return cache[1]
+
+    def validate(self, req: dict):
+        in_file = os.path.abspath(req["file"])
+        spec = self.load_spec(os.path.abspath(req["spec_path"])) if req.get("spec_path") else req.get("spec", {})
+        key = None
+        if os.path.isfile(in_file):
+            key = (_file_md5(in_file), in_file, json.dumps(spec, sort_keys=True, default=str), req.get("out_dir"))
+            with self.lock:
+                if key in self.cache:
+                    self.cache.move_to_end(key)
+                    return dict(self.cache[key], cached=True)
+        res = self.pool.submit(_validate_file, in_file, spec, req.get("out_dir")).result()
+        if key is not None and res["status"] != "error":
+            with self.lock:
+                self.cache[key] = res
+                while len(self.cache) > self.cache_size:
+                    self.cache.popitem(last=False)
+        return dict(res, cached=False)
+
+
+class _DaemonHandler(socketserver.StreamRequestHandler):
+    """守护进程请求处理，每个连接一行JSON请求、一行JSON结果"""
+
+    def handle(self):
+        try:
+            line = self.rfile.readline()
+        except (ConnectionError, TimeoutError):
+            return
+        if not line.strip():  # 连接探测（如_socket_alive）未发送请求即断开
+            return
+        try:
+            req = json.loads(line.decode("utf-8"))
+            cmd = req.get("cmd", "validate")
+            if cmd == "ping":
+                res = {"status": "pong", "pid": os.getpid()}
+            elif cmd == "shutdown":
+                res = {"status": "bye"}
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+            else:
+                res = self.server.validate(req)
+        except Exception as e:
+            res = {"status": "error", "errors": [f"{e.__class__.__name__}: {e}"]}
+        try:
+            self.wfile.write((json.dumps(res, ensure_ascii=False) + "\n").encode("utf-8"))
+        except ConnectionError:  # 客户端已断开（如超时放弃）
+            return
+
+
+def _socket_alive(socket_path: str, timeout=1):
+    """套接字路径是否有进程在监听（能否连接）"""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(timeout)
+            client.connect(socket_path)
+            return True
+    except OSError:
+        return False
+
+
+def serve(socket_path: str = None, jobs: int = ASYNC_WORKERS, cache_size: int = DAEMON_CACHE_SIZE):
+    """
+    启动常驻检查守护进程（本地Unix域套接字），模块、语言字典、正则及配置缓存常驻，检查提交进程池执行，
+    相同内容（md5）、路径、配置及输出目录的检查结果直接取自缓存
+    请求为一行JSON：{"file": 路径, "spec": 配置字典 或 "spec_path": 配置文件, "out_dir": 输出目录}，
+    或{"cmd": "ping"/"shutdown"}；返回一行JSON，格式同_validate_file，另含"cached"
+    :param socket_path: 字符串，套接字路径，默认DAEMON_SOCKET
+    :param jobs: 正整数，检查进程数，默认ASYNC_WORKERS
+    :param cache_size: 正整数，结果缓存条数，默认DAEMON_CACHE_SIZE
+    套接字路径已存在时：非套接字文件或已有守护进程在监听则报错退出，仅删除无进程监听的残留套接字
+    """
+    socket_path = socket_path if socket_path else DAEMON_SOCKET
+    if os.path.lexists(socket_path):
+        if not stat.S_ISSOCK(os.lstat(socket_path).st_mode):
+            raise FileExistsError(f"{socket_path} exists and is not a socket")
+        if _socket_alive(socket_path):
+            raise OSError(f"check2 daemon already listening on {socket_path}")
+        os.remove(socket_path)  # 残留套接字
+    with redirect_stdout(sys.stderr):
+        server = _DaemonServer(socket_path, jobs=jobs, cache_size=cache_size)
+        server.pool.submit(int).result()  # 预先创建子进程
+    sock_ino = os.lstat(socket_path).st_ino
+    sys.stderr.write(f"check2 daemon listening on {socket_path}\n")
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        server.pool.shutdown()
+        if os.path.lexists(socket_path) and os.lstat(socket_path).st_ino == sock_ino:  # 仅删除本进程创建的套接字
+            os.remove(socket_path)
+
+
+def validate_file(in_file, spec: Union[dict, str] = None, out_dir=None, socket_path: str = None, timeout=600):
+    """
+    文件检查客户端，优先请求守护进程（见serve），守护进程未运行（无法连接）时在当前进程内检查；已连接后超时或
+    通信失败时返回error结果，不在当前进程内重复检查
+    :param in_file: 字符串，检查对象
+    :param spec: 字典/字符串，检查配置字典或yaml配置文件路径，格式见main，None表示仅做基础检查
+    :param out_dir: 字符串，check_content默认输出目录，None表示临时目录
+    :param socket_path: 字符串，守护进程套接字路径，默认DAEMON_SOCKET
+    :param timeout: 数值，请求超时秒数，默认600
+    :return: 字典，{"file", "status": ok/fail/error, "errors", "elapsed", "cached"}
+    """
+    req = {"file": os.path.abspath(in_file), "out_dir": out_dir}
+    if isinstance(spec, str):
+        req["spec_path"] = os.path.abspath(spec)
+    else:
+        req["spec"] = spec if spec else {}
+    start = time.time()
+
+    def _error(e):
+        return {"file": req["file"], "status": "error", "errors": [f"{e.__class__.__name__}: {e}"],
+                "elapsed": round(time.time() - start, 3), "cached": False}
+
+    client = None
+    try:
+        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        client.settimeout(timeout)
+        client.connect(socket_path if socket_path else DAEMON_SOCKET)
+    except TimeoutError as e:  # 守护进程在运行但未及时接受连接
+        client.close()
+        return _error(e)
+    except (OSError, AttributeError):  # 守护进程未运行（或平台不支持Unix域套接字），进程内检查
+        client.close() if client is not None else 1
+        spec = _load_yaml(req["spec_path"]) if "spec_path" in req else req["spec"]
+        return dict(_validate_file(req["file"], spec or {}, out_dir), cached=False)
+    try:
+        with client:
+            client.sendall((json.dumps(req) + "\n").encode("utf-8"))
+            with client.makefile("rb") as fileIN:
+                return json.loads(fileIN.readline().decode("utf-8"))
+    except (OSError, ValueError) as e:  # 超时或守护进程异常断开，请求可能仍在执行，不重复检查
+        return _error(e)
+
+
+def _watch_targets(paths: list, suffix_list: list = None):
+    """
+    监控对象文件列表：目录下递归查找（跳过隐藏文件、check_base转码生成的.convert文件及列式缓存/增量检查状态目录），
+    目录中的文件按suffix_list过滤，直接指定的文件不过滤
+    """
+    if isinstance(suffix_list, str):
+        suffix_list = [suffix_list, ]
+    suffixes = tuple(f".{i.lower().lstrip('.')}" for i in suffix_list) if suffix_list else None
+    files = []
+    for path in paths:
+        if not os.path.isdir(path):
+            files.append(path)
+            continue
+        for root, dirs, names in os.walk(path):
+            dirs[:] = [i for i in dirs if not i.startswith(".") and not i.endswith((SIDECAR_SUFFIX, CHECKPOINT_SUFFIX))]
+            for name in names:
+                if name.startswith(".") or name.endswith(".convert") or \
+                        (suffixes and not _strip_compress_suffix(name).lower().endswith(suffixes)):
+                    continue
+                files.append(os.path.join(root, name))
+    return sorted(set(map(os.path.abspath, files)))
+
+
+def _header_body_md5(in_file, block_size=1048576):
+    """首行（标题行）及其余内容的md5（压缩文件按解压后内容），用于判断文件变动范围"""
+    body = hashlib.md5()
+    with _open_bin(in_file) as fileIN:
+        header = hashlib.md5(fileIN.readline()).hexdigest()
+        for block in iter(lambda: fileIN.read(block_size), b""):
+            body.update(block)
+    return header, body.hexdigest()
+
+
+def watch(paths: list, spec: dict, out_dir=None, interval=WATCH_INTERVAL, jobs: int = 1, rounds: int = None,
+          emit=None, no_log=False):
+    """
+    监控文件/目录，文件新增或内容变动后重新检查并立即输出结果（轮询文件状态，状态变化时再按内容md5确认）
+    仅保存而内容未变的文件不重新检查；结果格式同_validate_file，另含"scope"：new新文件/header仅标题行变动/
+    body仅标题行外内容变动/all均变动，删除的文件输出{"file", "status": "deleted"}
+    :param paths: 字符串列表，监控的文件或目录，目录中的文件按spec中base.suffix_list过滤
+    :param spec: 字典，检查配置，见main
+    :param out_dir: 字符串，check_content默认输出目录（各文件分别使用其下子目录），勿位于监控目录内，默认None（每次检查使用临时目录，检查结束后删除）
+    :param interval: 浮点数，轮询间隔秒数，默认WATCH_INTERVAL
+    :param jobs: 正整数，同一轮多个文件变动时的并行检查进程数，默认1
+    :param rounds: 正整数，轮询次数，None表示持续监控直至中断
+    :param emit: 函数，结果输出函数，默认以一行JSON写入标准输出
+    :param no_log: 布尔值，是否不打印读取失败信息（至标准错误），默认False
+    """
+    suffix_list = (spec.get("base") or {}).get("suffix_list")
+    if emit is None:
+        def emit(res):
+            sys.stdout.write(json.dumps(res, ensure_ascii=False) + "\n")
+            sys.stdout.flush()
+    seen, index = {}, {}  # {文件: (文件状态, (标题行md5, 其余内容md5))}, {文件: 输出子目录序号}
+    pool = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+    try:
+        n = 0
+        while rounds is None or n < rounds:
+            n += 1
+            files = _watch_targets(paths, suffix_list)
+            for in_file in [i for i in seen if i not in files]:
+                seen.pop(in_file)
+                emit({"file": in_file, "status": "deleted"})
+            changed = []
+            for in_file in files:
+                try:
+                    file_stat = os.stat(in_file)
+                    sig = (file_stat.st_mtime_ns, file_stat.st_size)
+                    if in_file in seen and seen[in_file][0] == sig:
+                        continue
+                    digest = _header_body_md5(in_file)
+                except (FileNotFoundError, PermissionError):  # 检查前被删除或无权限，下一轮再处理
+                    continue
+                except Exception as e:  # 无法读取（如压缩格式有误），文件再次变动后重试
+                    print(e, file=sys.stderr) if not no_log else 1
+                    seen[in_file] = (sig, None)
+                    continue
+                old = seen.get(in_file)
+                seen[in_file] = (sig, digest)
+                if old is not None and old[1] == digest:
+                    continue
+                scope = "new" if old is None or old[1] is None else "header" if old[1][1] == digest[1] else \
+                    "body" if old[1][0] == digest[0] else "all"
+                index.setdefault(in_file, len(index))
+                changed.append((in_file, scope))
+            jobs_list = [(i, spec, os.path.join(out_dir, str(index[i])) if out_dir else None) for i, _ in changed]
+            if pool is None or len(jobs_list) <= 1:
+                results = map(lambda job: _validate_file(*job), jobs_list)
+            else:
+                results = pool.map(_validate_file, *zip(*jobs_list))
+            for (in_file, scope), res in zip(changed, results):
+                res["scope"] = scope
+                emit(res)
+            if rounds is None or n < rounds:
+                time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        pool.shutdown() if pool is not None else 1
+
+
+def main(argv: list = None):
+    """
+    命令行入口，python -m check2_cli validate --spec spec.yaml files... [--jobs N] [--out-dir DIR]
+    或启动守护进程，python -m check2_cli serve [--socket PATH] [--jobs N]（见serve/validate_file）
+    或监控文件/目录变动并重新检查，python -m check2_cli watch --spec spec.yaml paths... [--interval S]（见watch）
+    spec.yaml示例（键同File参数，base/content分别为File.check_base/File.check_content参数，content缺省表示不检查内容，
+    base为false表示不做基础检查；基础检查不通过时跳过内容检查）：
+        sep: "\t"
+        lang: CN
+        base: {suffix_list: [txt, tsv], max_size: 200M}
+        content: {ck_col_list: -1, ck_col_type: true, rm_first: true}
+    每个文件检查完成后立即向标准输出写入一行JSON结果
+    :param argv: 字符串列表，命令行参数，None表示使用sys.argv
+    :return: 退出码，见CLI_EXIT
+    """
+    parser = argparse.ArgumentParser(prog="check2_cli", description="General check module [v2]")
+    sub = parser.add_subparsers(dest="command")
+    parser_v = sub.add_parser("validate", help="validate files by a yaml spec, one JSON result per line")
+    parser_v.add_argument("files", nargs="+", help="files to validate")
+    parser_v.add_argument("--spec", required=True, help="yaml spec of File/check_base/check_content options")
+    parser_v.add_argument("--jobs", "-j", type=int, default=1, help="number of parallel processes, default 1")
+    parser_v.add_argument("--out-dir", default=None, help="default check_content out_dir, default a temp dir")
+    parser_w = sub.add_parser("watch", help="revalidate files as they change, one JSON result per line")
+    parser_w.add_argument("paths", nargs="+", help="files or directories to watch")
+    parser_w.add_argument("--spec", required=True, help="yaml spec of File/check_base/check_content options")
+    parser_w.add_argument("--interval", type=float, default=WATCH_INTERVAL,
+                          help=f"polling interval in seconds, default {WATCH_INTERVAL}")
+    parser_w.add_argument("--jobs", "-j", type=int, default=1, help="number of parallel processes, default 1")
+    parser_w.add_argument("--out-dir", default=None, help="default check_content out_dir, default a temp dir")
+    parser_s = sub.add_parser("serve", help="run a warm validation daemon on a local unix socket")
+    parser_s.add_argument("--socket", default=DAEMON_SOCKET, help=f"unix socket path, default {DAEMON_SOCKET}")
+    parser_s.add_argument("--jobs", "-j", type=int, default=ASYNC_WORKERS, help="number of worker processes")
+    parser_s.add_argument("--cache-size", type=int, default=DAEMON_CACHE_SIZE, help="number of cached results")
+    try:
+        args = parser.parse_args(argv)
+    except SystemExit as e:
+        return CLI_EXIT["ok"] if e.code == 0 else CLI_EXIT["usage"]
+    if args.command == "serve":
+        serve(args.socket, jobs=args.jobs, cache_size=args.cache_size)
+        return CLI_EXIT["ok"]
+    if args.command not in ("validate", "watch"):
+        sys.stderr.write("Hey, bro, this is a check module [v2].  ")
+        parser.print_usage(sys.stderr)
+        return CLI_EXIT["usage"]
+    try:
+        spec = _load_yaml(args.spec) or {}
+        if not isinstance(spec, dict):
+            raise ValueError(f"spec should be a mapping: {args.spec}")
+    except Exception as e:
+        sys.stderr.write(f"Failed to load spec {args.spec}: {e}\n")
+        return CLI_EXIT["usage"]
+    if args.command == "watch":
+        watch(args.paths, spec, out_dir=args.out_dir, interval=args.interval, jobs=args.jobs)
+        return CLI_EXIT["ok"]
+    jobs = [(os.path.abspath(f), spec, os.path.join(args.out_dir, str(i)) if args.out_dir else None)
+            for i, f in enumerate(args.files)]  # 同名文件互不覆盖，未指定输出目录时各自使用临时目录
+    code = CLI_EXIT["ok"]
+
+    def _emit(res):
+        sys.stdout.write(json.dumps(res, ensure_ascii=False) + "\n")
+        sys.stdout.flush()
+        return CLI_EXIT[res["status"]]
+
+    if args.jobs <= 1:
+        for job in jobs:
+            code = max(code, _emit(_validate_file(*job)))
+    else:
+        with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            futures = [pool.submit(_validate_file, *job) for job in jobs]
+            for future in as_completed(futures):
+                code = max(code, _emit(future.result()))
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
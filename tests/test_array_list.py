@@ -0,0 +1,26 @@
+import numpy as np
+
+import check2
+
+
+MIXED = np.array(["x", np.nan, "x", " x", np.nan, "y"], dtype=object)
+
+
+def test_factor_mixed_object():
+    assert check2.ArrayList(MIXED, no_log=True).factor(min_num=1, max_num=4) == 0
+    assert check2.ArrayList(MIXED, no_log=True).factor(exp_num=3).startswith("有4个元素")
+
+
+def test_dup_ban_mixed_object():
+    ob_list = check2.ArrayList(MIXED, no_log=True)
+    assert ob_list.dup() == '存在重复的元素: "x", "nan"，请检查'
+    assert ob_list.ban(["nan", "y"]) == '元素: "nan", "y"，请检查'
+
+
+def test_same_result_as_list():
+    for arr in (np.array([" a", "b", "a ", "c", "b"]), np.array([1, 2, 2, 3, 1]), np.array([0.0, -0.0, 1.5, 1.5]),
+                np.array(["1", 1, 1.0, " 1"], dtype=object)):
+        ob_list = check2.List(arr.tolist(), no_log=True, max_show=5)
+        ob_arr = check2.ArrayList(arr, no_log=True, max_show=5)
+        assert ob_arr.dup() == ob_list.dup()
+        assert (ob_arr.ban(["1", "b"]) == 0) == (ob_list.ban(["1", "b"]) == 0)
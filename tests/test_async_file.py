@@ -0,0 +1,29 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import check2
+
+
+def test_async_file_same_as_sync(tmp_path):
+    files = []
+    for n, text in enumerate(("id\ta\tb\n1\t2\t3\n4\t5\t6\n", "id\ta\tb\n1\tx\t3\n1\t5\n")):
+        in_file = tmp_path / f"{n}.txt"
+        in_file.write_text(text)
+        files.append(str(in_file))
+    kwargs = dict(pre_check=False, ck_col_type=True, rm_first=True)
+
+    async def run(executor):
+        jobs = []
+        for in_file in files:
+            ob_file = check2.AsyncFile(in_file, no_log=True, executor=executor)
+            jobs += [ob_file.get_dim(), ob_file.check_base(), ob_file.check_content(str(tmp_path), **kwargs)]
+        return await asyncio.gather(*jobs)
+
+    expect = []
+    for in_file in files:
+        ob_file = check2.File(in_file, no_log=True)
+        expect += [(ob_file.get_row_num(), ob_file.get_col_num()), ob_file.check_base(), ob_file.check_content(str(tmp_path), **kwargs)]
+    assert expect[5]  # 第二个文件不符合
+    assert asyncio.run(run(None)) == expect
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert asyncio.run(run(executor)) == expect
@@ -0,0 +1,45 @@
+import pickle
+
+import check2
+
+
+def _write_table(path, rows=40, cols=10):
+    with open(path, "w") as fileOUT:
+        fileOUT.write("id\t" + "\t".join(f"s{i}" for i in range(cols)) + "\n")
+        for r in range(rows):
+            fileOUT.write(f"g{r}\t" + "\t".join("x" if (i, r) == (3, 7) else str(r * i - 5) for i in range(cols)) + "\n")
+
+
+def test_col_type_workers_same_result(tmp_path):
+    in_file = tmp_path / "a.txt"
+    _write_table(in_file)
+    kwargs = dict(out_dir=str(tmp_path), pre_check=False, ck_col_type=True, ck_col_num_range=True, col_min_num=0)
+    serial = check2.File(str(in_file), no_log=True).check_content(**kwargs)
+    assert serial and any("列号5" in i for i in serial)
+    assert check2.File(str(in_file), no_log=True).check_content(workers=3, **kwargs) == serial
+
+
+def test_early_return_is_plain_list(tmp_path):
+    in_file = tmp_path / "a.txt"
+    _write_table(in_file)
+    res = check2.File(str(in_file), no_log=True).check_content(out_dir=str(tmp_path), pre_check=False,
+                                                               row_num_exp=5, max_errors=10)
+    assert res and type(res) is list
+    assert pickle.loads(pickle.dumps(res)) == res
+
+
+def test_workers_reuse_one_pool(tmp_path, monkeypatch):
+    in_file = tmp_path / "a.txt"
+    _write_table(in_file, cols=30)
+    created = []
+
+    class _Pool(check2.ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            created.append(self)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(check2, "ProcessPoolExecutor", _Pool)
+    kwargs = dict(out_dir=str(tmp_path), pre_check=False, ck_col_type=True)
+    serial = check2.File(str(in_file), no_log=True).check_content(**kwargs)
+    assert check2.File(str(in_file), no_log=True).check_content(workers=2, **kwargs) == serial
+    assert len(created) == 1  # 多批列检查复用同一进程池
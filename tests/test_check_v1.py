@@ -0,0 +1,241 @@
+"""check.py（v1）与基线版本输出一致性检查，GOLDEN为基线check.py对相同输入的输出"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+import check
+
+
+DATA = ("id\ts1\ts2\ts3\ts4\ts5\n"
+        "g1\t1.5\t2\tNA\t4\t4\n"
+        "g2\t 3 \t3\t3\t3\t3\n"
+        "g3\t-1\tx\t5\t0\t7\n"
+        "g1\t2\t2\t\t8\t9\n"
+        "g5\t7\t7\t1e3\tN/A\t1\n"
+        "g1\t2\t2\t\t8\t9\n")
+CASES = [
+    dict(),
+    dict(ck_line_dup=True, ck_row_list=None, ck_col_list=None),
+    dict(ck_col_type=True, ck_col_type_list=[2, 3, 4, 5, 6], rm_first=True, ck_col_num_range=True, col_min_num=0,
+         ban_num=[0], ck_col_standard=True, ck_row_standard=True),
+    dict(ck_row_type=True, ck_row_type_list=[2, 3], rm_first=True, ck_row_num_range=True, row_max_num=5, ban_num=3),
+    dict(ck_row_list=[1, 2, 3], ck_col_list=[1, 2], ban_list=["x", "3"], na_list=["NA", ""], row_length=6,
+         col_length=7, ck_row_fix=True, row_fix_content=["id", "s1", "s2", "s3", "s4", "s6"], ck_col_fix=True,
+         col_fix_content=["id", "g1", "g2", "g3", "g1", "g5", "g1"]),
+    dict(fill_null=True, ck_col_type=True, ck_col_type_list=-1, exp_type="int", ck_standard_list=[1, 2]),
+    dict(ck_row_num=True, row_num_exp=5, col_num_exp=6, com_col_row_mum=True, row_greater=True),
+]
+NUM = ("id\ts1\ts2\ts3\n"
+       "g1\t1\t2\t5\n" "g2\t4\t4\t5\n" "g3\t0\t3\t5\n" "g4\t9\t-2\t5\n" "g5\t5\t5\t5\n")
+NUM_CASES = [
+    dict(ck_col_type=True, ck_col_type_list=-1, rm_first=True, ck_col_standard=True, ck_row_standard=True,
+         ck_row_type=True, ck_row_type_list=-1, ck_col_num_range=True, col_min_num=0, ban_num=[9]),
+    dict(ck_col_type=True, ck_col_type_list=[2, 4], rm_first=True, ck_col_standard=True, ck_standard_list=[4],
+         exp_type="int", ck_col_num_ban=False, ban_num=[2]),
+    dict(ck_col_type=True, ck_col_type_list=-1, rm_first=True, ck_col_standard=True, ck_standard_list=-1),
+    dict(ck_row_type=True, ck_row_type_list=-1, rm_first=True, ck_row_standard=True, ck_standard_list=-1),
+    dict(ck_col_type=True, ck_col_type_list=[2, 3, 4], rm_first=True, ck_col_standard=True, ck_standard_list=[3, 4]),
+]
+
+GOLDEN = {
+    "content0": [
+        "输入文件data.txt第1列有重复：存在重复的元素: \"g1\"，请检查，该列不允许重复值"
+    ],
+    "content1": [
+        "输入文件data.txt：data.txt发现重复行，行号： \"7\""
+    ],
+    "content2": [
+        "输入文件data.txt第1列有重复：存在重复的元素: \"g1\"，请检查，该列不允许重复值",
+        "输入文件data.txt第2列下限为0，上限为正无穷，检查到：第 \"3\"个数值超出界限",
+        "输入文件data.txt第3列检查到非数值类值： 'x'",
+        "输入文件data.txt第4列检查到非数值类值： 'NA'",
+        "输入文件data.txt第5列检查到非数值类值： 'N/A'"
+    ],
+    "content3": [
+        "输入文件data.txt第1列有重复：存在重复的元素: \"g1\"，请检查，该列不允许重复值",
+        "输入文件data.txt第2行检查到非数值类值： 'NA'",
+        "输入文件data.txt第3行 \n禁用值为 \"3\"，检查到：第 \"1\", \"2\", \"3\", \"4\", \"5\"个数值为禁用值，"
+    ],
+    "content4": [
+        "输入文件data.txt第2行有重复：存在重复的元素: \"4\"，请检查，该行不允许重复值",
+        "输入文件data.txt第2行 \n含有空或缺失元素 \"NA\"，请检查，可将内容复制到xlsx表格中，检查是否为分隔符使用错误导致",
+        "输入文件data.txt第3行有重复：存在重复的元素: \"3\"，请检查，该行不允许重复值",
+        "输入文件data.txt第3行检查到非法元素元素 \"3\"，请检查",
+        "输入文件data.txt第1列有重复：存在重复的元素: \"g1\"，请检查，该列不允许重复值",
+        "输入文件data.txt第2列有重复：存在重复的元素: \"2\"，请检查，该列不允许重复值",
+        "输入文件data.txt第2列检查到非法元素元素 \"3\"，请检查",
+        "输入文件data.txt第1行必须为id,s1,s2,s3,s4,s6，\n实际该行为id,s1,s2,s3,s4,s5，请检查"
+    ],
+    "content5": [
+        "输入文件data.txt第1列有重复：存在重复的元素: \"g1\"，请检查，该列不允许重复值",
+        "输入文件data.txt第2列检查到非整数类值： 's1'",
+        "输入文件data.txt第3列检查到非整数类值： 's2'",
+        "输入文件data.txt第4列检查到非整数类值： 's3'",
+        "输入文件data.txt第5列检查到非整数类值： 's4'",
+        "输入文件data.txt第6列检查到非整数类值： 's5'"
+    ],
+    "content6": [
+        "输入文件data.txt行数有误：有7个行，应为5个行"
+    ],
+    "num0": [
+        "输入文件data.txt第5行禁用值为 \"9\"，检查到：第 \"1\"个数值为禁用值，",
+        "输入文件data.txt第2列禁用值为 \"9\"，检查到：第 \"4\"个数值为禁用值，",
+        "输入文件data.txt第3列下限为0，上限为正无穷，检查到：第 \"4\"个数值超出界限"
+    ],
+    "num1": [
+        "输入文件data.txt第4列数据完全一致，标准差为0，不能按列进行标准化，请删除该列或尝试按行标准化"
+    ],
+    "num2": [
+        "输入文件data.txt第4列数据完全一致，标准差为0，不能按列进行标准化，请删除该列或尝试按行标准化"
+    ],
+    "num3": [
+        "输入文件data.txt第6行数据完全一致，标准差为0，不能按行进行标准化，请删除该行或尝试按列标准化"
+    ],
+    "num4": [
+        "输入文件data.txt第4列数据完全一致，标准差为0，不能按列进行标准化，请删除该列或尝试按行标准化"
+    ],
+    "line_dup": "data.txt发现重复行，行号： \"7\"",
+    "row2list": [
+        [
+            "id",
+            "s1",
+            "s2",
+            "s3",
+            "s4",
+            "s5"
+        ],
+        [
+            "id",
+            "s1",
+            "s2",
+            "s3",
+            "s4",
+            "s5"
+        ],
+        [
+            "g2",
+            "3",
+            "3",
+            "3",
+            "3",
+            "3"
+        ],
+        [
+            "g2",
+            "3",
+            "3",
+            "3",
+            "3",
+            "3"
+        ],
+        [
+            "g5",
+            "7",
+            "7",
+            "1e3",
+            "N/A",
+            "1"
+        ],
+        [
+            "g5",
+            "7",
+            "7",
+            "1e3",
+            "NA",
+            "1"
+        ]
+    ],
+    "col2list": [
+        [
+            "id",
+            "g1",
+            "g2",
+            "g3",
+            "g1",
+            "g5",
+            "g1"
+        ],
+        [
+            "id",
+            "g1",
+            "g2",
+            "g3",
+            "g1",
+            "g5",
+            "g1"
+        ],
+        [
+            "s1",
+            "1.5",
+            "3",
+            "-1",
+            "2",
+            "7",
+            "2"
+        ],
+        [
+            "s1",
+            "1.5",
+            "3",
+            "-1",
+            "2",
+            "7",
+            "2"
+        ],
+        [
+            "s3",
+            "NA",
+            "3",
+            "5",
+            "",
+            "1e3",
+            ""
+        ],
+        [
+            "s3",
+            "NA",
+            "3",
+            "5",
+            "NA",
+            "1e3",
+            "NA"
+        ]
+    ]
+}
+
+
+def _data_file(tmp_path, text):
+    in_file = tmp_path / "data.txt"
+    in_file.write_text(text)
+    return str(in_file)
+
+
+@pytest.mark.parametrize("no", range(len(CASES)))
+def test_check_file_content(tmp_path, no):
+    in_file = _data_file(tmp_path, DATA)
+    res = check.check_file_content(in_file, str(tmp_path / "out"), no_log=True, **CASES[no])
+    assert res == GOLDEN[f"content{no}"]
+
+
+@pytest.mark.parametrize("no", range(len(NUM_CASES)))
+def test_check_file_content_num(tmp_path, no):
+    in_file = _data_file(tmp_path, NUM)
+    res = check.check_file_content(in_file, str(tmp_path / "out"), no_log=True, **NUM_CASES[no])
+    assert res == GOLDEN[f"num{no}"]
+
+
+def test_line_readers(tmp_path):
+    in_file = _data_file(tmp_path, DATA)
+    assert check.file_line_dup(in_file, no_log=True) == GOLDEN["line_dup"]
+    assert [check.get_row2list(in_file, i, fill_null=fill, no_log=True) for i in (1, 3, 6)
+            for fill in (False, True)] == GOLDEN["row2list"]
+    assert [check.get_col2list(in_file, i, fill_null=fill, no_log=True) for i in (1, 2, 4)
+            for fill in (False, True)] == GOLDEN["col2list"]
+
+
+def test_check2_imported_lazily():
+    code = "import sys, check; assert 'check2' not in sys.modules; " \
+           "check.get_row2list(check.__file__, 1, no_log=True); assert 'check2' in sys.modules"
+    subprocess.run([sys.executable, "-c", code], cwd=os.path.dirname(check.__file__), check=True)
@@ -0,0 +1,46 @@
+import gzip
+import json
+
+import check2_cli
+
+
+def test_validate_exit_codes(tmp_path, monkeypatch, capsys):
+    tmp_root = tmp_path / "tmp"
+    tmp_root.mkdir()
+    monkeypatch.setattr(check2_cli.tempfile, "tempdir", str(tmp_root))
+    good, bad = tmp_path / "good.txt", tmp_path / "bad.txt"
+    good.write_text("id\ta\n1\t1\n")
+    bad.write_text("id\ta\n1\tx\n")
+    spec = tmp_path / "spec.yaml"
+    spec.write_text("content: {ck_col_type: true, exp_type: int, rm_first: true}\n")
+    assert check2_cli.main(["validate", "--spec", str(spec), str(good)]) == check2_cli.CLI_EXIT["ok"]
+    assert check2_cli.main(["validate", "--spec", str(spec), str(good), str(bad)]) == check2_cli.CLI_EXIT["fail"]
+    status = [json.loads(i)["status"] for i in capsys.readouterr().out.splitlines()]
+    assert status == ["ok", "ok", "fail"]
+    assert check2_cli.main(["validate", str(good)]) == check2_cli.CLI_EXIT["usage"]  # 缺少--spec
+    assert check2_cli.main(["validate", "--spec", str(tmp_path / "none.yaml"), str(good)]) == check2_cli.CLI_EXIT["usage"]
+    assert list(tmp_root.iterdir()) == []
+
+
+def test_watch_reruns_on_change(tmp_path, monkeypatch, capsys):
+    tmp_root = tmp_path / "tmp"
+    tmp_root.mkdir()
+    monkeypatch.setattr(check2_cli.tempfile, "tempdir", str(tmp_root))
+    data = tmp_path / "data"
+    data.mkdir()
+    in_file = data / "a.txt"
+    in_file.write_text("id\ta\n1\t1\n")
+    (data / "b.txt.gz").write_bytes(gzip.compress(b"id\ta\n" * 100)[:20])  # 压缩文件不完整
+    results = []
+
+    def emit(res):
+        results.append(res)
+        if len(results) == 1:
+            in_file.write_text("id\ta\n1\tx\n2\t2\n")
+
+    spec = {"content": {"ck_col_type": True, "exp_type": "int", "rm_first": True}}
+    check2_cli.watch([str(data)], spec, interval=0.01, rounds=3, emit=emit)
+    assert [(i["file"], i["status"], i["scope"]) for i in results] == \
+           [(str(in_file), "ok", "new"), (str(in_file), "fail", "body")]
+    assert "end-of-stream" in capsys.readouterr().err  # 无法读取的文件仅报告一次，不输出结果
+    assert list(tmp_root.iterdir()) == []
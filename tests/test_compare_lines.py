@@ -0,0 +1,39 @@
+import pytest
+
+import check2
+
+COMPARE_CASES = [  # (参数, 报错信息)，不同元素按首次出现顺序展示
+    (dict(), '发现不同的样本，分别为： "s3", "s4"\n和 "s5"'),
+    (dict(ck_1_in_2=True, rm_first=True), '发现多出的样本，分别为： "s3", "s4"'),
+    (dict(order_strict=True), '长度不同，且发现不同的样本，分别为： "s1", "s2", "s3" '),
+    (dict(file1_dim="col", file2_dim="col", rm_first=True), '发现不同的样本，分别为： "g2"\n和 "g3"'),
+    (dict(file1_dim="col", ck_1_in_2=True), '发现多出的样本，分别为： "g1", "g2"'),
+]
+
+
+def test_compare_lines_per_target(tmp_path):
+    base = tmp_path / "base.txt"
+    base.write_text("id\t" + "\t".join(f"s{i}" for i in range(50)) + "\n")
+    targets = []
+    for n in range(12):
+        target = tmp_path / f"t{n}.txt"
+        target.write_text("id\t" + "\t".join(f"s{i}" for i in range(50) if i != n) + f"\tz{n}\n")
+        targets.append(str(target))
+    res = check2.File(str(base), no_log=True).compare_lines(targets, rm_first=True, workers=6, by_file=True)
+    assert list(res) == targets
+    for n, target in enumerate(targets):
+        msg = res[target]
+        assert f'"s{n}"' in msg and f'"z{n}"' in msg
+        assert not any(f'"z{m}"' in msg for m in range(12) if m != n)
+
+
+@pytest.mark.parametrize("kwargs, msg", COMPARE_CASES)
+def test_compare_line(tmp_path, kwargs, msg):
+    file1, file2 = tmp_path / "a.txt", tmp_path / "b.txt"
+    file1.write_text("id\ts1\ts2\ts3\ts4\ng1\t1\t2\t3\t4\ng2\t5\t6\t7\t8\n")
+    file2.write_text("id\ts2\ts1\ts5\ng1\t1\t2\t3\ng3\t5\t6\t7\n")
+    res = check2.File(str(file1), no_log=True).compare_line(str(file2), **kwargs)
+    dims = "".join("列号1" if kwargs.get(i) == "col" else "行号1" for i in ("file1_dim", "file2_dim"))
+    assert res == [f"a.txt{dims[:3]} <-> b.txt{dims[3:]}:{msg}"]
+    if dims[:3] == dims[3:]:
+        assert check2.File(str(file1), no_log=True).compare_line(str(file1), **kwargs) == 0
@@ -0,0 +1,94 @@
+import socket
+import threading
+import time
+
+import pytest
+
+import check2_cli
+
+
+def _listener(path):
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(path))
+    server.listen(1)
+    return server
+
+
+def test_serve_keeps_non_socket(tmp_path):
+    path = tmp_path / "daemon.sock"
+    path.write_text("data")
+    with pytest.raises(FileExistsError):
+        check2_cli.serve(str(path), jobs=1)
+    assert path.read_text() == "data"
+
+
+def test_serve_keeps_live_socket(tmp_path):
+    path = tmp_path / "daemon.sock"
+    with _listener(path):
+        with pytest.raises(OSError, match="already listening"):
+            check2_cli.serve(str(path), jobs=1)
+        assert path.is_socket()
+
+
+def test_serve_replaces_stale_socket(tmp_path):
+    path = tmp_path / "daemon.sock"
+    _listener(path).close()  # 残留套接字
+    in_file = tmp_path / "a.txt"
+    in_file.write_text("id\ta\ng1\t1\n")
+    thread = threading.Thread(target=check2_cli.serve, args=(str(path), ), kwargs=dict(jobs=1), daemon=True)
+    thread.start()
+    for _ in range(100):
+        if check2_cli._socket_alive(str(path)):
+            break
+        time.sleep(0.1)
+    res = check2_cli.validate_file(str(in_file), socket_path=str(path), timeout=30)
+    assert res["status"] == "ok" and res["cached"] is False
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(str(path))
+        client.sendall(b'{"cmd": "shutdown"}\n')
+        client.recv(1024)
+    thread.join(30)
+    assert not path.exists()
+
+
+def test_validate_file_timeout_is_error(tmp_path):
+    path = tmp_path / "daemon.sock"
+    in_file = tmp_path / "a.txt"
+    in_file.write_text("id\ta\ng1\t1\n")
+    with _listener(path):  # 接受连接但不响应
+        res = check2_cli.validate_file(str(in_file), socket_path=str(path), timeout=0.5)
+    assert res["status"] == "error" and "TimeoutError" in res["errors"][0]
+
+
+def test_validate_file_without_daemon(tmp_path):
+    in_file = tmp_path / "a.txt"
+    in_file.write_text("id\ta\ng1\t1\n")
+    res = check2_cli.validate_file(str(in_file), socket_path=str(tmp_path / "none.sock"))
+    assert res["status"] == "ok" and res["cached"] is False
+
+
+def test_serve_probe_quiet_and_no_temp_dir(tmp_path, monkeypatch, capsys):
+    tmp_root = tmp_path / "tmp"
+    tmp_root.mkdir()
+    monkeypatch.setattr(check2_cli.tempfile, "tempdir", str(tmp_root))
+    path = tmp_path / "daemon.sock"
+    in_file = tmp_path / "a.txt"
+    in_file.write_text("id\ta\n1\t1\n")
+    thread = threading.Thread(target=check2_cli.serve, args=(str(path), ), kwargs=dict(jobs=1), daemon=True)
+    thread.start()
+    for _ in range(100):
+        if check2_cli._socket_alive(str(path)):  # 探测连接不发送请求
+            break
+        time.sleep(0.1)
+    spec = {"content": {"ck_col_type": True, "exp_type": "int", "rm_first": True}}
+    for _ in range(2):
+        res = check2_cli.validate_file(str(in_file), spec, socket_path=str(path), timeout=30)
+        assert res["status"] == "ok"
+    assert res["cached"] is True
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(str(path))
+        client.sendall(b'{"cmd": "shutdown"}\n')
+        client.recv(1024)
+    thread.join(30)
+    assert list(tmp_root.iterdir()) == []
+    assert "Traceback" not in capsys.readouterr().err
@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+import check2
+
+
+DUPS = ["a", "a", "b", "b", "c", "c", "d", "d", "e"]  # 4个重复元素
+
+
+@pytest.mark.parametrize("sketch", [False, True])
+def test_dup_total_exact(sketch):
+    ob_list = check2.List(DUPS, no_log=True, max_show=2, sketch=sketch)
+    assert ob_list.dup().endswith('"a", "b", ...等，共计4个元素，请检查')
+    assert ob_list.err_agg.count("dup") == 4 and ob_list.err_agg.exact("dup")
+
+
+@pytest.mark.parametrize("sketch", [False, True])
+def test_dup_total_lower_bound(sketch):
+    ob_list = check2.List(DUPS, no_log=True, max_errors=3, max_show=2, sketch=sketch)
+    assert ob_list.dup().endswith('"a", "b", ...等，共计≥4个元素，请检查')
+    assert not ob_list.err_agg.exact("dup")
+    assert not ob_list.err_agg.summary()["dup"]["exact"]
+
+
+def test_dup_max_errors_without_max_show():
+    msg = check2.List(DUPS, no_log=True, max_errors=3).dup()
+    assert msg.endswith('"a", "b", "c", ...，请检查')
+
+
+def test_dup_max_errors_not_reached():
+    ob_list = check2.List(DUPS, no_log=True, max_errors=10, max_show=2)
+    assert ob_list.dup().endswith("共计4个元素，请检查")
+    assert ob_list.err_agg.exact("dup")
+
+
+def test_array_dup_total():
+    ob_list = check2.ArrayList(np.array(DUPS), no_log=True, max_show=2)
+    assert ob_list.dup().endswith('"a", "b", ...等，共计4个元素，请检查')
+
+
+def test_num_ban_total():
+    ob_list = check2.ArrayList(np.array([1.0, 0.0, 0.0, 2.0, 0.0]), no_log=True, max_show=1)
+    assert "第 \"2\", ...等，共计3个" in ob_list.num_ban(0)
+
+
+def test_line_dup_keeps_positions_not_text(tmp_path):
+    in_file = tmp_path / "a.txt"
+    in_file.write_text("x\ny\nx\nx\ny\nz\n")
+    ob_file = check2.File(str(in_file), no_log=True)
+    assert ob_file.line_dup(max_show=1).endswith('"3", ...等，共计3行')
+    assert ob_file.err_agg.positions("line_dup") == [3, 4]
+    assert all(isinstance(i, int) for i in ob_file.err_agg.values("line_dup"))
+    assert ob_file.line_dup().endswith('"3", "4", "5"')
+    assert len(set(ob_file.err_agg.values("line_dup"))) == 2
+
+
+def test_dup_max_errors_lazy():
+    ob_list = check2.List(DUPS, no_log=True, max_errors=2)
+    assert ob_list.dup().endswith('"a", "b", ...，请检查')
+    assert ob_list.in_list is None  # 提前停止模式不生成去空白列表
+    assert check2.List(["a", "b"], no_log=True, max_errors=2).dup() == 0
+
+
+def test_max_errors_zero_is_fail_fast(tmp_path):
+    in_file = tmp_path / "a.txt"
+    in_file.write_text("id\ta\ta\ng1\t1\t2\ng1\t2\t3\n")
+    kwargs = dict(out_dir=str(tmp_path), pre_check=False)
+    full = check2.File(str(in_file), no_log=True).check_content(**kwargs)
+    assert len(full) == 2
+    assert check2.File(str(in_file), no_log=True).check_content(max_errors=0, **kwargs) == full[:1]
+    assert check2.File(str(in_file), no_log=True).check_content(fail_fast=True, **kwargs) == full[:1]
+    assert check2.List(DUPS, no_log=True, max_errors=0).dup().endswith('"a", ...，请检查')
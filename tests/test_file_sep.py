@@ -0,0 +1,20 @@
+import check2
+
+LINES = ["id\ta\tb", "\tg1\t1\t2", "g2\t\t3", "g3 \t4\t5", "g4\t 6\t7", "g5\t8\t9 ", "g6\t1\t2", "\t\tx \t y "]
+
+
+def test_file_sep_matches_line_sep(tmp_path):
+    in_file = tmp_path / "a.txt"
+    in_file.write_text("\n".join(LINES) + "\n")
+    ob_file = check2.File(str(in_file), no_log=True)
+    res = ob_file.file_sep()
+    assert dict(res) == {"head_sep": [2, 8], "sep_sep": [3, 8], "blank_sep": [3, 4, 8], "sep_blank": [3, 5, 8],
+                         "tail_blank": [6, 8]}
+    flagged = sorted(set(sum(res.values(), [])))
+    assert flagged == [no for no, line in enumerate(LINES, 1) if ob_file.line_sep(line)]  # 与逐行line_sep一致
+
+
+def test_file_sep_clean(tmp_path):
+    in_file = tmp_path / "a.csv"
+    in_file.write_text("id,a\ng1,1\n")
+    assert check2.File(str(in_file), sep=",", no_log=True).file_sep(sep_r=",") == 0
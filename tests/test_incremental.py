@@ -0,0 +1,15 @@
+import check2
+
+
+def test_check_incremental_matches_full(tmp_path):
+    in_file = tmp_path / "a.txt"
+    in_file.write_bytes(b"id\ta\tb\r\n1\t1\t2\r\n2\t3\t4\r\n")
+    kwargs = dict(ck_col_type=True, rm_first=True, ck_col_num_range=True, col_min_num=0)
+    assert check2.File(str(in_file), no_log=True).check_incremental(**kwargs) == 0
+    with open(in_file, "ab") as fileOU:
+        fileOU.write(b"1\t-1\tx\r\n4\t5\t6\r\n")  # 追加重复、超限及类型错误元素
+    inc = check2.File(str(in_file), no_log=True).check_incremental(**kwargs)
+    full = check2.File(str(in_file), no_log=True).check_content(
+        str(tmp_path), pre_check=False, ck_row_base=False, ck_col_list=None, ck_col_type_list=None, **kwargs)
+    assert inc and inc == full
+    assert check2.File(str(in_file), no_log=True).check_incremental(reset=True, **kwargs) == inc
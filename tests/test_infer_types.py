@@ -0,0 +1,13 @@
+import check2
+
+
+def test_infer_types_output(tmp_path):
+    in_file = tmp_path / "a.txt"
+    in_file.write_text("i\tf\tb\ts\tn\n1\t1\tTrue\tTrue\tNA\n2\t2.5\tFalse\tx\tNA\nNA\tx1\tNA\t3\tNA\n")
+    info = check2.File(str(in_file), no_log=True).infer_types(rm_first=True)
+    assert [i["type"] for i in info.values()] == ["int", "str", "bool", "str", None]
+    assert info[1]["na"] == 1 and info[1]["counter"] is None and info[1]["bad"]["int"] == (4, "NA")
+    assert info[2]["counter"] == (2, "1") and info[2]["miss"]["float"] == (4, "x1")  # str列报告否定bool的首个反例
+    assert info[3]["counter"] == (2, "True") and info[3]["bad"]["int"] == (2, "True")
+    assert info[4]["counter"] == (3, "x")
+    assert info[5]["counter"] is None
@@ -0,0 +1,18 @@
+import check2
+
+
+def test_line_index_cached_until_change(tmp_path, monkeypatch):
+    in_file = tmp_path / "a.txt"
+    in_file.write_text("id\ts1\ts2\ng1\t1\t2\n")
+    reads = []
+    line2list = check2._line2list
+    monkeypatch.setattr(check2, "_line2list", lambda *args: reads.append(args) or line2list(*args))
+    ob_file = check2.File(str(in_file), no_log=True)
+    for _ in range(3):
+        assert ob_file.str_in_line(["s1", "s2"], row_no=1) == 0
+    assert ob_file.str_in_line("g1", col_no=1) == 0
+    assert len(reads) == 2  # 行、列索引各读取一次
+    assert ob_file.get_line_index("row", 1) is ob_file.get_line_index("row", 1)
+    in_file.write_text("id\ts1\ts22\ng1\t1\t2\n")  # 大小变化
+    res = ob_file.str_in_line(["s1", "s2"], row_no=1)
+    assert len(reads) == 3 and res and '"s2"' in res[0]
@@ -0,0 +1,25 @@
+import pytest
+
+import check2
+
+TABLES = {
+    "numeric": "id\ts1\ts2\ts3\ts4\ng1\t1\t2\t3\t3\ng2\t1.0\t-2\t3\t3\ng3\t1.00\t5e3\t3\t3\ng4\t1\t0\t3\t3\n",
+    "mixed": "id\ts1\ts2\ts3\ng1\t1\tx\t3\ng2\t1\tNA\t3\ng3\tinf\t4\t \ng4\t2\t4\t2\n",
+    "ragged": "id\ts1\ts2\ng1\t1\t2\ng2\t3\ng3\t4\t4\n",
+}
+OPTIONS = [
+    dict(ck_col_type=True, ck_col_type_list=-1, ck_col_standard=True, ck_standard_list=-1, rm_first=True),
+    dict(ck_row_type=True, ck_row_type_list=-1, ck_row_standard=True, ck_standard_list=-1, rm_first=True,
+         ck_row_num_range=True, row_min_num=0, ban_num=[3]),
+    dict(ck_col_type=True, ck_col_type_list=-1, exp_type="int", rm_first=True, ck_col_num_range=True, col_max_num=4),
+]
+
+
+@pytest.mark.parametrize("table", TABLES)
+@pytest.mark.parametrize("kwargs", OPTIONS)
+def test_matrix_same_result(tmp_path, table, kwargs):
+    in_file = tmp_path / "a.txt"
+    in_file.write_text(TABLES[table])
+    kwargs = dict(out_dir=str(tmp_path), pre_check=False, ck_row_base=False, ck_col_base=False, **kwargs)
+    expect = check2.File(str(in_file), no_log=True).check_content(**kwargs)
+    assert check2.File(str(in_file), no_log=True).check_content(matrix=True, **kwargs) == expect
@@ -0,0 +1,61 @@
+import gzip
+import os
+import shutil
+import sys
+
+import pytest
+
+import check2
+import check2_cli
+
+
+RAW = "id\ta\tb\n\ng1\t 1 \t2\n   \ng2\t3\t4\n"
+
+
+@pytest.mark.parametrize("out_compress", ["gzip", "bgzip", "zstd"])
+def test_out_compress_keeps_input(tmp_path, out_compress):
+    if out_compress == "zstd":
+        pytest.importorskip("zstandard")
+    in_file = tmp_path / "t.txt"
+    in_file.write_text(RAW)
+    ob_file = check2.File(str(in_file), no_log=True)
+    assert ob_file.pre_check_content(out_dir=str(tmp_path), out_compress=out_compress) == 0
+    assert in_file.read_text() == RAW
+    new_file = str(in_file) + check2.COMPRESS_SUFFIX[out_compress]
+    with check2._open_bin(new_file) as fileIN:
+        assert fileIN.read().decode() == "id\ta\tb\ng1\t1\t2\ng2\t3\t4\n"
+    assert sorted(os.listdir(tmp_path)) == sorted(["t.txt", os.path.basename(new_file)])
+
+
+def test_compressed_input_to_plain(tmp_path):
+    in_file = tmp_path / "t.txt.gz"
+    with gzip.open(in_file, "wt") as fileOUT:
+        fileOUT.write(RAW)
+    raw_bytes = in_file.read_bytes()
+    assert check2.File(str(in_file), no_log=True).pre_check_content(out_dir=str(tmp_path)) == 0
+    assert in_file.read_bytes() == raw_bytes
+    assert (tmp_path / "t.txt").read_text() == "id\ta\tb\ng1\t1\t2\ng2\t3\t4\n"
+    assert sorted(os.listdir(tmp_path)) == ["t.txt", "t.txt.gz"]
+
+
+def _write_zst(path, text):
+    zstandard = pytest.importorskip("zstandard")
+    path.write_bytes(zstandard.ZstdCompressor().compress(text.encode()))
+
+
+@pytest.mark.parametrize("backend", ["zstandard", "zstd"])
+def test_zstd_input(tmp_path, monkeypatch, backend):
+    in_file = tmp_path / "t.txt.zst"
+    _write_zst(in_file, RAW)
+    if backend == "zstd":  # 未安装zstandard时使用zstd命令解压
+        if shutil.which("zstd") is None:
+            pytest.skip("zstd not found")
+        monkeypatch.setitem(sys.modules, "zstandard", None)
+    ob_file = check2.File(str(in_file), no_log=True)
+    assert ob_file.pre_check_content(out_dir=str(tmp_path / "out")) == 0
+    assert (tmp_path / "out" / "t.txt").read_text() == "id\ta\tb\ng1\t1\t2\ng2\t3\t4\n"
+    report = ob_file.check_sample(blocks=2, block_size=1024)
+    assert report["rows"] == 2 and report["col_num"]["fail"] == 0
+    plain = tmp_path / "t.txt"
+    plain.write_text(RAW)
+    assert check2_cli._header_body_md5(str(in_file)) == check2_cli._header_body_md5(str(plain))
@@ -0,0 +1,24 @@
+import pytest
+
+import check2
+
+
+@pytest.mark.parametrize("ck_row_list", [None, -1])
+def test_row_shards_same_result(tmp_path, monkeypatch, ck_row_list):
+    in_file = tmp_path / "a.txt"
+    with open(in_file, "w") as fileOUT:
+        fileOUT.write("id\t" + "\t".join(f"s{i}" for i in range(6)) + "\n")
+        for r in range(300):
+            row = [str(r * i) for i in range(6)]
+            row[r % 6] = {7: "x", 50: "NA", 123: "-1"}.get(r, row[r % 6])
+            fileOUT.write(f"g{r % 280}\t" + "\t".join(row) + "\n")
+    kwargs = dict(out_dir=str(tmp_path), pre_check=False, ck_row_list=ck_row_list, ck_row_type=True,
+                  rm_first=True, ck_row_num_range=True, row_min_num=0, ck_col_base=False)
+    serial = check2.File(str(in_file), no_log=True).check_content(**kwargs)
+    assert serial
+    calls = []
+    shard_row_flags = check2.File._shard_row_flags
+    monkeypatch.setattr(check2.File, "_shard_row_flags",
+                        lambda *args, **kw: calls.append(1) or shard_row_flags(*args, **kw))
+    assert check2.File(str(in_file), no_log=True).check_content(row_shards=3, **kwargs) == serial
+    assert calls
@@ -0,0 +1,37 @@
+import gzip
+
+import check2
+
+
+def _write_table(path, rows, bad=lambda i: False, opener=open):
+    with opener(path, "wt") as fileOUT:
+        fileOUT.write("id\ta\tb\n")
+        for i in range(rows):
+            fileOUT.write(f"g{i}\t{'x' if bad(i) else i}\t{i * 0.5}\n")
+
+
+def test_sample_compressed_trims_last_line(tmp_path):
+    in_file = tmp_path / "t.txt.gz"
+    _write_table(in_file, 20000, opener=gzip.open)
+    report = check2.File(str(in_file), no_log=True).check_sample(blocks=4, block_size=4096)
+    assert report["seek"] is False
+    assert 0 < report["rows"] < 20000
+    assert report["col_num"]["fail"] == 0
+    assert report["type"][2]["fail"] == 0 and report["type"][3]["fail"] == 0
+
+
+def test_sample_cluster_interval(tmp_path):
+    in_file = tmp_path / "t.txt"
+    _write_table(in_file, 40000, bad=lambda i: (i // 500) % 10 == 0)  # 不合格行成段出现
+    report = check2.File(str(in_file), no_log=True).check_sample(blocks=16, block_size=4096, seed=1)
+    stat = report["type"][2]
+    assert stat["fail"] > 0 and stat["deff"] > 1
+    low, high = check2._wilson(stat["fail"], stat["n"])
+    assert stat["low"] < low and stat["high"] > high
+    assert report["type"][3]["fail"] == 0 and report["type"][3]["deff"] == 1
+
+
+def test_cluster_wilson_independent():
+    low, high, deff = check2._cluster_wilson([(5, 100), (5, 100), (5, 100)])
+    assert deff == 1.0
+    assert (low, high) == check2._wilson(15, 300)
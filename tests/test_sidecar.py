@@ -0,0 +1,33 @@
+import numpy as np
+
+import check2
+
+
+def test_sidecar_round_trip_with_na(tmp_path):
+    in_file = tmp_path / "quant.txt"
+    in_file.write_text("id\tv1\tv2\tflag\tempty\n"
+                       "g1\t1.5\tNA\tTRUE\tNA\n"
+                       "g2\t\t 2 \tFALSE\t\n"
+                       "g3\t3\tN/A\tNULL\tNULL\n"
+                       "g4\t-4e2\tx\tTRUE\tNA\n")
+    ob_file = check2.File(str(in_file), no_log=True)
+    assert ob_file.save_sidecar() == str(in_file) + check2.SIDECAR_SUFFIX
+    table = ob_file.load_sidecar()
+    assert list(table) == ["id", "v1", "v2", "flag", "empty"]
+    v1 = np.asarray(table["v1"])
+    assert v1.dtype == np.float64
+    np.testing.assert_array_equal(np.isnan(v1), [False, True, False, False])
+    np.testing.assert_array_equal(v1[~np.isnan(v1)], [1.5, 3, -400])
+    assert table["v2"].tolist() == ["NA", " 2 ", "N/A", "x"]  # 含非数值元素，按字符串保存
+    assert table["flag"].dtype.kind == "U"
+    assert table["empty"].tolist() == ["NA", "", "NULL", "NA"]  # 全缺失列按字符串保存
+
+
+def test_sidecar_stale_after_change(tmp_path):
+    in_file = tmp_path / "quant.txt"
+    in_file.write_text("id\tv1\ng1\t1\n")
+    ob_file = check2.File(str(in_file), no_log=True)
+    ob_file.save_sidecar()
+    assert ob_file.load_sidecar() is not None
+    in_file.write_text("id\tv1\ng1\t2\n")
+    assert ob_file.load_sidecar() is None
@@ -0,0 +1,21 @@
+import pytest
+
+import check2
+
+COLUMN = [f"s{i * 7919 % 60000}" for i in range(60000)] + [f"s{i}" for i in range(0, 3000, 3)]  # 1000个重复元素
+
+
+@pytest.mark.parametrize("max_show", [None, 5])
+def test_sketch_dup_same_as_exact(max_show):
+    exact = check2.List(COLUMN, no_log=True, max_show=max_show)
+    sketch = check2.List(COLUMN, no_log=True, max_show=max_show, sketch=True)
+    assert sketch.dup() == exact.dup()
+    assert sketch.err_agg.count("dup") == exact.err_agg.count("dup") == 1000
+    assert check2.List(COLUMN[:60000], no_log=True, sketch=True).dup() == 0
+
+
+@pytest.mark.parametrize("bounds", [(1, float("inf")), (50000, 70000), (60001, float("inf")), (1, 59999), (1, 60000)])
+def test_sketch_factor_same_as_exact(bounds):
+    min_num, max_num = bounds
+    exact = check2.List(COLUMN, no_log=True).factor(min_num=min_num, max_num=max_num)
+    assert check2.List(COLUMN, no_log=True, sketch=True).factor(min_num=min_num, max_num=max_num) == exact
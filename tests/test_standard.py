@@ -0,0 +1,36 @@
+import pytest
+
+import check2
+
+DATA = "id\ts1\ts2\ts3\ts4\ng1\t1\t2\t3\t5\ng2\t1.0\t2\tNA\t5\ng3\t1.00\t2.5\t3\tx\n"
+
+
+@pytest.mark.parametrize("kwargs", [dict(), dict(infer_type=True), dict(matrix=True)])
+def test_col_standard_constants(tmp_path, kwargs):
+    in_file = tmp_path / "a.txt"
+    in_file.write_text(DATA)
+    res = check2.File(str(in_file), no_log=True).check_content(
+        out_dir=str(tmp_path), pre_check=False, ck_col_type=True, ck_col_type_list=[2, 3], ck_col_standard=True,
+        ck_standard_list=[2, 3], rm_first=True, **kwargs)
+    assert res == ["输入文件a.txt列号2数据完全一致，标准差为0，不能按列进行标准化，请删除该列或尝试按行标准化"]  # 1/1.0/1.00数值相同
+
+
+def test_row_standard_constants(tmp_path):
+    in_file = tmp_path / "a.txt"
+    in_file.write_text("id\ts1\ts2\ng1\t2\t2.0\ng2\t1\t2\n")
+    res = check2.File(str(in_file), no_log=True).check_content(
+        out_dir=str(tmp_path), pre_check=False, ck_row_type=True, ck_row_type_list=-1, ck_row_standard=True,
+        ck_standard_list=-1, rm_first=True)
+    assert res == ["输入文件a.txt行号2数据完全一致，标准差为0，不能按行进行标准化，请删除该行或尝试按列标准化"]
+
+
+def test_incremental_standard_constants(tmp_path):
+    in_file = tmp_path / "a.txt"
+    in_file.write_text("id\ts1\ts2\n1\t1\t2\n2\t1.0\t3\n")
+    ob_file = check2.File(str(in_file), no_log=True)
+    kwargs = dict(ck_col_base=False, ck_col_type=True, rm_first=True, ck_col_standard=True)
+    assert ob_file.check_incremental(**kwargs) == \
+           ["输入文件a.txt列号2数据完全一致，标准差为0，不能按列进行标准化，请删除该列或尝试按行标准化"]
+    with open(in_file, "a") as fileOU:
+        fileOU.write("3\t4\t5\n")
+    assert ob_file.check_incremental(**kwargs) == 0
@@ -0,0 +1,37 @@
+import pytest
+
+import check2
+
+STRINGS = ["S1", "s-2.a", "0bad", "中文名", "a b", "样本x1", "toolongname_" * 3, "", "ok_1", "s1;x", 12]
+OPTIONS = [
+    dict(),
+    dict(ck_chinese=False, allow_space=True),
+    dict(elen=4, ban_list=[";", "x"]),
+    dict(min_len=2, max_len=5, ck_format=False, ban_list=["-"]),
+]
+
+
+@pytest.mark.parametrize("kwargs", OPTIONS)
+def test_check_many_same_as_check(kwargs):
+    res = check2.Str.check_many(STRINGS, add_info="[t]", no_log=True, **kwargs)
+    expect = {}
+    for i, x in enumerate(STRINGS):
+        msg = check2.Str(in_str=x, add_info="[t]", no_log=True).check(**kwargs)
+        if msg:
+            expect[i] = msg
+    assert res and dict(res) == expect
+
+
+def test_check_many_all_pass():
+    assert check2.Str.check_many(["S1", "s-2.a"], no_log=True) == 0
+
+
+def test_chinese_mask():
+    strings = ["abc", "样本1", "a㐀b", "a龥b", "ｘ", "x中y文", "", 7]  # 㐀不在CJK_PATTERN范围内
+    mask, hits = check2.Str.chinese_mask(strings)
+    assert mask.tolist() == [False, True, False, True, False, True, False, False]
+    assert dict(hits) == {1: ["样", "本"], 3: ["龥"], 5: ["中", "文"]}
+    for i, x in enumerate(strings):  # 与逐个Str.chinese一致
+        assert bool(check2.Str(in_str=str(x), no_log=True).chinese()) == mask[i]
+    mask, hits = check2.Str.chinese_mask("中")
+    assert mask.tolist() == [True] and dict(hits) == {0: ["中"]}